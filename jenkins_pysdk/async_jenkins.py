@@ -0,0 +1,2081 @@
+import re
+import json
+import time
+import asyncio
+from pathlib import Path
+from urllib.parse import quote
+from typing import (
+    List,
+    Dict,
+    Union,
+    Optional,
+    BinaryIO,
+    AsyncGenerator,
+    AsyncIterator,
+    Tuple,
+    Callable,
+    Any,
+    Iterable,
+    Pattern
+)
+
+from jenkins_pysdk.core import AsyncCore
+from jenkins_pysdk.consts import (
+    Endpoints,
+    Class,
+    FORM_HEADER_DEFAULT,
+    XML_HEADER_DEFAULT,
+    XML_POST_HEADER,
+    HTTP_POOL_MAX_CONNECTIONS,
+    HTTP_POOL_MAX_KEEPALIVE,
+    HTTP_POOL_KEEPALIVE_EXPIRY,
+    HTTP_DOWNLOAD_CHUNK_SIZE
+)
+from jenkins_pysdk.exceptions import (
+    JenkinsConnectionException,
+    JenkinsUnauthorisedException,
+    JenkinsRestartFailed,
+    JenkinsActionFailed,
+    JenkinsGeneralException,
+    JenkinsNotFound,
+    JenkinsQueueItemCancelled
+)
+from jenkins_pysdk.metrics import Metrics
+from jenkins_pysdk.retry import RetryPolicy
+from jenkins_pysdk.limiter import AdaptiveLimiter
+from jenkins_pysdk.cache import ResponseCache
+from jenkins_pysdk.validators import ValidatorStore
+from jenkins_pysdk.coalesce import SingleFlight
+from jenkins_pysdk.objects import JenkinsConnectObject, JenkinsActionObject
+from jenkins_pysdk.builds import Builds, ConsoleFollower, ConsoleMatch, _ConsoleScanner, _console_tail
+from jenkins_pysdk.queues import QueueItem, QueueSnapshot, QueueEvent, _diff_queue
+from jenkins_pysdk.plugins import Plugin, Installed
+from jenkins_pysdk.nodes import Nodes
+
+__all__ = ["AsyncJenkins", "AsyncJobs", "AsyncJob", "AsyncBuilds", "AsyncBuild", "AsyncBuildHandle", "AsyncConsoleFollower",
+           "AsyncQueue", "AsyncQueueItem", "AsyncNodes", "AsyncNode", "AsyncPlugins", "AsyncPluginGroup", "AsyncPlugin",
+           "AsyncInstalled"]
+
+
+class AsyncBuild:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.builds.Build`.
+
+    :param jenkins: The AsyncJenkins instance associated with the build.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    :param build_url: The URL of the build.
+    :type build_url: str
+    :param raw: The build information already fetched from Jenkins.
+    :type raw: dict
+    """
+    def __init__(self, jenkins, build_url: str, raw: dict):
+        self._jenkins = jenkins
+        self._build_url = build_url
+        self._raw = raw
+
+    async def refresh(self) -> "AsyncBuild":
+        """
+        Re-fetch the build information, e.g. to check whether a running build is done.
+
+        :return: The refreshed build.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncBuild`
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._build_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url)
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get build information.")
+
+        self._raw = json.loads(resp_obj.content)
+
+        return self
+
+    async def _hydrate(self) -> "AsyncBuild":
+        # Queue items only know the build's number and URL, properties are sync so fetch the rest up front
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._build_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Fields})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get build information.")
+
+        self._raw = {**self._raw, **json.loads(resp_obj.content)}
+
+        return self
+
+    @property
+    def number(self) -> int:
+        """
+        Get the build number.
+
+        :return: The build number.
+        :rtype: int
+        """
+        return int(self._raw['number'])
+
+    @property
+    def timestamp(self) -> int:
+        """
+        Get the build timestamp.
+
+        :return: The build timestamp.
+        :rtype: int
+        """
+        return int(self._raw['timestamp'])
+
+    @property
+    def description(self) -> str:
+        """
+        Get the build description.
+
+        :return: The build description.
+        :rtype: str
+        """
+        return str(self._raw['description'])
+
+    @property
+    def url(self) -> str:
+        """
+        Get the URL of the build.
+
+        :return: The URL of the build.
+        :rtype: str
+        """
+        return str(self._build_url)
+
+    @property
+    def result(self) -> str:
+        """
+        Get the result of the build.
+
+        :return: The result of the build.
+        :rtype: str
+        """
+        return str(self._raw['result'])
+
+    @property
+    def duration(self) -> int:
+        """
+        Get the duration of the build.
+
+        :return: The duration of the build in milliseconds.
+        :rtype: int
+        """
+        return int(self._raw['duration'])
+
+    @property
+    def done(self) -> bool:
+        """
+        Check if the build had completed when it was last fetched.
+
+        :return: True if the build has completed, False otherwise.
+        :rtype: bool
+        """
+        if self._raw.get('inProgress') is not None:
+            return not bool(self._raw['inProgress'])
+
+        return not bool(self._raw['building'])
+
+    def console(self, **kws) -> Union[asyncio.Future, AsyncGenerator[bytes, None]]:
+        """
+        Retrieve the console output of the build.
+
+        Await the result for the full output, or iterate it with ``async for`` when ``progressive`` or ``html`` is set.
+        Use :meth:`follow` to read the progressive output line by line.
+
+        :param kws: Keyword arguments.
+                    - progressive (bool, optional): Whether to retrieve progressive console output.
+                    - html (bool, optional): Whether to retrieve HTML-formatted console output.
+                    - interval (float, optional): Most seconds between two polls of the progressive output, while the build is quiet (default 10).
+                    - _start (int, optional): Console output bytes offset (Only works with progressive/HTML - use with caution, as you may lose output).
+        :return: The console output of the build.
+        :rtype: Awaitable[str] or AsyncGenerator[bytes, None]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        progressive = kws.get('progressive', False)
+        html = kws.get('html', False)
+        interval = kws.get('interval', 10)
+        _start = kws.get('_start', 0)
+
+        if progressive and html:
+            raise JenkinsGeneralException("You cannot use progressive and HTML together.")
+
+        if not progressive and not html:
+            return self._get_full_console_output()
+
+        return self._get_progressive_console_output(html, _start, interval)
+
+    async def _get_full_console_output(self) -> str:
+        url = self._jenkins._build_url(Endpoints.Builds.BuildConsoleText, prefix=self._build_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url)
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+        return resp_obj.text
+
+    async def download_console(self, path: Union[str, Path, BinaryIO], *,
+                               chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE,
+                               progress: Callable[[int, Optional[int]], Any] = None,
+                               resume: bool = False) -> JenkinsActionObject:
+        """
+        Stream the console output of the build to a file, without holding it in memory.
+        See :meth:`jenkins_pysdk.builds.Build.download_console`.
+        """
+        url = self._jenkins._build_url(Endpoints.Builds.BuildConsoleText, prefix=self._build_url)
+        req_obj, resp_obj, size = await self._jenkins._download(url=url, destination=path, chunk_size=chunk_size,
+                                                                progress=progress, resume=resume)
+
+        if resp_obj.status_code not in (200, 206) and not (resume and resp_obj.status_code == 416):
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+        msg = f"[{resp_obj.status_code}] Successfully downloaded {size} bytes of build logs."
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+        obj._raw = resp_obj
+
+        return obj
+
+    async def _get_progressive_console_output(self, html: bool, _start: int,
+                                              interval: float) -> AsyncGenerator[bytes, None]:
+        async for chunk, offset in self._poll_progressive_console(html, _start, max_interval=interval):
+            yield chunk
+
+    async def _poll_progressive_console(self, html: bool, start: int, min_interval: float = 0.5,
+                                        max_interval: float = 10) -> AsyncGenerator[Tuple[bytes, int], None]:
+        endpoint = Endpoints.Builds.ProgressiveHtml if html else Endpoints.Builds.ProgressiveConsoleText
+        url = self._jenkins._build_url(endpoint, prefix=self._build_url)
+        interval = min(min_interval, max_interval)
+
+        while True:
+            req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"start": start})
+
+            if resp_obj.status_code != 200:
+                raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+            try:
+                offset = int(resp_obj.headers['X-Text-Size'])
+            except (KeyError, ValueError):
+                return
+
+            # X-Text-Size is the offset to resume from, not the size of this chunk
+            if offset > start:
+                yield resp_obj.content, offset
+                interval = max(interval / 2, min_interval)
+            else:
+                interval = min(interval * 2, max_interval)
+            start = offset
+
+            if resp_obj.headers.get('X-More-Data', "").lower() != "true":
+                return
+
+            await asyncio.sleep(interval)
+
+    def follow(self, start: int = 0, *, min_interval: float = 0.5,
+               max_interval: float = 10) -> "AsyncConsoleFollower":
+        """
+        Follow the console output of the build line by line with ``async for``, until the build finishes.
+        See :meth:`jenkins_pysdk.builds.Build.follow`.
+        """
+        return AsyncConsoleFollower(self._poll_progressive_console(False, start, min_interval, max_interval), start)
+
+    async def console_tail(self, lines: int = None, *, bytes: int = None) -> str:
+        """
+        Retrieve the end of the console output of the build, without downloading the rest of it.
+        See :meth:`jenkins_pysdk.builds.Build.console_tail`.
+        """
+        if (lines is None) == (bytes is None):
+            raise ValueError("Give either lines or bytes.")
+        count = bytes if lines is None else lines
+        if count < 0:
+            raise ValueError("The tail size can't be negative.")
+
+        url = self._jenkins._build_url(Endpoints.Builds.ProgressiveConsoleText, prefix=self._build_url)
+        req_obj, resp_obj = await self._jenkins._send_http(method="HEAD", url=url)
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+        try:
+            size = int(resp_obj.headers['X-Text-Size'])
+        except (KeyError, ValueError):
+            raise JenkinsGeneralException("Jenkins didn't return the size of the build logs.") from None
+
+        window = count if lines is None else max(count * 128, HTTP_DOWNLOAD_CHUNK_SIZE // 16)
+
+        while True:
+            start = max(size - window, 0)
+            req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"start": start})
+
+            if resp_obj.status_code != 200:
+                raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+            try:
+                size = int(resp_obj.headers['X-Text-Size'])
+            except (KeyError, ValueError):
+                size = start + len(resp_obj.content)
+
+            tail = _console_tail(resp_obj.content, start == 0, lines, bytes)
+            if tail is not None:
+                return tail
+
+            window *= 4
+
+    async def search_console(self, patterns: Union[str, Pattern, Iterable[Union[str, Pattern]]], context: int = 0,
+                             max_matches: int = None, *, flags: int = 0,
+                             chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE) -> List[ConsoleMatch]:
+        """
+        Search the console output of the build line by line, while it downloads.
+        See :meth:`jenkins_pysdk.builds.Build.search_console`.
+        """
+        scanner = _ConsoleScanner(patterns, context, max_matches, flags)
+        url = self._jenkins._build_url(Endpoints.Builds.BuildConsoleText, prefix=self._build_url)
+
+        async with self._jenkins._stream(url=url) as (req_obj, resp_obj):
+            if resp_obj.status_code != 200:
+                raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+            async for chunk in resp_obj.aiter_bytes(chunk_size):
+                scanner.feed(chunk)
+                if scanner.done:
+                    return scanner.matches
+
+        return scanner.close()
+
+    async def delete(self) -> JenkinsActionObject:
+        """
+        Delete the build.
+
+        :return: Result of the delete request.
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        """
+        url = self._jenkins._build_url(Endpoints.Builds.Delete, prefix=self._build_url)
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url)
+        msg = f"[{resp_obj.status_code}] Successfully deleted build ({self.number})."
+
+        if resp_obj.status_code != 200:
+            msg = f"[{resp_obj.status_code}] Failed to delete build ({self.number})."
+
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+
+        return obj
+
+
+class AsyncConsoleFollower(ConsoleFollower):
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.builds.ConsoleFollower`, iterated with ``async for``.
+    """
+    def __iter__(self):
+        raise TypeError(f"Use 'async for' with {self.__class__.__name__}.")
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        async for chunk, end in self._chunks:
+            for line, offset in self._feed(chunk, end):
+                self.offset = offset
+                yield line
+
+        for line, offset in self._flush():
+            self.offset = offset
+            yield line
+
+    async def close(self) -> None:
+        """
+        Stop polling Jenkins.
+        """
+        await self._chunks.aclose()
+
+
+class AsyncBuildHandle:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.builds.BuildHandle`, returned by
+    :meth:`jenkins_pysdk.async_jenkins.AsyncBuilds.build`.
+
+    Await the handle for the finished :class:`jenkins_pysdk.async_jenkins.AsyncBuild`. Jenkins isn't polled until
+    the handle is awaited or :attr:`build`, :meth:`wait`, :meth:`result` or :meth:`add_done_callback` is used, a
+    task then polls the queue item, then the build. The ``request``, ``response``, ``content`` and ``status_code`` of
+    the trigger request are kept as well.
+
+    :param jenkins: The AsyncJenkins instance the build was triggered on.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    :param queue_url: The URL of the queue item Jenkins created.
+    :type queue_url: str
+    :param min_interval: (Default: 0.5) Fewest seconds to wait between polls.
+    :type min_interval: float, optional
+    :param max_interval: (Default: 30) Most seconds to wait between polls.
+    :type max_interval: float, optional
+    """
+    def __init__(self, jenkins, queue_url: str, *, request: Any = None, response: Any = None,
+                 content: Any = None, status_code: int = None, min_interval: float = 0.5, max_interval: float = 30):
+        self._jenkins = jenkins
+        self._queue_url = queue_url
+        self._build = None
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self.request = request
+        self.response = response
+        self.content = content
+        self.status_code = status_code
+        self._task = None
+
+    def __repr__(self):
+        state = "done" if self.done() else "running" if self._build is not None else "queued"
+        return f"<{self.__class__.__name__} {self._queue_url} {state}>"
+
+    def __await__(self):
+        return asyncio.shield(self._start()).__await__()
+
+    def _start(self) -> asyncio.Future:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._poll())
+
+        return self._task
+
+    @property
+    def queue_url(self) -> str:
+        """
+        The URL of the queue item Jenkins created for the build.
+        """
+        return self._queue_url
+
+    @property
+    def queue_id(self) -> int:
+        """
+        The ID of the queue item Jenkins created for the build.
+        """
+        return int(str(self._queue_url).rstrip("/").rsplit("/", 1)[-1])
+
+    @property
+    def build(self) -> Optional[AsyncBuild]:
+        """
+        The build, once Jenkins started it, or None if it is still queued.
+        """
+        task = self._start()
+        if self._build is None and task.done():
+            return task.result()  # Raises why the build never started
+
+        return self._build
+
+    def done(self) -> bool:
+        """
+        Check if the build has finished, or failed to start.
+        """
+        return self._task is not None and self._task.done()
+
+    def add_done_callback(self, callback: Callable[["AsyncBuildHandle"], Any]) -> None:
+        """
+        Call ``callback(handle)`` once the build has finished, or failed to start.
+        """
+        self._start().add_done_callback(lambda task: callback(self))
+
+    async def wait(self, timeout: float = None) -> bool:
+        """
+        Wait until the build has finished.
+
+        :param timeout: (Optional) Seconds to wait, waits forever by default.
+        :type timeout: float, optional
+        :return: True if the build finished (or failed to start), False if the timeout expired.
+        :rtype: bool
+        """
+        task = self._start()
+        await asyncio.wait({task}, timeout=timeout)
+
+        return task.done()
+
+    async def result(self, timeout: float = None) -> AsyncBuild:
+        """
+        Wait until the build has finished and return it.
+
+        :raises JenkinsQueueItemCancelled: If the queue item was cancelled in Jenkins.
+        :raises CancelledError: If the handle was cancelled.
+        :raises TimeoutError: If the build didn't finish within the timeout.
+        """
+        return await asyncio.wait_for(asyncio.shield(self._start()), timeout)
+
+    async def cancel(self) -> bool:
+        """
+        Cancel the queue item, if the build hasn't started yet.
+
+        :return: True if the queue item was cancelled.
+        :rtype: bool
+        """
+        if self.done() or self._build is not None:
+            return self._task.cancelled()
+
+        url = self._jenkins._build_url(Endpoints.Queue.Cancel)
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url, params={"id": self.queue_id})
+
+        if resp_obj.status_code not in (200, 204, 302) or self._build is not None:
+            return False
+
+        if self._task is None:
+            # Never polled, a cancelled future stands in for the task
+            self._task = asyncio.get_running_loop().create_future()
+
+        return self._task.cancel()
+
+    async def _poll(self) -> AsyncBuild:
+        interval = self._min_interval
+        item = AsyncQueueItem(self._jenkins, {"id": self.queue_id})
+
+        while self._build is None:
+            state = await item._get_state()
+            if state.get('executable'):
+                executable = state['executable']
+                self._build = await AsyncBuild(self._jenkins, executable['url'], executable)._hydrate()
+            elif state.get('cancelled'):
+                raise JenkinsQueueItemCancelled(f"Queue item ({self.queue_id}) was cancelled.")
+            else:
+                await asyncio.sleep(interval)
+                interval = min(interval * 1.5, self._max_interval)
+
+        interval = self._min_interval
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._build.url)
+        while True:
+            req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Progress})
+
+            if resp_obj.status_code != 200:
+                raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get build information.")
+
+            data = json.loads(resp_obj.content)
+            self._build._raw = {**self._build._raw, **data}
+            if self._build.done:
+                return self._build
+
+            # Wait for half of the estimated time left, then back off once the estimate is exceeded
+            remaining = (int(data.get('timestamp', 0)) + int(data.get('estimatedDuration', -1))) / 1000 - time.time()
+            if remaining > 0:
+                await asyncio.sleep(min(max(remaining / 2, self._min_interval), self._max_interval))
+            else:
+                await asyncio.sleep(interval)
+                interval = min(interval * 1.5, self._max_interval)
+
+
+class AsyncBuilds:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.builds.Builds`.
+
+    :param jenkins: The AsyncJenkins instance.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    :param job_url: The URL of the job.
+    :type job_url: str
+    """
+    _specific = ("lastStableBuild", "lastSuccessfulBuild", "lastFailedBuild",
+                 "lastUnsuccessfulBuild", "lastCompletedBuild", "lastBuild")
+
+    def __init__(self, jenkins, job_url: str):
+        self._jenkins = jenkins
+        self._job_url = job_url
+
+    async def _fetch(self, endpoint: str) -> AsyncBuild:
+        url = self._jenkins._build_url(endpoint, prefix=self._job_url, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Fields})
+
+        if resp_obj.status_code == 404:
+            raise JenkinsNotFound(f"[{resp_obj.status_code}] Build ({endpoint}) was not found.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build ({endpoint}).")
+
+        data = json.loads(resp_obj.content)
+        data = self._jenkins._validate_url_returned_from_instance(data)
+
+        return AsyncBuild(self._jenkins, data['url'], data)
+
+    async def search(self, build_number: int = False, **kws) -> AsyncBuild:
+        """
+        Fetches a specific build from the build history of the job.
+
+        :param build_number: The number of the build to fetch.
+        :type build_number: int
+        :param kws: One of lastStableBuild, lastSuccessfulBuild, lastFailedBuild, lastUnsuccessfulBuild,
+                    lastCompletedBuild set to True.
+        :type kws: dict
+        :return: The requested build.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncBuild`
+        :raises JenkinsNotFound: If the build was not found.
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        if kws:
+            for name in self._specific:
+                if kws.get(name):
+                    return await self._fetch(name)
+
+            raise JenkinsGeneralException(f"Unknown values - {kws}")
+
+        return await self._fetch(str(int(build_number)))
+
+    @property
+    async def latest(self) -> AsyncBuild:
+        """
+        Retrieve the last build in the build history of the job.
+
+        :return: The last build.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncBuild`
+        :raises JenkinsNotFound: If the job has no builds.
+        """
+        return await self._fetch(Endpoints.Builds.lastBuild)
+
+    async def _get_builds(self) -> List[dict]:
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._job_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Iter})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch job information.")
+
+        data = json.loads(resp_obj.content)
+        data = self._jenkins._validate_url_returned_from_instance(data)
+
+        return data.get('builds', [])
+
+    @property
+    async def total(self) -> int:
+        """
+        Get the total number of saved builds for the job.
+
+        :return: The total number of saved builds.
+        :rtype: int
+        """
+        return len(await self._get_builds())
+
+    async def iter(self) -> AsyncGenerator[AsyncBuild, None]:
+        """
+        Iterate over builds in the build history of the job. The whole history is read with a single request.
+
+        :yield: Each build in the build history.
+        :rtype: AsyncGenerator[:class:`jenkins_pysdk.async_jenkins.AsyncBuild`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        for build in await self._get_builds():
+            yield AsyncBuild(self._jenkins, build['url'], build)
+
+    async def list(self) -> List[AsyncBuild]:
+        """
+        Get a list of all builds in the build history of the job.
+
+        :return: A list of builds.
+        :rtype: List[:class:`jenkins_pysdk.async_jenkins.AsyncBuild`]
+        """
+        return [build async for build in self.iter()]
+
+    async def _history_page(self, start: int, end: int) -> List[dict]:
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._job_url)
+        tree = Endpoints.Builds.History.format(start=start, end=end)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": tree})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build history.")
+
+        data = json.loads(resp_obj.content)
+        data = self._jenkins._validate_url_returned_from_instance(data)
+
+        return data.get('allBuilds', [])
+
+    async def get_many(self, build_numbers: List[int]) -> List[AsyncBuild]:
+        """
+        Fetch several builds from the build history of the job at once.
+        See :meth:`jenkins_pysdk.builds.Builds.get_many`.
+
+        :param build_numbers: The numbers of the builds to fetch.
+        :type build_numbers: List[int]
+        :return: The builds, in the order of the numbers given.
+        :rtype: List[:class:`jenkins_pysdk.async_jenkins.AsyncBuild`]
+        :raises JenkinsNotFound: If any of the builds was not found.
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        numbers = [int(number) for number in build_numbers]
+        if not numbers:
+            return []
+
+        newest = await self._next_build_number() - 1
+        depth = min(newest - min(numbers) + 1, len(set(numbers)) * Builds._range_span)
+        found = dict()
+        if depth > 0:
+            page = await self._history_page(0, depth)
+            found = {int(build['number']): build for build in page}
+
+        # Builds too old for the range request are fetched directly
+        older = [number for number in sorted(set(numbers) - found.keys()) if not newest - depth < number <= newest]
+        fetched = await asyncio.gather(*(self._fetch(str(number)) for number in older), return_exceptions=True)
+        for number, build in zip(older, fetched):
+            if isinstance(build, AsyncBuild):
+                found[number] = build._raw
+            elif not isinstance(build, JenkinsNotFound):
+                raise build
+
+        missing = sorted(set(numbers) - found.keys())
+        if missing:
+            raise JenkinsNotFound(f"Builds ({', '.join(map(str, missing))}) were not found.")
+
+        return [AsyncBuild(self._jenkins, found[number]['url'], found[number]) for number in numbers]
+
+    async def history(self, page_size: int = 100, *, cursor: int = None, stop_number: int = None,
+                      stop_timestamp: int = None) -> AsyncGenerator[AsyncBuild, None]:
+        """
+        Iterate over the whole build history of the job, newest first, one page at a time.
+        See :meth:`jenkins_pysdk.builds.Builds.history`.
+
+        :param page_size: (Default: 100) Number of builds fetched per request.
+        :type page_size: int, optional
+        :param cursor: (Optional) Only yield builds older than this build number.
+        :type cursor: int, optional
+        :param stop_number: (Optional) Stop before the build with this number, or the first older one.
+        :type stop_number: int, optional
+        :param stop_timestamp: (Optional) Stop at the first build started before this timestamp (in milliseconds).
+        :type stop_timestamp: int, optional
+        :yield: Each build in the build history.
+        :rtype: AsyncGenerator[:class:`jenkins_pysdk.async_jenkins.AsyncBuild`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        if page_size < 1:
+            raise JenkinsGeneralException(f"Page size must be at least 1, not {page_size}.")
+
+        start, page = 0, None
+        if cursor is not None:
+            start, page = await self._history_cursor(cursor, page_size)
+
+        while True:
+            if page is None:
+                page = await self._history_page(start, start + page_size)
+
+            for build in page:
+                number = int(build['number'])
+                if cursor is not None and number >= cursor:
+                    continue
+                if stop_number is not None and number <= stop_number:
+                    return
+                if stop_timestamp is not None and int(build['timestamp']) < stop_timestamp:
+                    return
+
+                yield AsyncBuild(self._jenkins, build['url'], build)
+
+            if len(page) < page_size:
+                return
+            start, page = start + page_size, None
+
+    async def _next_build_number(self) -> int:
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._job_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.NextNumber})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch job information.")
+
+        return int(json.loads(resp_obj.content).get('nextBuildNumber', 1))
+
+    async def _history_cursor(self, cursor: int, page_size: int) -> Tuple[int, List[dict]]:
+        # See Builds._history_cursor
+        low, high = 0, max(await self._next_build_number() - cursor, 0)
+        start = max(high - 1, 0)
+
+        while True:
+            page = await self._history_page(start, start + page_size)
+            if page and int(page[0]['number']) >= cursor:
+                if len(page) < page_size or int(page[-1]['number']) < cursor:
+                    return start, page
+                low = start + page_size
+                high = max(high, low)
+            elif start == low:
+                return start, page
+            else:
+                high = start
+
+            start = (low + high) // 2
+
+    async def build(self, parameters: Optional[dict] = None, delay: int = 0) -> AsyncBuildHandle:
+        """
+        Trigger a new build for the job with optional parameters.
+
+        :param parameters: (Optional) parameters to be passed to the build.
+        :type parameters: dict, optional
+        :param delay: (Default: 0) Delay the build by X seconds
+        :type delay: int
+        :return: Handle on the triggered build, await it for the finished build.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncBuildHandle`
+        :raises JenkinsGeneralException: If the build wasn't triggered, or Jenkins didn't return its queue item.
+        """
+        params = {"delay": f"{delay}sec"}
+        endpoint = Endpoints.Builds.buildWithParameters if parameters else Endpoints.Builds.Build
+        url = self._jenkins._build_url(endpoint, prefix=self._job_url)
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url, headers=FORM_HEADER_DEFAULT,
+                                                           params=params, data=parameters)
+
+        if resp_obj.status_code not in [200, 201]:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to trigger a new build.")
+
+        queue_url = resp_obj.headers.get("Location")
+        if queue_url is None:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Jenkins didn't return the queue item of the "
+                                          f"new build.")
+        queue_url = self._jenkins._validate_url_returned_from_instance({"url": queue_url})['url']
+
+        msg = f"[{resp_obj.status_code}] Successfully triggered a new build."
+        obj = AsyncBuildHandle(self._jenkins, queue_url, request=req_obj, response=resp_obj, content=msg,
+                               status_code=resp_obj.status_code)
+
+        return obj
+
+
+class AsyncJob:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.jobs.Job`.
+
+    :param jenkins: The AsyncJenkins instance associated with the job.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    :param job_path: The path of the job.
+    :type job_path: str
+    :param job_url: The URL of the job.
+    :type job_url: str
+    """
+    def __init__(self, *, jenkins, job_path: str, job_url: str):
+        self._jenkins = jenkins
+        self._job_path = job_path
+        self._job_url = job_url
+
+    @property
+    def url(self) -> str:
+        """
+        Get the URL of the job.
+
+        :return: The URL of the job.
+        :rtype: str
+        """
+        return str(self._job_url)
+
+    @property
+    def path(self) -> str:
+        """
+        Get the path of the job.
+
+        :return: The path of the job.
+        :rtype: str
+        """
+        return self._job_path
+
+    @property
+    def builds(self) -> AsyncBuilds:
+        """
+        Access the builds associated with this job.
+
+        :return: Builds associated with this job.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncBuilds`
+        """
+        return AsyncBuilds(self._jenkins, self._job_url)
+
+    @property
+    async def config(self) -> str:
+        """
+        Get the XML configuration of the job.
+
+        :return: The XML configuration of the job.
+        :rtype: str
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Jobs.Xml, prefix=self._job_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, headers=XML_HEADER_DEFAULT)
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to download job XML.")
+
+        return resp_obj.text
+
+
+class AsyncJobs:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.jobs.Jobs`.
+
+    :param jenkins: The AsyncJenkins instance.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    """
+    def __init__(self, jenkins):
+        self._jenkins = jenkins
+
+    async def search(self, job_path: str) -> AsyncJob:
+        """
+        Search for a job within Jenkins.
+
+        :param job_path: The path of the job to search for.
+        :type job_path: str
+        :return: The job object.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncJob`
+        :raises JenkinsNotFound: If the job wasn't found.
+        :raises JenkinsGeneralException: If the path is a folder or a general exception occurs.
+        """
+        built = self._jenkins._build_job_http_path(job_path)
+        url = self._jenkins._build_url(built, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": "fullName,url"})
+
+        if resp_obj.status_code >= 500:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Server error.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsNotFound(f"Could not retrieve {job_path} because it doesn't exist.")
+
+        data = json.loads(resp_obj.content)
+        data = self._jenkins._validate_url_returned_from_instance(data)
+
+        if data['_class'] in [Class.Folder, Class.OrganizationFolder]:
+            raise JenkinsGeneralException(f"{job_path} is a folder. Please use folders.")
+
+        return AsyncJob(jenkins=self._jenkins, job_path=job_path, job_url=data['url'])
+
+    async def iter(self, folder: str = None) -> AsyncGenerator[AsyncJob, None]:
+        """
+        Iterate through jobs in the Jenkins instance.
+
+        Folders are walked concurrently, with at most ``AsyncJenkins.concurrency`` requests in flight,
+        so jobs are yielded in the order they are discovered.
+
+        :param folder: The folder to iterate through. If None, iterate through all jobs.
+        :type folder: str, optional
+        :return: Async generator yielding jobs.
+        :rtype: AsyncGenerator[:class:`jenkins_pysdk.async_jenkins.AsyncJob`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        if folder:
+            path = self._jenkins._build_job_http_path(folder)
+            url = self._jenkins._build_url(path.lstrip("/") + "/")
+        else:
+            url = self._jenkins._build_url("")
+
+        found = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self._jenkins.concurrency)
+        finished = object()
+
+        walker = asyncio.ensure_future(self._walk(url, semaphore, found))
+        walker.add_done_callback(lambda _: found.put_nowait(finished))
+
+        try:
+            while True:
+                job = await found.get()
+                if job is finished:
+                    break
+                yield job
+
+            await walker  # Surface errors raised while walking
+        finally:
+            if not walker.done():
+                walker.cancel()
+
+    async def _walk(self, folder_url: str, semaphore: asyncio.Semaphore, found: asyncio.Queue):
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=folder_url)
+
+        async with semaphore:
+            req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Jobs.Children})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get job information.")
+
+        data = json.loads(resp_obj.content)
+        data = self._jenkins._validate_url_returned_from_instance(data)
+
+        sub_folders = []
+        for item in data.get('jobs', []):
+            # Only items holding other items have jobs, e.g. folders, organisation folders and multibranch projects
+            if 'jobs' not in item:
+                await found.put(AsyncJob(jenkins=self._jenkins, job_path=item['fullName'], job_url=item['url']))
+            elif item['jobs']:
+                sub_folders.append(asyncio.ensure_future(self._walk(item['url'], semaphore, found)))
+
+        try:
+            await asyncio.gather(*sub_folders)
+        except BaseException:
+            for task in sub_folders:
+                task.cancel()
+            raise
+
+    async def list(self, folder: str = None) -> List[AsyncJob]:
+        """
+        Retrieve a list of jobs from Jenkins.
+
+        :param folder: (Optional) The folder from which to retrieve jobs.
+        :type folder: str or None
+        :return: A list of jobs.
+        :rtype: List[:class:`jenkins_pysdk.async_jenkins.AsyncJob`]
+        """
+        return [job async for job in self.iter(folder=folder)]
+
+
+class AsyncQueueItem(QueueItem):
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.queues.QueueItem`.
+
+    :param jenkins: The AsyncJenkins instance.
+    :type jenkins: :class:`jenkins_pysdk.async_jenkins.AsyncJenkins`
+    :param queue_info: Information about the queue item.
+    :type queue_info: dict
+    """
+    @property
+    async def build(self) -> AsyncBuild:
+        """
+        Returns the build associated with the queue item.
+
+        :return: The build associated with the queue item.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncBuild`
+        """
+        try:
+            executable = (await self._get_state()).get('executable')
+        except (JenkinsNotFound, JenkinsGeneralException):
+            executable = None
+        if executable:
+            return await AsyncBuild(self._jenkins, executable['url'], executable)._hydrate()
+
+        return await self.job.builds.search(self.number)
+
+    async def _get_state(self) -> dict:
+        url = self._jenkins._build_url(Endpoints.Queue.Item.format(id=self.id), suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.ItemState})
+
+        if resp_obj.status_code == 404:
+            raise JenkinsNotFound(f"Queue item ({self.id}) was not found.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get queue item ({self.id}).")
+
+        data = json.loads(resp_obj.content)
+
+        return self._jenkins._validate_url_returned_from_instance(data)
+
+    async def wait_for_build(self, timeout: float = None, interval: float = 0.5,
+                             max_interval: float = 5) -> AsyncBuild:
+        """
+        Wait until the queue item starts its build, and return that build.
+        See :meth:`jenkins_pysdk.queues.QueueItem.wait_for_build`.
+
+        :param timeout: (Optional) Seconds to wait before giving up, waits forever by default.
+        :type timeout: float, optional
+        :param interval: (Default: 0.5) Seconds to wait after the first poll.
+        :type interval: float, optional
+        :param max_interval: (Default: 5) Most seconds to wait between polls.
+        :type max_interval: float, optional
+        :return: The build started for the queue item.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncBuild`
+        :raises JenkinsQueueItemCancelled: If the queue item was cancelled.
+        :raises JenkinsNotFound: If Jenkins no longer knows about the queue item.
+        :raises TimeoutError: If the build didn't start within the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            state = await self._get_state()
+            if state.get('executable'):
+                return await AsyncBuild(self._jenkins, state['executable']['url'], state['executable'])._hydrate()
+            if state.get('cancelled'):
+                raise JenkinsQueueItemCancelled(f"Queue item ({self.id}) was cancelled.")
+
+            delay = interval
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"Queue item ({self.id}) didn't start a build within {timeout}s.")
+                delay = min(delay, remaining)
+
+            await asyncio.sleep(delay)
+            interval = min(interval * 1.5, max_interval)
+
+    @property
+    def job(self) -> AsyncJob:
+        """
+        Returns the job associated with the queue item.
+
+        :return: The job associated with the queue item.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncJob`
+        """
+        return AsyncJob(jenkins=self._jenkins,
+                        job_path=self._queue_info['task']['fullName'],
+                        job_url=self._queue_info['task']['url'])
+
+
+class AsyncQueue:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.queues.Queue`.
+
+    :param jenkins: The AsyncJenkins instance.
+    :type jenkins: :class:`jenkins_pysdk.async_jenkins.AsyncJenkins`
+    """
+    def __init__(self, jenkins):
+        self._jenkins = jenkins
+
+    async def iter(self, _paginate=0) -> AsyncGenerator[AsyncQueueItem, None]:
+        """
+        Iterates over the items in the Jenkins queue.
+
+        :param _paginate: The number of items to fetch per page (default is 0, meaning all items).
+        :type _paginate: int
+        :return: An async generator yielding the items in the queue.
+        :rtype: AsyncGenerator[:class:`jenkins_pysdk.async_jenkins.AsyncQueueItem`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        start = 0
+        url = self._jenkins._build_url(Endpoints.Queue.Queue, suffix=Endpoints.Instance.Standard)
+
+        while True:
+            limit = _paginate + start
+            paginate = f"{{{start},{limit if limit > 0 else ''}}}"
+            params = {"tree": Endpoints.Queue.QueueIter.format(paginate=paginate)}
+            req_obj, resp_obj = await self._jenkins._send_http(url=url, params=params)
+
+            if resp_obj.status_code > 200 and start > 0:
+                break  # Pagination finished, Jenkins doesn't return a nice response
+            elif resp_obj.status_code != 200:
+                raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get queue information.")
+
+            data = json.loads(resp_obj.content)
+            data = self._jenkins._validate_url_returned_from_instance(data)
+
+            for item in data.get('items', []):
+                yield AsyncQueueItem(self._jenkins, item)
+
+            if _paginate > 0:
+                start += _paginate + 1
+            elif _paginate == 0:
+                break
+
+    async def list(self, _paginate=0) -> List[AsyncQueueItem]:
+        """
+        Lists items in the Jenkins queue.
+
+        :param _paginate: The number of items to fetch per page (default is 0, meaning all items).
+        :type _paginate: int
+        :return: A list of the items in the queue.
+        :rtype: List[:class:`jenkins_pysdk.async_jenkins.AsyncQueueItem`]
+        """
+        return [item async for item in self.iter(_paginate=_paginate)]
+
+    async def _watch_items(self) -> List[dict]:
+        url = self._jenkins._build_url(Endpoints.Queue.Queue, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.Watch})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get queue information.")
+
+        data = json.loads(resp_obj.content)
+        data = self._jenkins._validate_url_returned_from_instance(data)
+
+        return data.get('items', [])
+
+    async def _left_build(self, item_id: int) -> Optional[AsyncBuild]:
+        url = self._jenkins._build_url(Endpoints.Queue.Item.format(id=item_id), suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.ItemState})
+
+        if resp_obj.status_code != 200:
+            return None
+
+        executable = json.loads(resp_obj.content).get('executable')
+        if not executable:
+            return None
+        executable = self._jenkins._validate_url_returned_from_instance(executable)
+
+        try:
+            return await AsyncBuild(self._jenkins, executable['url'], executable)._hydrate()
+        except JenkinsGeneralException:
+            return None  # The build may be gone already, which mustn't stop the watch
+
+    async def watch(self, interval: float = 5) -> AsyncGenerator[QueueEvent, None]:
+        """
+        Poll the Jenkins queue and yield what changed between polls, forever.
+        See :meth:`jenkins_pysdk.queues.Queue.watch`.
+
+        :param interval: (Default: 5) Seconds to wait between polls.
+        :type interval: float, optional
+        :return: An async generator yielding the changes.
+        :rtype: AsyncGenerator[:class:`jenkins_pysdk.queues.QueueEvent`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        state = dict()
+
+        while True:
+            state, changes = _diff_queue(state, await self._watch_items())
+
+            for kind, item_id, item, now, previous_reason in changes:
+                build = await self._left_build(item_id) if kind == QueueEvent.LEFT else None
+                item = AsyncQueueItem(self._jenkins, item) if item is not None else None
+                yield QueueEvent(kind, item_id, now[3], item=item, build=build, reason=now[2],
+                                 previous_reason=previous_reason)
+
+            await asyncio.sleep(interval)
+
+    async def snapshot(self) -> QueueSnapshot:
+        """
+        Take a snapshot of the Jenkins queue with a single request.
+
+        :return: The queue as it was when the request was made.
+        :rtype: :class:`jenkins_pysdk.queues.QueueSnapshot`
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        return QueueSnapshot(await self.list())
+
+    @property
+    async def total(self) -> int:
+        """
+        Returns the total number of items in the Jenkins queue. Only the item IDs are fetched.
+
+        :return: The total number of items in the Jenkins queue.
+        :rtype: int
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Queue.Queue, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.Ids})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get queue information.")
+
+        return len(json.loads(resp_obj.content).get('items', []))
+
+
+class AsyncNode:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.nodes.Node`.
+
+    :param jenkins: The AsyncJenkins instance this node belongs to.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    :param name: The name of the node.
+    :type name: str
+    :param node_url: The URL of the node.
+    :type node_url: str
+    :param raw: The node information already fetched from Jenkins.
+    :type raw: dict
+    """
+    def __init__(self, jenkins, name: str, node_url: str, raw: dict):
+        self._jenkins = jenkins
+        self._name = name
+        self._node_url = node_url
+        self._raw = raw
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the node.
+
+        :return: The name of the node.
+        :rtype: str
+        """
+        return str(self._name)
+
+    @property
+    def url(self) -> str:
+        """
+        The URL of the node.
+
+        :return: The URL of the node.
+        :rtype: str
+        """
+        return str(self._node_url)
+
+    @property
+    def idle(self) -> bool:
+        """
+        Whether the node was idle when it was fetched.
+
+        :return: True if the node is idle, False otherwise.
+        :rtype: bool
+        """
+        return bool(self._raw['idle'])
+
+    @property
+    def offline(self) -> bool:
+        """
+        Whether the node was offline when it was fetched.
+
+        :return: True if the node is offline, False otherwise.
+        :rtype: bool
+        """
+        return bool(self._raw['offline'])
+
+    @property
+    def executors(self) -> int:
+        """
+        The number of executors of the node.
+
+        :return: The number of executors.
+        :rtype: int
+        """
+        return int(self._raw['numExecutors'])
+
+    @property
+    def labels(self) -> List[str]:
+        """
+        The labels assigned to the node, including its own name.
+
+        :return: The label names.
+        :rtype: List[str]
+        """
+        return [label['name'] for label in self._raw['assignedLabels']]
+
+    @property
+    async def config(self) -> str:
+        """
+        Get the configuration of the node.
+
+        :return: The configuration of the node as a string.
+        :rtype: str
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Jobs.Xml, prefix=self._node_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, headers=XML_HEADER_DEFAULT)
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to download node XML.")
+
+        return resp_obj.text
+
+    async def delete(self) -> JenkinsActionObject:
+        """
+        Delete action for the node.
+
+        :return: JenkinsActionObject representing the delete action.
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        """
+        url = self._jenkins._build_url(Endpoints.Nodes.Delete, prefix=self._node_url)
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url)
+        msg = f"[{resp_obj.status_code}] Successfully deleted node ({self.name})."
+
+        if resp_obj.status_code != 200:
+            msg = f"[{resp_obj.status_code}] Failed to delete node ({self.name})."
+
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+
+        return obj
+
+    async def disable(self, message: str) -> JenkinsActionObject:
+        """
+        Mark the node as offline.
+
+        :param message: Message explaining the reason for disabling the node.
+        :type message: str
+        :return: JenkinsActionObject representing the disable action.
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Nodes.Disable, prefix=self._node_url)
+        params = {"offlineMessage": message}
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url, params=params)
+        msg = f"[{resp_obj.status_code}] Successfully marked node ({self.name}) as offline."
+
+        if resp_obj.status_code >= 500:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Server error.")
+        elif resp_obj.status_code != 200:
+            msg = f"[{resp_obj.status_code}] Failed to mark ({self.name}) as offline."
+
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+
+        return obj
+
+    async def enable(self) -> JenkinsActionObject:
+        """
+        Mark the node as online.
+
+        :return: JenkinsActionObject representing the enable action.
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._node_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": "temporarilyOffline"})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get node ({self.name}) information.")
+
+        if bool(json.loads(resp_obj.content)['temporarilyOffline']) is False:
+            raise JenkinsGeneralException(f"Node ({self.name}) is not marked as offline.")
+
+        url = self._jenkins._build_url(Endpoints.Nodes.Disable, prefix=self._node_url)
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url)
+        msg = f"[{resp_obj.status_code}] Successfully marked node ({self.name}) as online."
+
+        if resp_obj.status_code >= 500:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Server error.")
+        elif resp_obj.status_code != 200:
+            msg = f"[{resp_obj.status_code}] Failed to mark ({self.name}) as online."
+
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+
+        return obj
+
+
+class AsyncNodes:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.nodes.Nodes`.
+
+    :param jenkins: The AsyncJenkins instance managing the nodes.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    """
+    def __init__(self, jenkins):
+        self._jenkins = jenkins
+
+    async def iter(self) -> AsyncGenerator[AsyncNode, None]:
+        """
+        Iterate over the nodes. Every node is read from a single request.
+
+        :return: An async generator yielding nodes.
+        :rtype: AsyncGenerator[:class:`jenkins_pysdk.async_jenkins.AsyncNode`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Nodes.Computer, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Nodes.Iter})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get nodes information.")
+
+        data = json.loads(resp_obj.content)
+
+        for node in data.get('computer', []):
+            name = Nodes._node_name(node)
+            yield AsyncNode(self._jenkins, name, self._node_url(name), node)
+
+    async def list(self) -> List[AsyncNode]:
+        """
+        Get a list of all nodes.
+
+        :return: A list of nodes.
+        :rtype: List[:class:`jenkins_pysdk.async_jenkins.AsyncNode`]
+        """
+        return [node async for node in self.iter()]
+
+    async def search(self, name: str) -> AsyncNode:
+        """
+        Search for a node by name.
+
+        :param name: The name of the node to search for.
+        :type name: str
+        :return: The node.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncNode`
+        :raises JenkinsNotFound: If the node with the specified name is not found.
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        name = Nodes._normalise_name(name)
+        node_url = self._node_url(name)
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=node_url)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Nodes.Fields})
+
+        if resp_obj.status_code == 404:
+            raise JenkinsNotFound(f"Node ({name}) was not found.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get node ({name}) information.")
+
+        return AsyncNode(self._jenkins, name, node_url, json.loads(resp_obj.content))
+
+    async def exists(self, names: List[str]) -> Dict[str, bool]:
+        """
+        Check which of the given nodes exist, with a single request.
+
+        :param names: The names of the nodes to check.
+        :type names: List[str]
+        :return: Whether each node exists, by name.
+        :rtype: Dict[str, bool]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Nodes.Computer, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Nodes.Names})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get nodes information.")
+
+        existing = {Nodes._node_name(node) for node in json.loads(resp_obj.content).get('computer', [])}
+
+        return {name: Nodes._normalise_name(name) in existing for name in names}
+
+    def _node_url(self, name: str) -> str:
+        url_name = "(built-in)" if name == "built-in" else quote(name, safe="")
+        return self._jenkins._build_url(Endpoints.Nodes.Node.format(name=url_name))
+
+    @property
+    async def total(self) -> int:
+        """
+        Get the total number of nodes.
+
+        :return: The total number of nodes.
+        :rtype: int
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        url = self._jenkins._build_url(Endpoints.Nodes.Computer, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": Endpoints.Nodes.Names})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get nodes information.")
+
+        return len(json.loads(resp_obj.content).get('computer', []))
+
+
+class AsyncPlugin(Plugin):
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.plugins.Plugin`.
+    """
+    @property
+    async def site(self) -> dict:
+        """
+        The update site the plugin comes from.
+
+        :return: The update site information.
+        :rtype: dict
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        site_id = str(self._plugin_info['sourceId'])
+        url = self._jenkins._build_url(Endpoints.UpdateCenter.Site.format(site=site_id),
+                                       suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"depth": 1})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"Failed to get site ({site_id}) information.")
+
+        return json.loads(resp_obj.content)
+
+
+class AsyncInstalled(Installed):
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.plugins.Installed`.
+    """
+    async def _plugin_action(self, endpoint: str, action: str) -> JenkinsActionObject:
+        url = self._jenkins._build_url(Endpoints.Plugins.PluginManager, suffix=endpoint.format(plugin=self.name))
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url)
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to {action} plugin ({self.name}).")
+
+        msg = f"[{resp_obj.status_code}] Successfully {action}d plugin ({self.name})."
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+
+        return obj
+
+    async def enable(self) -> JenkinsActionObject:
+        """
+        Enable the installed plugin.
+
+        :return: JenkinsActionObject representing the enable action.
+        :rtype: jenkins_pysdk.objects.JenkinsActionObject
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        return await self._plugin_action(Endpoints.Plugins.Enable, "enable")
+
+    async def disable(self) -> JenkinsActionObject:
+        """
+        Disable the installed plugin.
+
+        :return: JenkinsActionObject representing the disable action.
+        :rtype: jenkins_pysdk.objects.JenkinsActionObject
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        return await self._plugin_action(Endpoints.Plugins.Disable, "disable")
+
+    async def delete(self) -> JenkinsActionObject:
+        """
+        Delete the plugin from the Jenkins instance.
+
+        :return: JenkinsActionObject representing the delete action.
+        :rtype: jenkins_pysdk.objects.JenkinsActionObject
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        return await self._plugin_action(Endpoints.Plugins.Uninstall, "uninstall")
+
+
+class AsyncPluginGroup:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.plugins.PluginGroup`.
+
+    :param jenkins: The AsyncJenkins instance this plugin group belongs to.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    :param p_type: The type of the plugin group.
+    :type p_type: str
+    """
+    def __init__(self, jenkins, p_type: str):
+        self._jenkins = jenkins
+        self.type = p_type
+
+    async def search(self, id: str, site: str = "default",
+                     _paginate=500) -> Union[AsyncPlugin, AsyncInstalled]:
+        """
+        Search for a plugin or an installed plugin within the plugin group.
+
+        :param id: The ID of the plugin to search for.
+        :type id: str
+        :param site: The site to search for the plugin. Default is "default".
+        :type site: str, optional
+        :param _paginate: The number of items to paginate. Default is 500.
+        :type _paginate: int, optional
+        :return: The found plugin.
+        :rtype: Union[jenkins_pysdk.async_jenkins.AsyncPlugin, jenkins_pysdk.async_jenkins.AsyncInstalled]
+        :raises JenkinsNotFound: If the plugin with the specified name is not found.
+        """
+        async for plugin in self.iter(site=site, _paginate=_paginate):
+            if plugin.name == id:
+                return plugin
+
+        raise JenkinsNotFound(f"Plugin ({id}) was not found in {self.type}.")
+
+    async def iter(self, site: str = "default",
+                   _paginate: int = 0) -> AsyncGenerator[Union[AsyncPlugin, AsyncInstalled], None]:
+        """
+        Iterate over the plugins or installed plugins within the plugin group.
+
+        :param site: The site to iterate over. Default is "default".
+        :type site: str, optional
+        :param _paginate: The number of items to paginate. Default is 0.
+        :type _paginate: int, optional
+        :return: An async generator yielding plugins.
+        :rtype: AsyncGenerator[Union[jenkins_pysdk.async_jenkins.AsyncPlugin, jenkins_pysdk.async_jenkins.AsyncInstalled]]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        endpoint = Endpoints.Plugins.PluginManager if self.type == "plugins" else Endpoints.Plugins.UpdateCenter
+        url = self._jenkins._build_url(endpoint, suffix=Endpoints.Instance.Standard)
+
+        start = 0
+        while True:
+            limit = start + _paginate if _paginate > 0 else ""
+            paginate = f"{{{start},{limit}}}"
+            param = Endpoints.Plugins.PluginManagerIter.format(p_type=self.type, paginate=paginate) \
+                if self.type == "plugins" else Endpoints.Plugins.UpdateCenterIter.format(p_type=self.type, paginate=paginate)
+            req_obj, resp_obj = await self._jenkins._send_http(url=url, params={"tree": param})
+
+            if resp_obj.status_code > 200 and start > 0:
+                break  # Pagination finished, Jenkins doesn't return a nice response
+            elif resp_obj.status_code != 200:
+                raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get plugin information.")
+
+            data = json.loads(resp_obj.content)
+
+            if self.type == "plugins":
+                for plugin in data.get(self.type, []):
+                    yield AsyncInstalled(self._jenkins, plugin)
+            else:
+                for site_data in data.get('sites', []):
+                    plugins = site_data.get(self.type, [])
+                    if plugins and plugins[0]['sourceId'] == site:
+                        for plugin in plugins:
+                            yield AsyncPlugin(self._jenkins, plugin)
+                    break
+                else:
+                    raise JenkinsNotFound(f"Site ({site}) was not found.")
+
+            if _paginate > 0:
+                start += _paginate + 1
+            elif _paginate == 0:
+                break
+
+    async def list(self, _paginate: int = 0) -> List[Union[AsyncPlugin, AsyncInstalled]]:
+        """
+        List the plugins or installed plugins within the plugin group.
+
+        :param _paginate: The number of items to paginate. Default is 0.
+        :type _paginate: int, optional
+        :return: A list of plugins.
+        :rtype: List[Union[jenkins_pysdk.async_jenkins.AsyncPlugin, jenkins_pysdk.async_jenkins.AsyncInstalled]]
+        """
+        return [plugin async for plugin in self.iter(_paginate=_paginate)]
+
+
+class AsyncPlugins:
+    """
+    Asyncio equivalent of :class:`jenkins_pysdk.plugins.Plugins`.
+
+    :param jenkins: The AsyncJenkins instance containing the plugins.
+    :type jenkins: jenkins_pysdk.async_jenkins.AsyncJenkins
+    """
+    def __init__(self, jenkins):
+        self._jenkins = jenkins
+
+    @property
+    def availables(self) -> AsyncPluginGroup:
+        """
+        Represents a group of available plugins in Jenkins.
+
+        :return: The available plugins.
+        :rtype: jenkins_pysdk.async_jenkins.AsyncPluginGroup
+        """
+        return AsyncPluginGroup(self._jenkins, p_type="availables")
+
+    @property
+    def updates(self) -> AsyncPluginGroup:
+        """
+        Represents a group of plugins with available updates in Jenkins.
+
+        :return: The plugins with available updates.
+        :rtype: jenkins_pysdk.async_jenkins.AsyncPluginGroup
+        """
+        return AsyncPluginGroup(self._jenkins, p_type="updates")
+
+    @property
+    def installed(self) -> AsyncPluginGroup:
+        """
+        Represents a group of installed plugins in Jenkins.
+
+        :return: The installed plugins.
+        :rtype: jenkins_pysdk.async_jenkins.AsyncPluginGroup
+        """
+        return AsyncPluginGroup(self._jenkins, p_type="plugins")
+
+    async def upload(self, filename: str, file_content: BinaryIO or bytes) -> JenkinsActionObject:
+        """
+        Uploads a plugin to Jenkins.
+
+        :param filename: The name of the plugin file.
+        :type filename: str
+        :param file_content: The content of the plugin file as bytes.
+        :type file_content: bytes or BinaryIO
+        :return: A JenkinsActionObject representing the upload action.
+        :rtype: jenkins_pysdk.objects.JenkinsActionObject
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        if hasattr(file_content, "read"):
+            file_content = file_content.read()
+
+        url = self._jenkins._build_url(Endpoints.Plugins.Upload)
+        file = {"file": (filename, file_content, "application/java-archive"), "submit": ""}
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url, headers=dict(), files=file)
+        msg = f"[{resp_obj.status_code}] Successfully uploaded plugin ({filename})."
+
+        if resp_obj.status_code >= 500:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Server error.")
+        elif resp_obj.status_code != 200:
+            msg = f"[{resp_obj.status_code}] Failed to upload plugin ({filename})."
+
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+
+        return obj
+
+    async def install(self, name: str, version: str or int or float = "latest",
+                      restart: bool = False) -> JenkinsActionObject:
+        """
+        Installs a plugin in Jenkins.
+
+        :param name: The name of the plugin to install.
+        :type name: str
+        :param version: The version of the plugin to install. Default is "latest".
+        :type version: Union[str, int, float], optional
+        :param restart: Whether to restart Jenkins after installation. Default is False.
+        :type restart: bool, optional
+        :return: A JenkinsActionObject representing the installation action.
+        :rtype: jenkins_pysdk.objects.JenkinsActionObject
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        try:
+            plugin = await self.installed.search(name)
+            if plugin.version == version:
+                raise JenkinsGeneralException(f"Plugin ({name}@{version}) is already installed.")
+        except JenkinsNotFound:
+            pass
+
+        url = self._jenkins._build_url(Endpoints.Plugins.PluginManager, suffix=Endpoints.Plugins.Install)
+        data = f"<jenkins><install plugin=\"{name}@{version}\"/></jenkins>"
+        req_obj, resp_obj = await self._jenkins._send_http(method="POST", url=url, headers=XML_POST_HEADER, data=data)
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to install plugin ({name}).")
+
+        msg = f"[{resp_obj.status_code}] Successfully installed plugin ({name})."
+
+        if restart:
+            await self._jenkins.restart(graceful=True)
+            msg = f"[{resp_obj.status_code}] Successfully installed plugin ({name}) and restarted Jenkins."
+
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+
+        return obj
+
+
+class AsyncJenkins(AsyncCore):
+    """
+    Asyncio client for your Jenkins instance, built on :class:`httpx.AsyncClient`.
+
+    The API mirrors :class:`jenkins_pysdk.jenkins.Jenkins`: methods and properties which talk to Jenkins are
+    awaited, e.g. ``await jenkins.version`` or ``await job.builds.latest``, and iterators are async generators.
+    Unlike the sync client, the connection is not tested on creation:
+    use ``async with AsyncJenkins(...) as jenkins:`` or ``await jenkins.connect()``.
+
+    :param host: The hostname/IP/DNS of the Jenkins instance.
+    :type host: str
+    :param username: The username for authentication. Defaults to None.
+    :type username: str, optional
+    :param passw: The password for authentication. Defaults to None.
+    :type passw: str, optional
+    :param token: The API token for authentication. Defaults to None.
+    :type token: str, optional
+    :param verify: Enable or disable SSL verification. Defaults to True.
+    :type verify: bool, optional
+    :param proxies: Specify a proxy for routing requests. Supports both HTTP and HTTPS. Defaults to None.
+    :type proxies: dict, optional
+    :param port: The port number for connecting to the Jenkins instance. Defaults to 443.
+    :type port: int, optional
+    :param timeout: Specify the connection timeout in seconds. Defaults to 30.
+    :type timeout: int, optional
+    :param max_connections: Maximum number of pooled connections to the instance (or to each proxy). Defaults to 100.
+    :type max_connections: int, optional
+    :param max_keepalive_connections: Maximum number of idle connections kept alive in the pool. Defaults to 20.
+    :type max_keepalive_connections: int, optional
+    :param keepalive_expiry: Seconds an idle connection is kept alive before being closed. Defaults to 5.
+    :type keepalive_expiry: float, optional
+    :param retry: How transient failures are retried. Defaults to one retry of idempotent requests.
+    :type retry: :class:`jenkins_pysdk.retry.RetryPolicy`, optional
+    :param limiter: Paces requests so the controller is not overloaded. Defaults to None (no limit).
+    :type limiter: :class:`jenkins_pysdk.limiter.AdaptiveLimiter`, optional
+    :param cache: Cache for GET responses. Defaults to None (no caching).
+    :type cache: :class:`jenkins_pysdk.cache.ResponseCache`, optional
+    :param validators: Store of ETag/Last-Modified validators used for conditional GETs. Defaults to None.
+    :type validators: :class:`jenkins_pysdk.validators.ValidatorStore`, optional
+    :param coalesce: Let identical concurrent GETs share one request. Defaults to False.
+    :type coalesce: bool, optional
+    :param concurrency: Maximum number of requests in flight while walking folders. Defaults to 10.
+    :type concurrency: int, optional
+    """
+
+    def __init__(self, *,
+                 host: str,
+                 username: Optional[str] = None,
+                 passw: Optional[str] = None,
+                 token: Optional[str] = None,
+                 verify: Optional[bool] = True,
+                 proxies: dict = None,
+                 port: int = 443,
+                 timeout: int = 30,
+                 max_connections: int = HTTP_POOL_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = HTTP_POOL_MAX_KEEPALIVE,
+                 keepalive_expiry: float = HTTP_POOL_KEEPALIVE_EXPIRY,
+                 retry: RetryPolicy = None,
+                 limiter: AdaptiveLimiter = None,
+                 cache: ResponseCache = None,
+                 validators: ValidatorStore = None,
+                 coalesce: bool = False,
+                 concurrency: int = 10):
+        self.username = username
+        self.passw = passw
+        self.token = token
+        self.verify = verify
+        self.proxies = proxies
+        self.port = port
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.limiter = limiter
+        self.cache = cache
+        self.validators = validators
+        self.concurrency = concurrency
+        self._client = None
+        self._crumbs = {}
+        self._crumb_lock = None
+        self._metrics = Metrics()
+        self._single_flight = SingleFlight(self._metrics) if coalesce else None
+        self._background = set()
+
+        self.host = re.sub(r":\d+", f":{port}", host)
+        if not self.host.endswith(f":{port}"):
+            self.host += f":{port}"
+
+        self._jobs = AsyncJobs(self)
+        self._plugins = AsyncPlugins(self)
+        self._nodes = AsyncNodes(self)
+        self._queue = AsyncQueue(self)
+
+    async def __aenter__(self):
+        try:
+            await self.connect()
+        except Exception:
+            await self.close()
+            raise
+
+        return self
+
+    @property
+    def jobs(self) -> AsyncJobs:
+        """
+        Retrieve information about jobs.
+
+        :return: The jobs on the system.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncJobs`
+        """
+        return self._jobs
+
+    @property
+    def plugins(self) -> AsyncPlugins:
+        """
+        Retrieve information about plugins.
+
+        :return: The plugins on the system.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncPlugins`
+        """
+        return self._plugins
+
+    @property
+    def nodes(self) -> AsyncNodes:
+        """
+        Retrieve information about nodes.
+
+        :return: The nodes on the system.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncNodes`
+        """
+        return self._nodes
+
+    @property
+    def queue(self) -> AsyncQueue:
+        """
+        Retrieve information about the queue.
+
+        :return: The queue on the system.
+        :rtype: :class:`jenkins_pysdk.async_jenkins.AsyncQueue`
+        """
+        return self._queue
+
+    @property
+    def metrics(self) -> Metrics:
+        """
+        Counters describing the HTTP traffic of this instance, e.g. ``metrics["crumb_refreshes"]``.
+
+        :return: The metrics of this instance.
+        :rtype: :class:`jenkins_pysdk.metrics.Metrics`
+        """
+        return self._metrics
+
+    async def connect(self) -> JenkinsConnectObject:
+        """
+        Test the connection to the Jenkins instance.
+
+        :return: Object containing connection information.
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsConnectObject`
+        :raises JenkinsConnectionException: If a connection exception occurs.
+        :raises JenkinsUnauthorisedException: If the credentials aren't valid.
+        """
+        url = self._build_url(Endpoints.Instance.Connect)
+        req_obj, response_obj = await self._send_http(url=url)
+        code = int(response_obj.status_code)
+
+        if code == 200:
+            msg = f"[{code}] Successfully connected to {self.host}."
+        elif code == 400:
+            msg = JenkinsConnectionException(f"[{code}] Failed to connect to host.")
+        elif code == 401:
+            self._handle_unauthorised_exception(code)
+        elif code >= 500:
+            msg = JenkinsConnectionException(f"[{code}] Server error.")
+        else:
+            raise JenkinsConnectionException(response_obj.text)
+
+        return_object = JenkinsConnectObject(request=req_obj, response=response_obj,
+                                             content=str(msg), status_code=code)
+        return_object._raw = response_obj.content
+
+        return return_object
+
+    def _handle_unauthorised_exception(self, code):
+        msg = f"[{code}] Unauthorised. "
+        if self.username and self.passw:
+            msg += "Wrong credentials supplied."
+        elif not self.username:
+            msg += "No username supplied."
+        elif not self.passw and not self.token:
+            msg += "No password supplied."
+        else:
+            msg += "No credentials supplied."
+
+        raise JenkinsUnauthorisedException(msg)
+
+    @property
+    async def version(self) -> str:
+        """
+        Get the version information of the Jenkins instance.
+
+        :return: Version information of the Jenkins instance
+        :rtype: str
+        """
+        url = self._build_url(Endpoints.Instance.Connect)
+        req_obj, resp_obj = await self._send_http(url=url)
+
+        return resp_obj.headers['x-jenkins']
+
+    async def restart(self, graceful: bool = False) -> JenkinsActionObject:
+        """
+        Restart the Jenkins instance.
+
+        :param graceful: (optional) If True, restart after all jobs have finished, defaults to False
+        :type graceful: bool
+        :return: Restart status
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        """
+        endpoint = Endpoints.Maintenance.SafeRestart if graceful else Endpoints.Maintenance.Restart
+        url = self._build_url(endpoint)
+        req_obj, resp_obj = await self._send_http(method="POST", url=url)
+        code = resp_obj.status_code
+
+        if code == 503 and re.search(r"Please wait while Jenkins is restarting", str(resp_obj.content)):
+            msg = "[200] Restarting the Jenkins instance... please wait..."
+            code = 200
+        elif code != 200:
+            msg = JenkinsRestartFailed(f"[{code}] Failed to restart Jenkins.")
+        else:
+            msg = f"[{code}] Restarting the Jenkins instance... please wait..."
+
+        return JenkinsActionObject(request=req_obj, content=msg, status_code=code)
+
+    async def _quiet_mode_action(self, endpoint: str, action: str) -> JenkinsActionObject:
+        url = self._build_url(endpoint)
+        req_obj, resp_obj = await self._send_http(method="POST", url=url, headers=FORM_HEADER_DEFAULT)
+        code = resp_obj.status_code
+
+        if code != 200:
+            msg = JenkinsActionFailed(f"[{code}] Failed to {action} Quiet Mode.")
+        else:
+            msg = f"[{code}] Successfully {action}d Quiet Mode."
+
+        return JenkinsActionObject(request=req_obj, content=msg, status_code=code)
+
+    async def _disable_quiet_mode(self, wait_time: int = 0) -> JenkinsActionObject:
+        await asyncio.sleep(wait_time)
+
+        return await self._quiet_mode_action(Endpoints.Maintenance.NoQuietDown, "disable")
+
+    async def quiet_mode(self, duration: int = None, disable: bool = False) -> JenkinsActionObject:
+        """
+        Enable or disable Quiet Mode on the Jenkins instance.
+
+        :param duration: (optional) Enable Quiet Mode for X seconds. Disabling runs as a background task.
+        :type duration: int
+        :param disable: (optional) If True, disable Quiet Mode, defaults to False
+        :type disable: bool
+        :return: Result of the request to enable or disable Quiet Mode
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        if duration and disable:
+            raise JenkinsGeneralException("You can't enable and disable at the same time.")
+
+        if disable:
+            return await self._disable_quiet_mode()
+
+        quiet_obj = await self._quiet_mode_action(Endpoints.Maintenance.QuietDown, "enable")
+
+        if quiet_obj.status_code == 200 and duration:
+            task = asyncio.ensure_future(self._disable_quiet_mode(duration))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+            quiet_obj.content = f"[{quiet_obj.status_code}] Successfully enabled Quiet Mode for {duration} seconds."
+
+        return quiet_obj
+
+    async def shutdown(self, graceful: bool = False) -> JenkinsActionObject:
+        """
+        Shut down the Jenkins instance.
+
+        :param graceful: (Default: False) If True, pause new jobs and wait for all jobs to complete.
+        :type graceful: bool
+        :return: Result of the shutdown request
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        """
+        endpoint = Endpoints.Maintenance.SafeShutdown if graceful else Endpoints.Maintenance.Shutdown
+        url = self._build_url(endpoint)
+        req_obj, resp_obj = await self._send_http(method="POST", url=url)
+
+        if resp_obj.status_code == 200:
+            msg = f"[{resp_obj.status_code}] Shutting down..."
+        else:
+            msg = f"[{resp_obj.status_code}] Failed to shutdown application."
+
+        return JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+
+    async def reload(self) -> JenkinsActionObject:
+        """
+        Reload configuration from disk.
+
+        :return: Result of request
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        """
+        url = self._build_url(Endpoints.Manage.Reload)
+        req_obj, resp_obj = await self._send_http(method="POST", url=url)
+        msg = f"[{resp_obj.status_code}] Successfully reloaded configuration."
+
+        if resp_obj.status_code != 200:
+            msg = f"[{resp_obj.status_code}] Failed to reload configuration from disk."
+
+        return JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
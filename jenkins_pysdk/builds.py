@@ -1,23 +1,34 @@
 import re
 import time
 import json
+import threading
+from collections import deque
+from pathlib import Path
+from concurrent.futures import Future, wait as wait_futures
 from typing import (
     List,
+    Tuple,
+    Iterator,
     Optional,
     Generator,
-    Union
+    Union,
+    Callable,
+    Any,
+    Iterable,
+    Pattern,
+    IO
 )
 
 from jenkins_pysdk.objects import JenkinsActionObject
-from jenkins_pysdk.exceptions import JenkinsGeneralException, JenkinsNotFound
-from jenkins_pysdk.consts import Endpoints, FORM_HEADER_DEFAULT
+from jenkins_pysdk.exceptions import JenkinsGeneralException, JenkinsNotFound, JenkinsQueueItemCancelled
+from jenkins_pysdk.consts import Endpoints, FORM_HEADER_DEFAULT, HTTP_DOWNLOAD_CHUNK_SIZE, CONSOLE_MAX_LINE_LENGTH
 
 
-__all__ = ["Builds", "Build"]
+__all__ = ["Builds", "Build", "BuildHandle", "BuildWatcher", "ConsoleFollower", "ConsoleMatch"]
 
 
 class Build:
-    def __init__(self, jenkins, build_url: str):
+    def __init__(self, jenkins, build_url: str, raw: dict = None):
         """
         Initialize a Build object.
 
@@ -25,20 +36,36 @@ class Build:
         :type jenkins: jenkins_pysdk.jenkins.Jenkins
         :param build_url: The URL of the build.
         :type build_url: str
+        :param raw: (Optional) Build information already fetched from Jenkins, e.g. while listing builds.
+                    The build is only fetched again when a field missing from it is read.
+        :type raw: dict, optional
         """
         self._jenkins = jenkins
         self._build_url = build_url
-        self._raw = self._get_raw()
+        self._hydrated = raw is None
+        self._raw = self._get_raw() if raw is None else raw
 
     def _get_raw(self) -> json.loads:
         url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._build_url)
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
+        # Only the fields read by the properties
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Fields})
 
         if resp_obj.status_code != 200:
             raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get build information.")
 
         return json.loads(resp_obj.content)
 
+    @property
+    def _job_url(self) -> str:
+        return str(self._build_url).rstrip("/").rsplit("/", 1)[0] + "/"
+
+    def _field(self, name: str):
+        if name not in self._raw and not self._hydrated:
+            self._raw = {**self._raw, **self._get_raw()}
+            self._hydrated = True
+
+        return self._raw[name]
+
     @property
     def number(self) -> int:
         """
@@ -47,7 +74,7 @@ class Build:
         :return: The build number.
         :rtype: int
         """
-        return int(self._raw['number'])
+        return int(self._field('number'))
 
     @property
     def timestamp(self) -> int:
@@ -57,7 +84,7 @@ class Build:
         :return: The build timestamp.
         :rtype: int
         """
-        return int(self._raw['timestamp'])
+        return int(self._field('timestamp'))
 
     @property
     def description(self) -> str:
@@ -67,18 +94,19 @@ class Build:
         :return: The build description.
         :rtype: str
         """
-        return str(self._raw['description'])
+        return str(self._field('description'))
 
-    def console(self, **kws) -> Union[str, Generator[str, None, None]]:
+    def console(self, **kws) -> Union[str, Generator[bytes, None, None]]:
         """
         Retrieve the console output of the build.
+        Use :meth:`follow` to read the progressive output line by line.
 
         :param kws: Keyword arguments.
                     - progressive (bool, optional): Whether to retrieve progressive console output.
                     - html (bool, optional): Whether to retrieve HTML-formatted console output.
                     - _start (int, optional): Console output bytes offset (Only works with progressive/HTML - use with caution, as you may lose output).
         :return: The console output of the build.
-        :rtype: str or Generator[str, None, None]
+        :rtype: str or Generator[bytes, None, None]
         :raises JenkinsGeneralException: If a general exception occurs.
         """
         progressive = kws.get('progressive', False)
@@ -102,29 +130,194 @@ class Build:
 
         return resp_obj.text
 
-    def _get_progressive_console_output(self, html: bool, _start: int) -> Generator[str, None, None]:
+    def download_console(self, path: Union[str, Path, IO[bytes]], *,
+                         chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE,
+                         progress: Callable[[int, Optional[int]], Any] = None,
+                         resume: bool = False) -> JenkinsActionObject:
+        """
+        Stream the console output of the build to a file, without holding it in memory.
+
+        :param path: The file where the console output will be saved, or a binary file object.
+        :type path: str or Path or IO[bytes]
+        :param chunk_size: (Default: 64KiB) Number of bytes written at a time.
+        :type chunk_size: int, optional
+        :param progress: (Optional) Called with the bytes downloaded so far and the total size (None if unknown).
+        :type progress: Callable[[int, Optional[int]], Any], optional
+        :param resume: (Default: False) Continue a partial download already in the file, if Jenkins supports it.
+        :type resume: bool, optional
+        :return: An object representing the action performed in Jenkins.
+        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
+        :raises JenkinsGeneralException: If the console output couldn't be downloaded.
+        """
+        url = self._jenkins._build_url(Endpoints.Builds.BuildConsoleText, prefix=self._build_url)
+        req_obj, resp_obj, size = self._jenkins._download(url=url, destination=path, chunk_size=chunk_size,
+                                                          progress=progress, resume=resume)
+
+        if resp_obj.status_code not in (200, 206) and not (resume and resp_obj.status_code == 416):
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+        msg = f"[{resp_obj.status_code}] Successfully downloaded {size} bytes of build logs."
+        obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
+        obj._raw = resp_obj
+
+        return obj
+
+    def _get_progressive_console_output(self, html: bool, _start: int) -> Generator[bytes, None, None]:
+        for chunk, offset in self._poll_progressive_console(html, _start):
+            yield chunk
+
+    def _poll_progressive_console(self, html: bool, start: int, min_interval: float = 0.5,
+                                  max_interval: float = 10) -> Generator[Tuple[bytes, int], None, None]:
         endpoint = Endpoints.Builds.ProgressiveHtml if html else Endpoints.Builds.ProgressiveConsoleText
+        url = self._jenkins._build_url(endpoint, prefix=self._build_url)
+        interval = min_interval
 
         while True:
-            url = self._jenkins._build_url(endpoint, prefix=self._build_url)
-            req_obj, resp_obj = self._jenkins._send_http(url=url, params={"start": _start})
+            req_obj, resp_obj = self._jenkins._send_http(url=url, params={"start": start})
 
             if resp_obj.status_code != 200:
                 raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
 
             try:
                 offset = int(resp_obj.headers['X-Text-Size'])
-                if offset > _start:
-                    yield resp_obj.content
+            except (KeyError, ValueError):
+                return
 
-                if bool(resp_obj.headers['X-More-Data']):
-                    _start += offset
-                    time.sleep(5)  # Sleep 5 same as UI
-                    continue
+            # X-Text-Size is the offset to resume from, not the size of this chunk
+            if offset > start:
+                yield resp_obj.content, offset
+                interval = max(interval / 2, min_interval)
+            else:
+                interval = min(interval * 2, max_interval)
+            start = offset
 
+            if resp_obj.headers.get('X-More-Data', "").lower() != "true":
                 return
-            except KeyError:
-                return
+
+            time.sleep(interval)
+
+    def follow(self, start: int = 0, *, min_interval: float = 0.5, max_interval: float = 10) -> "ConsoleFollower":
+        """
+        Follow the console output of the build line by line, until the build finishes.
+
+        Jenkins is polled often while the build prints, and less often while it is quiet. The returned
+        :class:`jenkins_pysdk.builds.ConsoleFollower` keeps the byte offset after the last line yielded, pass it as
+        ``start`` to resume following where a previous follower stopped.
+
+        :param start: (Default: 0) Byte offset of the console output to start from.
+        :type start: int, optional
+        :param min_interval: (Default: 0.5) Fewest seconds to wait between polls.
+        :type min_interval: float, optional
+        :param max_interval: (Default: 10) Most seconds to wait between polls.
+        :type max_interval: float, optional
+        :return: An iterator over the lines of the console output, without line endings.
+        :rtype: :class:`jenkins_pysdk.builds.ConsoleFollower`
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        return ConsoleFollower(self._poll_progressive_console(False, start, min_interval, max_interval), start)
+
+    def console_tail(self, lines: int = None, *, bytes: int = None) -> str:
+        """
+        Retrieve the end of the console output of the build, without downloading the rest of it.
+
+        Give either ``lines`` or ``bytes``. For lines, the end of the log is fetched in a window which grows until it
+        holds enough lines, starting at 128 bytes per line.
+
+        The size of the log is read from a HEAD request, only headers are transferred but Jenkins still reads the
+        whole log to answer it. A ``start`` past the end can't be used instead, Jenkins restarts from 0 and returns
+        the whole log. For huge logs, the call costs one pass over the log on the server, not on the network.
+
+        :param lines: (Optional) Number of lines to return, without line endings.
+        :type lines: int, optional
+        :param bytes: (Optional) Number of bytes to return.
+        :type bytes: int, optional
+        :return: The end of the console output of the build.
+        :rtype: str
+        :raises ValueError: If neither or both of lines and bytes are given, or they are negative.
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        if (lines is None) == (bytes is None):
+            raise ValueError("Give either lines or bytes.")
+        count = bytes if lines is None else lines
+        if count < 0:
+            raise ValueError("The tail size can't be negative.")
+
+        size = self._console_size()
+        window = count if lines is None else max(count * 128, HTTP_DOWNLOAD_CHUNK_SIZE // 16)
+
+        while True:
+            start = max(size - window, 0)
+            content, size = self._console_from(start)
+            tail = _console_tail(content, start == 0, lines, bytes)
+            if tail is not None:
+                return tail
+
+            window *= 4
+
+    def _console_size(self) -> int:
+        # Only the headers are sent back, but Jenkins still renders the whole log to answer a HEAD request.
+        # progressiveText treats a start past the end as a rolled over log and sends all of it, so it's no cheaper
+        url = self._jenkins._build_url(Endpoints.Builds.ProgressiveConsoleText, prefix=self._build_url)
+        req_obj, resp_obj = self._jenkins._send_http(method="HEAD", url=url)
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+        try:
+            return int(resp_obj.headers['X-Text-Size'])
+        except (KeyError, ValueError):
+            raise JenkinsGeneralException("Jenkins didn't return the size of the build logs.") from None
+
+    def _console_from(self, start: int) -> Tuple[bytes, int]:
+        url = self._jenkins._build_url(Endpoints.Builds.ProgressiveConsoleText, prefix=self._build_url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"start": start})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+        try:
+            return resp_obj.content, int(resp_obj.headers['X-Text-Size'])
+        except (KeyError, ValueError):
+            return resp_obj.content, start + len(resp_obj.content)
+
+    def search_console(self, patterns: Union[str, Pattern, Iterable[Union[str, Pattern]]], context: int = 0,
+                       max_matches: int = None, *, flags: int = 0,
+                       chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE) -> List["ConsoleMatch"]:
+        """
+        Search the console output of the build line by line, while it downloads.
+
+        Only the last ``context`` lines are kept in memory, and the download stops once ``max_matches`` lines matched
+        and their context after them was read. A line matching several patterns is reported once, for the first one.
+        Lines longer than 1MiB, e.g. progress bars redrawn with carriage returns, are only matched on their first MiB.
+
+        :param patterns: Regular expressions to look for, as strings or compiled patterns.
+        :type patterns: str or Pattern or Iterable[Union[str, Pattern]]
+        :param context: (Default: 0) Number of lines to keep before and after each matching line.
+        :type context: int, optional
+        :param max_matches: (Optional) Stop after this many matching lines, search the whole log by default.
+        :type max_matches: int, optional
+        :param flags: (Default: 0) ``re`` flags used to compile the string patterns.
+        :type flags: int, optional
+        :param chunk_size: (Default: 64KiB) Number of bytes read at a time.
+        :type chunk_size: int, optional
+        :return: The matching lines, in the order they were printed.
+        :rtype: List[:class:`jenkins_pysdk.builds.ConsoleMatch`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        scanner = _ConsoleScanner(patterns, context, max_matches, flags)
+        url = self._jenkins._build_url(Endpoints.Builds.BuildConsoleText, prefix=self._build_url)
+
+        with self._jenkins._stream(url=url) as (req_obj, resp_obj):
+            if resp_obj.status_code != 200:
+                raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build logs.")
+
+            for chunk in resp_obj.iter_bytes(chunk_size):
+                scanner.feed(chunk)
+                if scanner.done:
+                    # Closing the response drops the rest of the log
+                    return scanner.matches
+
+        return scanner.close()
 
     def delete(self) -> JenkinsActionObject:
         """
@@ -209,11 +402,9 @@ class Build:
 
         :return: The next build in the build queue.
         :rtype: :class:`jenkins_pysdk.builds.Build`
+        :raises JenkinsNotFound: If there is no next build.
         """
-        build_number = re.search(r"(\d+)/$", str(self._build_url)).group(1)
-        job_url = re.search(r'^(.*?)(?=/\d+/)', str(self._build_url)).group(1)
-
-        return Builds(self._jenkins, job_url).search(int(build_number) + 1)
+        return Builds(self._jenkins, self._job_url).search(self.number + 1)
 
     @property
     def previous(self) -> ...:
@@ -222,11 +413,9 @@ class Build:
 
         :return: The previous build in the build history.
         :rtype: :class:`jenkins_pysdk.builds.Build`
+        :raises JenkinsNotFound: If there is no previous build.
         """
-        build_number = re.search(r"(\d+)/$", str(self._build_url)).group(1)
-        job_url = re.search(r'^(.*?)(?=/\d+/)', str(self._build_url)).group(1)
-
-        return Builds(self._jenkins, job_url).search(int(build_number) - 1)
+        return Builds(self._jenkins, self._job_url).search(self.number - 1)
 
     @property
     def url(self) -> str:
@@ -246,7 +435,7 @@ class Build:
         :return: The result of the build.
         :rtype: str
         """
-        return str(self._raw['result'])
+        return str(self._field('result'))
 
     @property
     def duration(self) -> int:
@@ -256,7 +445,7 @@ class Build:
         :return: The duration of the build in milliseconds.
         :rtype: int
         """
-        return int(self._raw['duration'])
+        return int(self._field('duration'))
 
     @property
     def done(self) -> bool:
@@ -266,14 +455,11 @@ class Build:
         :return: True if the build has completed, False otherwise.
         :rtype: bool
         """
-        try:
-            if bool(self._raw['inProgress']):
-                return False
-        except KeyError:
-            if bool(self._raw['building']):
-                return False
+        # Only pipelines report inProgress
+        if self._raw.get('inProgress') is not None:
+            return not bool(self._raw['inProgress'])
 
-        return True
+        return not bool(self._field('building'))
 
     @property
     def artifacts(self):
@@ -287,7 +473,589 @@ class Build:
         raise NotImplementedError
 
 
+def _console_tail(content: bytes, whole: bool, lines: Optional[int], size: Optional[int]) -> Optional[str]:
+    """
+    Decode the end of a console output window, or return None when the window needs to grow to hold enough lines.
+    """
+    if lines is None:
+        content = content[max(len(content) - size, 0):]
+        if not whole:
+            # Skip a character cut in half by the start of the window
+            content = content.lstrip(bytes(range(0x80, 0xC0)))
+        return content.decode("utf-8", errors="replace")
+
+    parts = content.split(b"\n")
+    if parts[-1] == b"":
+        parts.pop()
+    if not whole:
+        # The first line started before the window
+        parts = parts[1:]
+        if len(parts) < lines:
+            return None
+
+    return "\n".join(line.rstrip(b"\r").decode("utf-8", errors="replace") for line in parts[max(len(parts) - lines, 0):])
+
+
+class ConsoleMatch:
+    """
+    A line of a build's console output matched by :meth:`jenkins_pysdk.builds.Build.search_console`.
+
+    :param line_number: Number of the line in the console output, from 1.
+    :type line_number: int
+    :param line: The line, without its line ending.
+    :type line: str
+    :param match: The match of the first pattern found in the line.
+    :type match: re.Match
+    :param before: The lines before it, up to the requested context.
+    :type before: List[str]
+    :param after: The lines after it, up to the requested context.
+    :type after: List[str]
+    """
+    __slots__ = ("line_number", "line", "match", "before", "after")
+
+    def __init__(self, line_number: int, line: str, match: "re.Match", before: List[str] = None,
+                 after: List[str] = None):
+        self.line_number = line_number
+        self.line = line
+        self.match = match
+        self.before = before if before is not None else []
+        self.after = after if after is not None else []
+
+    @property
+    def pattern(self) -> Pattern:
+        """
+        The pattern which matched the line.
+        """
+        return self.match.re
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.line_number}: {self.line!r}>"
+
+
+class _ConsoleScanner:
+    """
+    Match console output fed in chunks line by line, keeping only the lines needed for the context.
+    Lines longer than max_line_length bytes are cut, the rest of them is skipped without being buffered.
+    """
+    def __init__(self, patterns: Union[str, Pattern, Iterable[Union[str, Pattern]]], context: int,
+                 max_matches: Optional[int], flags: int = 0, max_line_length: int = CONSOLE_MAX_LINE_LENGTH):
+        if isinstance(patterns, (str, re.Pattern)):
+            patterns = [patterns]
+        if context < 0:
+            raise ValueError("context can't be negative.")
+        if max_matches is not None and max_matches < 1:
+            raise ValueError("max_matches must be greater than 0.")
+
+        self._patterns = [re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+                          for pattern in patterns]
+        self._context = context
+        self._max_matches = max_matches
+        self._before = deque(maxlen=context)
+        self._waiting = deque()
+        self._buffer = b""
+        self._max_line_length = max_line_length
+        self._skipping = False
+        self._line_number = 0
+        self.matches = []
+
+    @property
+    def done(self) -> bool:
+        return self._max_matches is not None and len(self.matches) >= self._max_matches and not self._waiting
+
+    def feed(self, chunk: bytes) -> None:
+        if self._skipping:
+            _, newline, chunk = chunk.partition(b"\n")
+            if not newline:
+                return
+            self._skipping = False
+
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split(b"\n")
+        if len(self._buffer) > self._max_line_length:
+            # No line end in sight, e.g. a progress bar redrawn with \r, only its start is matched
+            lines.append(self._buffer[:self._max_line_length])
+            self._buffer = b""
+            self._skipping = True
+
+        for line in lines:
+            self._scan(line)
+            if self.done:
+                return
+
+    def close(self) -> List[ConsoleMatch]:
+        if self._buffer and not self.done:
+            line, self._buffer = self._buffer, b""
+            self._scan(line)
+
+        return self.matches
+
+    def _scan(self, raw: bytes) -> None:
+        self._line_number += 1
+        line = raw.rstrip(b"\r").decode("utf-8", errors="replace")
+
+        for waiting in self._waiting:
+            waiting.after.append(line)
+        while self._waiting and len(self._waiting[0].after) >= self._context:
+            self._waiting.popleft()
+
+        if self._max_matches is None or len(self.matches) < self._max_matches:
+            for pattern in self._patterns:
+                match = pattern.search(line)
+                if match:
+                    self.matches.append(ConsoleMatch(self._line_number, line, match, list(self._before)))
+                    if self._context:
+                        self._waiting.append(self.matches[-1])
+                    break
+
+        self._before.append(line)
+
+
+class ConsoleFollower:
+    """
+    Iterator over the lines of a build's console output, returned by :meth:`jenkins_pysdk.builds.Build.follow`.
+
+    Lines are decoded as UTF-8 once they are complete, so characters split between two polls aren't mangled.
+
+    ``offset`` is the byte offset of the raw log after the last line yielded, pass it to
+    :meth:`jenkins_pysdk.builds.Build.follow` to resume. It counts bytes of the raw log, hidden console markup
+    included, which Jenkins strips from the text. Within a chunk without markup every line end can be located, so
+    ``offset`` is exact. Lines of a chunk with markup keep the offset before the chunk, except its last line when the
+    chunk ends on a line end, so a follower resumed from the middle of such a chunk repeats some lines.
+
+    :param chunks: The (bytes, offset after them) chunks of the console output.
+    :type chunks: Iterator[Tuple[bytes, int]]
+    :param start: Byte offset of the first chunk.
+    :type start: int
+    """
+    def __init__(self, chunks: Iterator[Tuple[bytes, int]], start: int = 0):
+        self._chunks = chunks
+        self._buffer = b""
+        self._end = start
+        self.offset = start
+
+    def __iter__(self) -> Iterator[str]:
+        for chunk, end in self._chunks:
+            for line, offset in self._feed(chunk, end):
+                self.offset = offset
+                yield line
+
+        for line, offset in self._flush():
+            self.offset = offset
+            yield line
+
+    def _feed(self, chunk: bytes, end: int) -> List[Tuple[str, int]]:
+        start, self._end = self._end, end
+        # Without hidden markup, the chunk lines up with the raw log
+        exact = end - start == len(chunk)
+        carried = len(self._buffer)
+        *lines, self._buffer = (self._buffer + chunk).split(b"\n")
+        if not lines:
+            if not self._buffer:
+                # Nothing to yield, e.g. only markup was printed, but everything before end was read
+                self.offset = end
+            return []
+
+        fed, offset = [], self.offset
+        read = -carried
+        for line in lines:
+            read += len(line) + 1
+            if exact:
+                offset = start + read
+            fed.append((self._decode(line), offset))
+
+        if not self._buffer:
+            fed[-1] = (fed[-1][0], end)
+        return fed
+
+    def _flush(self) -> List[Tuple[str, int]]:
+        if not self._buffer:
+            return []
+
+        line, self._buffer = self._buffer, b""
+        return [(self._decode(line), self._end)]
+
+    @staticmethod
+    def _decode(line: bytes) -> str:
+        return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """
+        Stop polling Jenkins.
+        """
+        self._chunks.close()
+
+
+class BuildHandle(Future):
+    """
+    A build triggered with :meth:`jenkins_pysdk.builds.Builds.build`, which may not have started yet.
+
+    It is a :class:`concurrent.futures.Future` whose result is the :class:`jenkins_pysdk.builds.Build` once it
+    has finished. Jenkins isn't polled until the handle is used: reading :attr:`build`, :meth:`wait`, :meth:`result`,
+    :meth:`exception`, :meth:`add_done_callback` or :meth:`start` starts a daemon thread which polls the queue item,
+    then the build, spacing the polls by the job's estimated duration. Call :meth:`start` before handing the handle
+    to ``concurrent.futures.wait`` or ``as_completed``, which don't go through those methods.
+    The ``request``, ``response``, ``content`` and ``status_code`` of the trigger request are kept as well.
+
+    :param jenkins: The Jenkins instance the build was triggered on.
+    :type jenkins: jenkins_pysdk.jenkins.Jenkins
+    :param queue_url: The URL of the queue item Jenkins created.
+    :type queue_url: str
+    :param min_interval: (Default: 0.5) Fewest seconds to wait between polls.
+    :type min_interval: float, optional
+    :param max_interval: (Default: 30) Most seconds to wait between polls.
+    :type max_interval: float, optional
+    """
+    def __init__(self, jenkins, queue_url: str, *, request: Any = None, response: Any = None,
+                 content: Any = None, status_code: int = None, min_interval: float = 0.5, max_interval: float = 30):
+        super().__init__()
+        self._jenkins = jenkins
+        self._queue_url = queue_url
+        self._build = None
+        self._interval = min_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        # Held while the outcome is decided, so a cancelled handle isn't resolved by the poller afterwards
+        self._settling = threading.RLock()
+        self._stopped = threading.Event()
+        self.request = request
+        self.response = response
+        self.content = content
+        self.status_code = status_code
+        self._poller = None
+
+    def __repr__(self):
+        state = "done" if self.done() else "running" if self._build is not None else "queued"
+        return f"<{self.__class__.__name__} {self._queue_url} {state}>"
+
+    @property
+    def queue_url(self) -> str:
+        """
+        The URL of the queue item Jenkins created for the build.
+
+        :return: The URL of the queue item.
+        :rtype: str
+        """
+        return self._queue_url
+
+    @property
+    def queue_id(self) -> int:
+        """
+        The ID of the queue item Jenkins created for the build.
+
+        :return: The ID of the queue item.
+        :rtype: int
+        """
+        return int(str(self._queue_url).rstrip("/").rsplit("/", 1)[-1])
+
+    @property
+    def build(self) -> Optional[Build]:
+        """
+        The build, once Jenkins started it.
+
+        :return: The build, or None if it is still queued.
+        :rtype: :class:`jenkins_pysdk.builds.Build`
+        :raises JenkinsQueueItemCancelled: If the queue item was cancelled in Jenkins.
+        :raises CancelledError: If the handle was cancelled.
+        """
+        self.start()
+        if self._build is None and self.done():
+            return self.result(timeout=0)  # Raises why the build never started
+
+        return self._build
+
+    def start(self) -> None:
+        """
+        Start polling Jenkins in the background, if it isn't already.
+        """
+        with self._settling:
+            if self._poller is None and not self.done():
+                self._poller = threading.Thread(target=self._poll, name=f"BuildHandle-{self.queue_id}", daemon=True)
+                self._poller.start()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait until the build has finished.
+
+        :param timeout: (Optional) Seconds to wait, waits forever by default.
+        :type timeout: float, optional
+        :return: True if the build finished (or failed to start), False if the timeout expired.
+        :rtype: bool
+        """
+        self.start()
+        done, _ = wait_futures([self], timeout=timeout)
+
+        return bool(done)
+
+    def result(self, timeout: float = None) -> Build:
+        """
+        Wait until the build has finished and return it.
+
+        :param timeout: (Optional) Seconds to wait, waits forever by default.
+        :type timeout: float, optional
+        :return: The finished build.
+        :rtype: :class:`jenkins_pysdk.builds.Build`
+        :raises JenkinsQueueItemCancelled: If the queue item was cancelled in Jenkins.
+        :raises CancelledError: If the handle was cancelled.
+        :raises TimeoutError: If the build didn't finish within the timeout.
+        """
+        self.start()
+
+        return super().result(timeout)
+
+    def exception(self, timeout: float = None) -> Optional[BaseException]:
+        """
+        Wait until the build has finished and return the exception which stopped it being tracked, if any.
+
+        :param timeout: (Optional) Seconds to wait, waits forever by default.
+        :type timeout: float, optional
+        :return: The exception, or None.
+        :rtype: BaseException
+        :raises TimeoutError: If the build didn't finish within the timeout.
+        """
+        self.start()
+
+        return super().exception(timeout)
+
+    def add_done_callback(self, fn: Callable[[Future], Any]) -> None:
+        """
+        Call ``fn(handle)`` once the build has finished, or failed to start.
+
+        :param fn: The callback.
+        :type fn: Callable[[Future], Any]
+        """
+        self.start()
+        super().add_done_callback(fn)
+
+    def cancel(self) -> bool:
+        """
+        Cancel the queue item, if the build hasn't started yet.
+
+        :return: True if the queue item was cancelled.
+        :rtype: bool
+        """
+        with self._settling:
+            if self.done() or self._build is not None:
+                return self.cancelled()
+
+            url = self._jenkins._build_url(Endpoints.Queue.Cancel)
+            req_obj, resp_obj = self._jenkins._send_http(method="POST", url=url, params={"id": self.queue_id})
+
+            if resp_obj.status_code not in (200, 204, 302):
+                return False
+
+            self._stopped.set()
+            return super().cancel()
+
+    def _poll(self) -> None:
+        delay = 0
+        while not self._stopped.wait(delay):
+            try:
+                delay = self._poll_queue() if self._build is None else self._poll_build()
+            except Exception as e:
+                self._settle(error=e)
+
+    def _settle(self, result: Build = None, error: BaseException = None) -> None:
+        with self._settling:
+            self._stopped.set()
+            if self.done():
+                return
+            if error is not None:
+                self.set_exception(error)
+            else:
+                self.set_result(result)
+
+    def _poll_queue(self) -> float:
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._queue_url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.ItemState})
+
+        if resp_obj.status_code == 404:
+            raise JenkinsNotFound(f"Queue item ({self.queue_id}) was not found.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get queue item ({self.queue_id}).")
+
+        data = self._jenkins._validate_url_returned_from_instance(json.loads(resp_obj.content))
+
+        if data.get('executable'):
+            self._build = Build(self._jenkins, data['executable']['url'], raw=data['executable'])
+            self._interval = self._min_interval
+            return 0
+        if data.get('cancelled'):
+            raise JenkinsQueueItemCancelled(f"Queue item ({self.queue_id}) was cancelled.")
+
+        delay = self._interval
+        self._interval = min(self._interval * 1.5, self._max_interval)
+
+        return delay
+
+    def _poll_build(self) -> float:
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._build.url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Progress})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get build information.")
+
+        data = json.loads(resp_obj.content)
+        self._build._raw = {**self._build._raw, **data}
+
+        if self._build.done:
+            self._settle(result=self._build)
+            return 0
+
+        # Wait for half of the estimated time left, then back off once the estimate is exceeded
+        remaining = (int(data.get('timestamp', 0)) + int(data.get('estimatedDuration', -1))) / 1000 - time.time()
+        if remaining > 0:
+            return min(max(remaining / 2, self._min_interval), self._max_interval)
+
+        delay = self._interval
+        self._interval = min(self._interval * 1.5, self._max_interval)
+
+        return delay
+
+
+class BuildWatcher:
+    """
+    Wait for many running builds at once.
+
+    Builds are grouped by job and each job is polled with a single request per cycle, listing only its most recent
+    builds down to the oldest one being watched. Builds which finish are yielded by :meth:`iter`, returned by
+    :meth:`poll`, and passed to their callback. Builds deleted while being watched are dropped.
+
+    :param jenkins: The Jenkins instance the builds belong to.
+    :type jenkins: jenkins_pysdk.jenkins.Jenkins
+    :param interval: (Default: 5) Seconds to wait between polling cycles.
+    :type interval: float, optional
+    """
+    _headroom = 5  # Builds which may start between cycles
+
+    def __init__(self, jenkins, interval: float = 5):
+        self._jenkins = jenkins
+        self.interval = interval
+        self._jobs = dict()
+        self._newest = dict()
+
+    def add(self, build: Build, callback: Callable[[Build], Any] = None) -> None:
+        """
+        Start watching a build.
+
+        :param build: The build to watch.
+        :type build: :class:`jenkins_pysdk.builds.Build`
+        :param callback: (Optional) Called with the build once it has finished.
+        :type callback: Callable[[Build], Any], optional
+        """
+        watched = self._jobs.setdefault(build._job_url, dict())
+        watched[build.number] = (build, callback)
+        self._newest[build._job_url] = max(self._newest.get(build._job_url, 0), build.number)
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of builds still being watched.
+
+        :return: The number of unfinished builds.
+        :rtype: int
+        """
+        return sum(len(watched) for watched in self._jobs.values())
+
+    def poll(self) -> List[Build]:
+        """
+        Poll every job once, and return the builds which finished since the last poll.
+
+        :return: The builds which finished.
+        :rtype: List[:class:`jenkins_pysdk.builds.Build`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        finished = list()
+
+        for job_url, watched in list(self._jobs.items()):
+            builds, complete = self._job_builds(job_url, min(watched))
+            oldest = int(builds[-1]['number']) if builds else None
+
+            for data in builds:
+                entry = watched.get(int(data['number']))
+                if entry is None:
+                    continue
+                build, callback = entry
+                build._raw = {**build._raw, **data}
+                if build.done:
+                    del watched[build.number]
+                    finished.append(build)
+                    if callback is not None:
+                        callback(build)
+
+            listed = {int(data['number']) for data in builds}
+            for number in [n for n in watched if n not in listed and (complete or n > oldest)]:
+                del watched[number]  # Deleted while being watched
+            if not watched:
+                del self._jobs[job_url]
+                del self._newest[job_url]
+
+        return finished
+
+    def iter(self, timeout: float = None) -> Generator[Build, None, None]:
+        """
+        Poll until every build has finished, yielding each build as it finishes.
+
+        :param timeout: (Optional) Seconds to wait, waits forever by default.
+        :type timeout: float, optional
+        :return: A generator yielding the finished builds.
+        :rtype: Generator[:class:`jenkins_pysdk.builds.Build`]
+        :raises TimeoutError: If builds are still running when the timeout expires.
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while self.pending:
+            yield from self.poll()
+            if not self.pending:
+                return
+
+            delay = self.interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"{self.pending} builds didn't finish within {timeout}s.")
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    def wait(self, timeout: float = None) -> List[Build]:
+        """
+        Poll until every build has finished.
+
+        :param timeout: (Optional) Seconds to wait, waits forever by default.
+        :type timeout: float, optional
+        :return: The builds, in the order they finished.
+        :rtype: List[:class:`jenkins_pysdk.builds.Build`]
+        :raises TimeoutError: If builds are still running when the timeout expires.
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        return list(self.iter(timeout))
+
+    def _job_builds(self, job_url: str, oldest: int) -> Tuple[List[dict], bool]:
+        count = max(self._newest[job_url] - oldest + 1, 1) + self._headroom
+
+        while True:
+            # Jenkins only lists the last 100 builds in builds
+            field = "builds" if count <= 100 else "allBuilds"
+            tree = Endpoints.Builds.Watch.format(field=field, count=count)
+            url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=job_url)
+            req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": tree})
+
+            if resp_obj.status_code != 200:
+                raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch job information.")
+
+            builds = json.loads(resp_obj.content).get(field, [])
+            if builds:
+                self._newest[job_url] = max(self._newest[job_url], int(builds[0]['number']))
+
+            complete = len(builds) < count
+            if complete or int(builds[-1]['number']) <= oldest:
+                return builds, complete
+            count *= 2
+
+
 class Builds:
+    _range_span = 10  # History rows get_many may read per build asked for
+
     def __init__(self, jenkins, job_url: str):
         """
         Initializes a Builds object.
@@ -303,6 +1071,7 @@ class Builds:
     def search(self, build_number: int = False, **kws) -> Build:
         """
         Fetches a specific build from the build history of the job.
+        The build is requested directly, the build history isn't scanned.
 
         :param build_number: The number of the build to fetch.
         :type build_number: int
@@ -320,6 +1089,7 @@ class Builds:
         :type lastCompletedBuild: bool, optional
         :return: The Build object representing the requested build.
         :rtype: :class:`jenkins_pysdk.builds.Build`
+        :raises JenkinsNotFound: If the build was not found.
         """
         if kws:
             return self._fetch_specific(**kws)
@@ -345,7 +1115,7 @@ class Builds:
         else:
             raise JenkinsGeneralException(f"Unknown values - {kws}")
 
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Fields})
 
         if resp_obj.status_code != 200:
             raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch job.")
@@ -353,7 +1123,7 @@ class Builds:
         data = json.loads(resp_obj.content)
         data = self._jenkins._validate_url_returned_from_instance(data)
 
-        return Build(self._jenkins, data['url'])
+        return Build(self._jenkins, data['url'], raw=data)
 
     @property
     def total(self) -> int:
@@ -365,7 +1135,7 @@ class Builds:
         :raises JenkinsGeneralException: If a general exception occurs.
         """
         url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._job_url)
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Numbers})
 
         if resp_obj.status_code != 200:
             raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch job information.")
@@ -377,13 +1147,14 @@ class Builds:
     def iter(self) -> Generator[Build, None, None]:
         """
         Iterate over builds in the build history of the job.
+        The whole history is read with a single request, the builds aren't fetched one by one.
 
         :yield: A Build object representing each build in the build history.
         :rtype: Generator[:class:`jenkins_pysdk.builds.Build`]
         :raises JenkinsGeneralException: If a general exception occurs.
         """
         url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._job_url)
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Iter})
 
         if resp_obj.status_code != 200:
             raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch job information.")
@@ -392,7 +1163,7 @@ class Builds:
         data = self._jenkins._validate_url_returned_from_instance(data)
 
         for build in data.get('builds', []):
-            yield Build(self._jenkins, build['url'])
+            yield Build(self._jenkins, build['url'], raw=build)
 
     def list(self) -> List[Build]:
         """
@@ -404,24 +1175,149 @@ class Builds:
         """
         return [b for b in self.iter()]
 
-    def _fetch_build(self, index: int) -> Build:
+    def _history_page(self, start: int, end: int) -> List[dict]:
         url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._job_url)
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
+        tree = Endpoints.Builds.History.format(start=start, end=end)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": tree})
 
         if resp_obj.status_code != 200:
-            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch last job.")
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build history.")
 
         data = json.loads(resp_obj.content)
         data = self._jenkins._validate_url_returned_from_instance(data)
 
-        if not data.get('builds', []):
-            raise JenkinsGeneralException("This job has no builds.")
+        return data.get('allBuilds', [])
 
-        for build in data.get('builds', []):
-            if int(build['number']) == index:
-                return Build(self._jenkins, build['url'])
-        else:
+    def history(self, page_size: int = 100, *, cursor: int = None, stop_number: int = None,
+                stop_timestamp: int = None) -> Generator[Build, None, None]:
+        """
+        Iterate over the whole build history of the job, newest first, one page at a time.
+        Unlike :meth:`iter`, this isn't limited to the last 100 builds Jenkins lists.
+
+        To read only the builds added since the last run, pass the newest build number seen as ``stop_number``.
+        To resume an interrupted walk, pass the last build number seen as ``cursor``.
+
+        :param page_size: (Default: 100) Number of builds fetched per request.
+        :type page_size: int, optional
+        :param cursor: (Optional) Only yield builds older than this build number.
+        :type cursor: int, optional
+        :param stop_number: (Optional) Stop before the build with this number, or the first older one.
+        :type stop_number: int, optional
+        :param stop_timestamp: (Optional) Stop at the first build started before this timestamp (in milliseconds).
+        :type stop_timestamp: int, optional
+        :yield: Each build in the build history.
+        :rtype: Generator[:class:`jenkins_pysdk.builds.Build`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        if page_size < 1:
+            raise JenkinsGeneralException(f"Page size must be at least 1, not {page_size}.")
+
+        start, page = 0, None
+        if cursor is not None:
+            start, page = self._history_cursor(cursor, page_size)
+
+        while True:
+            if page is None:
+                page = self._history_page(start, start + page_size)
+
+            for build in page:
+                number = int(build['number'])
+                # Skipped by number rather than index, so builds started meanwhile don't shift the walk
+                if cursor is not None and number >= cursor:
+                    continue
+                if stop_number is not None and number <= stop_number:
+                    return
+                if stop_timestamp is not None and int(build['timestamp']) < stop_timestamp:
+                    return
+
+                yield Build(self._jenkins, build['url'], raw=build)
+
+            if len(page) < page_size:
+                return
+            start, page = start + page_size, None
+
+    def _next_build_number(self) -> int:
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._job_url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.NextNumber})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch job information.")
+
+        return int(json.loads(resp_obj.content).get('nextBuildNumber', 1))
+
+    def _history_cursor(self, cursor: int, page_size: int) -> Tuple[int, List[dict]]:
+        # Build numbers only go up, so at most (newest - cursor + 1) builds are newer than the cursor. Deleted builds
+        # put the first older build nearer the top, builds started meanwhile push it down. It is bisected for, one
+        # page at a time, and the page holding it is returned
+        low, high = 0, max(self._next_build_number() - cursor, 0)
+        start = max(high - 1, 0)
+
+        while True:
+            page = self._history_page(start, start + page_size)
+            if page and int(page[0]['number']) >= cursor:
+                if len(page) < page_size or int(page[-1]['number']) < cursor:
+                    return start, page
+                low = start + page_size
+                high = max(high, low)
+            elif start == low:
+                return start, page
+            else:
+                high = start
+
+            start = (low + high) // 2
+
+    def _fetch_build(self, index: int) -> Build:
+        url = self._jenkins._build_url(str(int(index)), prefix=self._job_url, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Fields})
+
+        if resp_obj.status_code == 404:
             raise JenkinsNotFound(f"Build ({index}) was not found.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch build ({index}).")
+
+        data = json.loads(resp_obj.content)
+        data = self._jenkins._validate_url_returned_from_instance(data)
+
+        return Build(self._jenkins, data['url'], raw=data)
+
+    def get_many(self, build_numbers: List[int]) -> List[Build]:
+        """
+        Fetch several builds from the build history of the job at once.
+        Recent builds are read with a single range request instead of one request per build,
+        builds much older than the rest are fetched directly.
+
+        :param build_numbers: The numbers of the builds to fetch.
+        :type build_numbers: List[int]
+        :return: The builds, in the order of the numbers given.
+        :rtype: List[:class:`jenkins_pysdk.builds.Build`]
+        :raises JenkinsNotFound: If any of the builds was not found.
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        numbers = [int(number) for number in build_numbers]
+        if not numbers:
+            return []
+
+        # Build numbers only go up, so build N can't be further than (newest - N) into the history.
+        # The range request reads every build in between, so it only reaches back as far as stays cheap.
+        newest = self._next_build_number() - 1
+        depth = min(newest - min(numbers) + 1, len(set(numbers)) * self._range_span)
+        found = dict()
+        if depth > 0:
+            found = {int(build['number']): build for build in self._history_page(0, depth)}
+
+        missing = []
+        for number in sorted(set(numbers) - found.keys()):
+            if newest - depth < number <= newest:
+                missing.append(number)
+                continue
+            try:
+                found[number] = self._fetch_build(number)._raw
+            except JenkinsNotFound:
+                missing.append(number)
+        if missing:
+            raise JenkinsNotFound(f"Builds ({', '.join(map(str, missing))}) were not found.")
+
+        return [Build(self._jenkins, found[number]['url'], raw=found[number]) for number in numbers]
 
     @property
     def latest(self) -> Build:
@@ -435,7 +1331,7 @@ class Builds:
         # TODO: Add filtering for success=False, failed=False
         url = self._jenkins._build_url(Endpoints.Builds.lastBuild, prefix=self._job_url,
                                        suffix=Endpoints.Instance.Standard)
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Builds.Fields})
 
         if resp_obj.status_code >= 500:
             raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to fetch latest build.")
@@ -443,7 +1339,7 @@ class Builds:
             raise JenkinsNotFound(f"[{resp_obj.status_code}] Latest build not found.")
         data = json.loads(resp_obj.content)
 
-        return Build(self._jenkins, data['url'])
+        return Build(self._jenkins, data['url'], raw=data)
 
     @property
     def oldest(self) -> Build:
@@ -459,7 +1355,7 @@ class Builds:
         except IndexError:
             raise JenkinsNotFound("No builds.")
 
-    def build(self, parameters: Optional[dict] = None, delay: int = 0) -> JenkinsActionObject:
+    def build(self, parameters: Optional[dict] = None, delay: int = 0) -> BuildHandle:
         """
         Trigger a new build for the job with optional parameters.
 
@@ -467,9 +1363,9 @@ class Builds:
         :type parameters: dict, optional
         :param delay: (Default: 0) Delay the build by X seconds
         :type delay: int
-        :return: Result of the build trigger request.
-        :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
-        :raises JenkinsGeneralException: If a general exception occurs.
+        :return: Handle on the triggered build, to wait for it or get its result.
+        :rtype: :class:`jenkins_pysdk.builds.BuildHandle`
+        :raises JenkinsGeneralException: If the build wasn't triggered, or Jenkins didn't return its queue item.
         """
         params = {"delay": f"{delay}sec"}
         endpoint = Endpoints.Builds.buildWithParameters if parameters else Endpoints.Builds.Build
@@ -480,8 +1376,15 @@ class Builds:
         if resp_obj.status_code not in [200, 201]:
             raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to trigger a new build.")
 
+        queue_url = resp_obj.headers.get("Location")
+        if queue_url is None:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Jenkins didn't return the queue item of the "
+                                          f"new build.")
+        queue_url = self._jenkins._validate_url_returned_from_instance({"url": queue_url})['url']
+
         msg = f"[{resp_obj.status_code}] Successfully triggered a new build."
-        obj = JenkinsActionObject(request=req_obj, response=resp_obj, content=msg, status_code=resp_obj.status_code)
+        obj = BuildHandle(self._jenkins, queue_url, request=req_obj, response=resp_obj, content=msg,
+                          status_code=resp_obj.status_code)
 
         return obj
 
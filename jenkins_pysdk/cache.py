@@ -0,0 +1,172 @@
+import re
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Dict
+
+from httpx import URL, Request, Response
+
+__all__ = ["ResponseCache"]
+
+# Connection checks and live log tails must always reach Jenkins
+_NEVER_CACHED = re.compile(r"/login/?$|/logText/progressive(Text|Html)/?$")
+
+
+def _request_key(url: str, params: dict = None) -> Tuple[str, tuple]:
+    """
+    Identify a request by its url, without the query, and its sorted query parameters.
+    """
+    url = URL(url)
+    if params:
+        url = url.copy_merge_params(params)
+    # Helpers sometimes build paths with doubled slashes
+    base = str(url.copy_with(path=re.sub(r"/+", "/", url.path), query=None))
+
+    return base, tuple(sorted(url.params.multi_items()))
+
+
+class ResponseCache:
+    """
+    Thread-safe, size-bounded cache of GET responses.
+
+    Entries are keyed by URL and query parameters (including ``tree``) and expire after a TTL which can be
+    set per endpoint. When the cache is full the least recently used entry is evicted.
+    Any state-changing request (POST, PUT, DELETE...) drops the cached responses of the resource it touched,
+    of everything below it and of the listings above it, e.g. building ``job/a`` invalidates ``job/a/api/json``,
+    ``job/a/1/api/json`` and the root ``api/json``. Login checks and progressive logs are never cached.
+
+    :param ttl: (Default: 5) Seconds a response stays fresh.
+    :type ttl: float
+    :param ttls: (Optional) TTL overrides, mapping a regex searched in the URL path to seconds. 0 disables caching.
+    :type ttls: dict
+    :param max_entries: (Default: 256) Maximum number of cached responses.
+    :type max_entries: int
+    """
+    def __init__(self, *, ttl: float = 5.0, ttls: Dict[str, float] = None, max_entries: int = 256):
+        self.ttl = ttl
+        self.ttls = [(re.compile(pattern), seconds) for pattern, seconds in (ttls or dict()).items()]
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.stats}>"
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Hit, miss, eviction and invalidation counters plus the current number of entries.
+        """
+        with self._lock:
+            return dict(self._stats, size=len(self._entries))
+
+    def get(self, url: str, params: dict = None) -> Optional[Tuple[Request, Response]]:
+        """
+        Get a fresh cached response.
+
+        :param url: The url requested
+        :type url: str
+        :param params: The query parameters requested
+        :type params: dict
+        :return: The cached request and response, or None
+        :rtype: Tuple[httpx.Request, httpx.Response] or None
+        """
+        key = self._key(url, params)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def set(self, url: str, params: dict, request: Request, response: Response) -> None:
+        """
+        Cache a response if its endpoint has a TTL.
+
+        :param url: The url requested
+        :type url: str
+        :param params: The query parameters requested
+        :type params: dict
+        :param request: The request sent
+        :type request: httpx.Request
+        :param response: The response received
+        :type response: httpx.Response
+        """
+        key = self._key(url, params)
+        ttl = self._ttl(key[0])
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, (request, response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, url: str = None) -> None:
+        """
+        Drop cached responses related to a resource, or everything when no url is given.
+
+        :param url: (Optional) Url of the resource which changed
+        :type url: str
+        """
+        with self._lock:
+            if url is None:
+                self._stats["invalidations"] += len(self._entries)
+                self._entries.clear()
+                return
+
+            changed = self._resource(self._key(url)[0])
+            for key in [k for k in self._entries if self._related(self._resource(k[0]), changed)]:
+                del self._entries[key]
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """
+        Drop every cached response and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def _ttl(self, url: str) -> float:
+        path = URL(url).path
+        if _NEVER_CACHED.search(path):
+            return 0
+
+        for pattern, seconds in self.ttls:
+            if pattern.search(path):
+                return seconds
+
+        return self.ttl
+
+    @staticmethod
+    def _key(url: str, params: dict = None) -> Tuple[str, tuple]:
+        return _request_key(url, params)
+
+    @staticmethod
+    def _resource(url: str) -> str:
+        """
+        The resource a url belongs to, e.g. ``.../job/a/`` for ``.../job/a/api/json`` and ``.../job/a/build``.
+        """
+        url = re.sub(r"/api/(json|xml|python)/?$", "/", url)
+        if url.endswith("/"):
+            return url
+
+        return url.rsplit("/", 1)[0] + "/"
+
+    @staticmethod
+    def _related(cached: str, changed: str) -> bool:
+        # Cached below the changed resource, or a listing above it
+        return cached.startswith(changed) or changed.startswith(cached)
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from typing import Any, Callable, Hashable
+
+from jenkins_pysdk.metrics import Metrics
+
+__all__ = ["SingleFlight"]
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Let identical concurrent calls share a single execution.
+
+    The first caller for a key runs the function, callers arriving while it runs wait for it and receive
+    the same result (or exception). Once it finishes the key is forgotten, so nothing is cached.
+    Threads use :meth:`do`, coroutines use :meth:`do_async`.
+
+    :param metrics: (Optional) Metrics counting the calls which were served by another caller, as ``coalesced``.
+    :type metrics: :class:`jenkins_pysdk.metrics.Metrics`
+    """
+    def __init__(self, metrics: Metrics = None):
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self._calls = dict()
+        self._futures = dict()
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run ``fn(*args, **kwargs)``, unless the same key is already running in another thread.
+
+        :param key: Identifies identical calls
+        :type key: Hashable
+        :param fn: The function to run
+        :type fn: Callable
+        :return: The result of the shared call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self._count()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Await ``fn(*args, **kwargs)``, unless the same key is already being awaited by another task.
+
+        :param key: Identifies identical calls
+        :type key: Hashable
+        :param fn: The coroutine function to await
+        :type fn: Callable
+        :return: The result of the shared call
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            self._count()
+            # Shielded so a waiter being cancelled doesn't cancel the call for everyone else
+            return await asyncio.shield(future)
+
+        future = self._futures[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Nobody may be waiting, mark the exception as retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._futures[key]
+
+        return result
+
+    def _count(self):
+        if self.metrics is not None:
+            self.metrics.incr("coalesced")
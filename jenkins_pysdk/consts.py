@@ -1,8 +1,19 @@
 __all__ = ["HTTP_RETRY_COUNT", "HOST_MATCH_REGEX_PATTERN", "HTTP_HEADER_DEFAULT", "Endpoints",
            "XML_HEADER_DEFAULT", "FORM_HEADER_DEFAULT", "XML_POST_HEADER", "Class",
-           "FORM_MULTIPART_HEADER"]
+           "FORM_MULTIPART_HEADER", "HTTP_POOL_MAX_CONNECTIONS", "HTTP_POOL_MAX_KEEPALIVE",
+           "HTTP_POOL_KEEPALIVE_EXPIRY", "HTTP_SAFE_METHODS", "HTTP_IDEMPOTENT_METHODS", "HTTP_RETRY_STATUSES",
+           "HTTP_CONDITIONAL_PATTERNS", "HTTP_DOWNLOAD_CHUNK_SIZE"]
 
 HTTP_RETRY_COUNT = 1
+HTTP_POOL_MAX_CONNECTIONS = 100
+HTTP_POOL_MAX_KEEPALIVE = 20
+HTTP_POOL_KEEPALIVE_EXPIRY = 5.0
+HTTP_SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+HTTP_IDEMPOTENT_METHODS = HTTP_SAFE_METHODS + ("PUT", "DELETE")
+HTTP_RETRY_STATUSES = (429, 502, 503, 504)
+HTTP_CONDITIONAL_PATTERNS = (r"/config\.xml$", r"/api/json$")
+HTTP_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+CONSOLE_MAX_LINE_LENGTH = 1024 * 1024
 HTTP_HEADER_DEFAULT = {"Content-Type": "application/json"}
 XML_HEADER_DEFAULT = {"Content-Type": "application/xml"}
 XML_POST_HEADER = {"Content-Type": "text/xml"}
@@ -30,6 +41,8 @@ class Endpoints:
         Disable = "disable"
         Xml = "config.xml"
         Iter = "jobs[fullName,url,jobs[fullName,url,jobs]]"
+        Children = "jobs[fullName,url,jobs[url]]"
+        ParameterDefaults = "property[parameterDefinitions[name,defaultParameterValue[value]]]"
 
     class Workspace:
         Download = "ws/*zip*/{name}.zip"
@@ -37,6 +50,13 @@ class Endpoints:
         Wipe = "doWipeOutWorkspace"
 
     class Builds:
+        Fields = "number,url,result,timestamp,duration,building,inProgress,description"
+        Iter = f"builds[{Fields}]"
+        Progress = f"{Fields},estimatedDuration"
+        Numbers = "builds[number]"
+        Watch = "{field}[number,building,inProgress,result,duration]{{0,{count}}}"
+        NextNumber = "nextBuildNumber"
+        History = "allBuilds[" + Fields + "]{{{start},{end}}}"
         BuildNumber = "buildNumber"
         BuildConsoleText = "consoleText"
         ProgressiveConsoleText = "logText/progressiveText"
@@ -57,6 +77,11 @@ class Endpoints:
     class Queue:
         Queue = "queue"
         QueueIter = "items[*,task[url,fullName,nextBuildNumber]]{paginate}"
+        Ids = "items[id]"
+        Watch = "items[id,blocked,stuck,why,inQueueSince,task[url,fullName]]"
+        Item = "queue/item/{id}"
+        Cancel = "queue/cancelItem"
+        ItemState = "executable[number,url],cancelled"
 
     class Views:
         View = "view"
@@ -104,6 +129,7 @@ class Endpoints:
         PluginManagerIter = "{p_type}[*[*]]{paginate}"
         Upload = "pluginManager/uploadPlugin"
         Install = "installNecessaryPlugins"
+        Plugin = "plugin/{plugin}"
         Enable = "plugin/{plugin}/makeEnabled"
         Disable = "plugin/{plugin}/makeDisabled"
         Uninstall = "plugin/{plugin}/doUninstall"
@@ -119,6 +145,9 @@ class Endpoints:
         Delete = "doDelete"
         Disable = "toggleOffline"
         Create = "doCreateItem"
+        Fields = "displayName,idle,offline,temporarilyOffline,numExecutors,assignedLabels[name]"
+        Iter = f"computer[{Fields}]"
+        Names = "computer[displayName]"
 
 
 class Class:
@@ -132,3 +161,4 @@ class Class:
     ListView = "hudson.model.ListView"
     MyView = "hudson.model.MyView"
     Dashboard = "hudson.plugins.view.dashboard.Dashboard"
+    BuiltInComputer = "hudson.model.Hudson$MasterComputer"
@@ -1,23 +1,34 @@
 import os
+import re
 import json
+import time
+import asyncio
 import warnings
-from typing import Tuple, Any
+from contextlib import contextmanager, asynccontextmanager
+from typing import Tuple, Any, Union, Optional, Callable, Awaitable, IO, Iterator, AsyncIterator
 
 from httpx import (
     Client,
+    AsyncClient,
+    Limits,
     Request,
     Response,
     HTTPError,
     TimeoutException,
-    HTTPTransport
+    HTTPTransport,
+    AsyncHTTPTransport
 )
 
+from jenkins_pysdk.cache import _request_key
 from jenkins_pysdk.consts import Endpoints
-from jenkins_pysdk.consts import HTTP_HEADER_DEFAULT
+from jenkins_pysdk.consts import HTTP_HEADER_DEFAULT, HTTP_SAFE_METHODS, HTTP_DOWNLOAD_CHUNK_SIZE
 from jenkins_pysdk.exceptions import JenkinsConnectionException
 from jenkins_pysdk.version import version, python_name
 
-__all__ = ["Core"]
+__all__ = ["Core", "AsyncCore"]
+
+# Errors raised while talking to Jenkins, which the retry policy may retry
+_TRANSPORT_ERRORS = (EnvironmentError, HTTPError, TimeoutException)
 
 
 # noinspection PyUnresolvedReferences
@@ -57,7 +68,7 @@ class Core:  # TODO: Revise these messy methods
                     if self.verify:
                         value = value.replace("http://", "https://")
                     # TODO: Make this work for non 8080
-                    value = value.replace("localhost:8080", self.host.lstrip("http://").lstrip("https://"))
+                    value = value.replace("localhost:8080", re.sub(r"^https?://", "", self.host))
                     data[key] = value
                 else:
                     data[key] = self._validate_url_returned_from_instance(value)
@@ -138,58 +149,641 @@ class Core:  # TODO: Revise these messy methods
         :param timeout: request timeout
         :return:
         """
-        if not isinstance(headers, dict):
-            headers = dict()
-
+        headers = dict(headers) if isinstance(headers, dict) else dict()
         headers.update({"User-Agent": f"{python_name}/{version}"})
+        auth = (username or self.username, passw_or_token or self.token or self.passw)
+        # Responses fetched with someone else's credentials are kept out of the shared stores
+        shared = method.upper() == "GET" and not (username or passw_or_token)
+        if shared and self.cache is not None:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                return cached
+
+        exchange = dict(method=method, url=url, headers=headers, params=params, data=data, files=files,
+                        auth=auth, timeout=timeout, shared=shared)
+        if shared and self._single_flight is not None:
+            # Identical GETs already in flight share that response
+            key = (_request_key(url, params), tuple(sorted(headers.items())))
+            return self._single_flight.do(key, self._exchange, **exchange)
+
+        return self._exchange(**exchange)
+
+    def _exchange(self, *, method: str, url: str, headers: dict, params: dict, data: Any, files: dict,
+                  auth: tuple, timeout: int, shared: bool) -> Tuple[Request, Response]:
+        """
+        Send a request through the validators, retry policy and limiter, then update the cache.
+        """
+        validator_key = self.validators.key(url, params) if shared and self.validators is not None else None
+        if validator_key is not None:
+            headers.update(self.validators.conditional_headers(validator_key))
+
+        try:
+            request_obj, resp = self._retrying(method, lambda: self._dispatch(
+                method=method, url=url, headers=headers, params=params, data=data, files=files, auth=auth,
+                timeout=timeout))
+        finally:
+            if self.cache is not None and method.upper() not in HTTP_SAFE_METHODS:
+                # Drop whatever the call may have changed, even if it failed half way
+                self.cache.invalidate(url)
+
+        if validator_key is not None:
+            replayed = self.validators.replay(validator_key, request_obj, resp)
+            if replayed is not None:
+                self.metrics.incr("not_modified")
+                self.metrics.incr("not_modified_bytes", len(replayed.content))
+                resp = replayed
+            else:
+                self.validators.remember(validator_key, resp)
+
+        if shared and self.cache is not None and resp.is_success:
+            self.cache.set(url, params, request_obj, resp)
+
+        return request_obj, resp
+
+    def _retrying(self, method: str, send: Callable[[], Tuple[Request, Response]]) -> Tuple[Request, Response]:
+        """
+        Make attempts with send until the retry policy gives up, each one holding a slot of the limiter.
+        :param method: HTTP method, the retry policy only retries idempotent ones
+        :param send: makes one attempt and returns its request and response
+        :return: request and response of the last attempt
+        """
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            request_obj = resp = error = None
+            if self.limiter is not None:
+                self.metrics.incr("limiter_wait_seconds", self.limiter.acquire())
+
+            sent = time.monotonic()
+            try:
+                request_obj, resp = send()
+            except _TRANSPORT_ERRORS as e:
+                error = e
+            finally:
+                if self.limiter is not None:
+                    self.limiter.release(elapsed=time.monotonic() - sent, response=resp, error=error)
+
+            delay = self.retry.next_delay(method=method, attempt=attempt, started=started,
+                                          response=resp, error=error)
+            if delay is None:
+                break
+
+            attempt += 1
+            self.metrics.incr("retries")
+            self.metrics.incr("retry_backoff_seconds", delay)
+            if resp is not None:
+                resp.close()
+            time.sleep(delay)
+
+        if error is not None:
+            raise JenkinsConnectionException(error)
+
+        return request_obj, resp
+
+    def _dispatch(self, *, method: str, url: str, headers: dict, params: dict, data: Any, files: dict,
+                  auth: tuple, timeout: int) -> Tuple[Request, Response]:
+        """
+        Send a single attempt of a request, refreshing the crumb once if Jenkins rejects it.
+        Transport errors are left to the caller so the retry policy can look at them.
+        """
+        session = self._session
+        # Jenkins only checks crumbs on state-changing requests
+        needs_crumb = not self.token and method.upper() not in HTTP_SAFE_METHODS
+        crumb = None
+
+        for _ in range(2):
+            if needs_crumb:
+                crumb = self._get_crumb(auth, rejected=crumb)
+                headers.update(crumb)
+
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", category=DeprecationWarning)
+                request_obj = session.build_request(method=method,
+                                                    url=url,
+                                                    headers=headers,
+                                                    params=params,
+                                                    data=data,
+                                                    files=files,
+                                                    timeout=timeout if timeout else self.timeout)
+                resp = session.send(request_obj, auth=auth)
+
+            if not (needs_crumb and self._is_crumb_rejected(resp)):
+                break
+
+        return request_obj, resp
+
+    def _download(self, *,
+                  url: str,
+                  destination: Union[str, os.PathLike, IO[bytes]],
+                  params: dict = None,
+                  chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE,
+                  progress: Callable[[int, Optional[int]], Any] = None,
+                  resume: bool = False,
+                  timeout: int = None
+                  ) -> Tuple[Request, Response, int]:
+        """
+        Stream a GET response into a file without holding it in memory.
+        Interrupted transfers are retried with a Range header according to the retry policy.
+        :param url: The url to download
+        :param destination: path or binary file object to write to
+        :param params: request parameters
+        :param chunk_size: bytes written at a time
+        :param progress: called with (bytes written so far, total bytes or None) after every chunk
+        :param resume: continue after the bytes already in the destination, if Jenkins supports ranges
+        :param timeout: request timeout
+        :return: request, response (body already consumed) and number of bytes downloaded
+        """
+        file, owned = self._open_destination(destination, resume)
+        auth = (self.username, self.token or self.passw)
+        offset = file.tell() if resume else 0
+        downloaded = 0
+        started = time.monotonic()
+
+        def send() -> Tuple[Request, Response]:
+            nonlocal offset, downloaded
+            # Each attempt picks up after the bytes already written
+            request_obj = self._session.build_request(method="GET", url=url, params=params,
+                                                      headers=self._range_headers(offset),
+                                                      timeout=timeout if timeout else self.timeout)
+            resp = self._session.send(request_obj, auth=auth, stream=True)
+            try:
+                if self._restart_download(resp, offset):
+                    self._truncate(file)
+                    offset = 0
+                if resp.status_code in (200, 206):
+                    total = self._download_size(resp, offset)
+                    for chunk in resp.iter_bytes(chunk_size):
+                        file.write(chunk)
+                        offset += len(chunk)
+                        downloaded += len(chunk)
+                        if progress is not None:
+                            progress(offset, total)
+            finally:
+                resp.close()
+
+            return request_obj, resp
+
+        try:
+            request_obj, resp = self._retrying("GET", send)
+        finally:
+            self._record_download(downloaded, started)
+            if owned:
+                file.close()
+
+        return request_obj, resp, downloaded
+
+    @contextmanager
+    def _stream(self, *, url: str, params: dict = None, timeout: int = None) -> Iterator[Tuple[Request, Response]]:
+        """
+        Send a GET request without reading its body, which the caller streams with ``iter_bytes``.
+        The connection is closed when the block exits, so a caller which stops early doesn't download the rest.
+        Only sending the request is retried, a transfer interrupted half way raises.
+        :param url: The url to hit
+        :param params: request parameters
+        :param timeout: request timeout
+        :return: request and response, with the body not read yet
+        """
+        auth = (self.username, self.token or self.passw)
+
+        def send() -> Tuple[Request, Response]:
+            request_obj = self._session.build_request(method="GET", url=url, params=params,
+                                                      headers=self._range_headers(0),
+                                                      timeout=timeout if timeout else self.timeout)
+            return request_obj, self._session.send(request_obj, auth=auth, stream=True)
+
+        request_obj, resp = self._retrying("GET", send)
+
+        try:
+            yield request_obj, resp
+        except (HTTPError, TimeoutException) as e:
+            raise JenkinsConnectionException(e)
+        finally:
+            resp.close()
+
+    @staticmethod
+    def _open_destination(destination: Union[str, os.PathLike, IO[bytes]], resume: bool) -> Tuple[IO[bytes], bool]:
+        if hasattr(destination, "write"):
+            return destination, False
 
+        return open(destination, "ab" if resume else "wb"), True
+
+    @staticmethod
+    def _range_headers(offset: int) -> dict:
+        headers = {"User-Agent": f"{python_name}/{version}"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        return headers
+
+    @staticmethod
+    def _restart_download(response: Response, offset: int) -> bool:
+        # Jenkins answers 200 with the whole body when it ignores the Range header
+        return bool(offset) and response.status_code == 200
+
+    @staticmethod
+    def _truncate(file: IO[bytes]) -> None:
+        try:
+            file.seek(0)
+            file.truncate()
+        except (OSError, ValueError):
+            raise JenkinsConnectionException("Jenkins doesn't support resuming and the destination can't be rewound.")
+
+    @staticmethod
+    def _download_size(response: Response, offset: int) -> Optional[int]:
+        content_range = response.headers.get("Content-Range", "")
+        if content_range.rpartition("/")[2].isdigit():
+            return int(content_range.rpartition("/")[2])
+        if response.headers.get("Content-Length", "").isdigit():
+            return offset + int(response.headers["Content-Length"])
+
+        return None
+
+    def _record_download(self, downloaded: int, started: float) -> None:
+        # Throughput is download_bytes / download_seconds
+        self.metrics.incr("download_bytes", downloaded)
+        self.metrics.incr("download_seconds", time.monotonic() - started)
+
+    def _get_crumb(self, auth: tuple, rejected: dict = None) -> dict:
+        """
+        Get the cached crumb headers, fetching them when there are none or Jenkins rejected the cached ones.
+        Crumbs are bound to the user, so they are cached per set of credentials.
+        The session cookies bound to the crumb are kept in the pooled client's cookie jar.
+        :param auth: username and password used to request the crumb
+        :param rejected: crumb headers which Jenkins refused
+        :return: headers to add to the request
+        """
+        with self._crumb_lock:
+            crumb = self._crumbs.get(auth)
+            if crumb is not None and (rejected is None or crumb is not rejected):
+                return crumb
+
+            crumbed_session_req = self._session.build_request(
+                method="GET",
+                url=self._build_url(Endpoints.Instance.Crumb, suffix=Endpoints.Instance.Standard),
+                headers=HTTP_HEADER_DEFAULT,
+            )
+            crumbed_session = self._session.send(crumbed_session_req, auth=auth)
+
+            crumb = self._crumbs[auth] = self._parse_crumb(crumbed_session)
+
+            if rejected is not None:
+                self.metrics.incr("crumb_refreshes")
+
+            return crumb
+
+    @staticmethod
+    def _parse_crumb(response: Response) -> dict:
+        try:
+            crumbed_data = json.loads(response.content)
+            return {crumbed_data['crumbRequestField']: crumbed_data['crumb'],
+                    "x-jenkins-session": response.headers['x-jenkins-session']}
+        except (json.JSONDecodeError, KeyError):
+            raise JenkinsConnectionException("Issue retrieving crumb details.")
+
+    @staticmethod
+    def _is_crumb_rejected(response: Response) -> bool:
+        return response.status_code == 403 and b"No valid crumb" in response.content
+
+    @property
+    def _session(self) -> Client:
+        """
+        The pooled HTTP client shared by every resource class of this instance.
+        Created on first use so that the connection pool is only opened when it is needed.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+
+        return self._client
+
+    def _create_client(self) -> Client:
+        limits = Limits(max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry)
+
+        # Each mounted transport keeps its own pool, so the limits apply per proxied host
         proxies = dict()
         if self.proxies:
             try:
                 for k, v in self.proxies.items():
-                    transport = HTTPTransport(proxy=v)  # transport doesn't work with dictionary comprehension???
+                    transport = HTTPTransport(proxy=v, verify=self.verify, limits=limits)
                     proxies[k] = transport
             except:
                 raise JenkinsConnectionException("Proxy configuration is invalid.")
 
-        with Client(verify=self.verify,
-                    mounts=proxies,
-                    timeout=timeout if timeout else self.timeout,
-                    follow_redirects=True,
-                    auth=(username or self.username,
-                          passw_or_token or self.token or self.passw),
-                    ) as session:
-
-            if not self.token:
-                try:
-                    crumbed_session_req = Request(
-                        method="GET",
-                        url=self._build_url(Endpoints.Instance.Crumb, suffix=Endpoints.Instance.Standard),
-                        headers=HTTP_HEADER_DEFAULT,
-                    )
-                    crumbed_session = session.send(crumbed_session_req)
-                except (EnvironmentError, HTTPError, TimeoutException) as e:
-                    raise JenkinsConnectionException(e)
-
-                try:
-                    crumbed_data = json.loads(crumbed_session.content)
-                    headers.update({crumbed_data['crumbRequestField']: crumbed_data['crumb']})
-                    headers.update({"x-jenkins-session": crumbed_session.headers['x-jenkins-session']})
-                except (json.JSONDecodeError, KeyError):
-                    raise JenkinsConnectionException("Issue retrieving crumb details.")
+        return Client(verify=self.verify,
+                      mounts=proxies,
+                      limits=limits,
+                      timeout=self.timeout,
+                      follow_redirects=True)
 
+    def close(self) -> None:
+        """
+        Close the pooled HTTP client and release its connections.
+        A new pool is opened automatically if the instance is used again.
+        """
+        with self._client_lock:
+            client, self._client = self._client, None
+
+        # The crumb is bound to the session cookies held by the client
+        with self._crumb_lock:
+            self._crumbs.clear()
+
+        if client is not None:
+            client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# noinspection PyUnresolvedReferences
+class AsyncCore(Core):
+    """
+    Asyncio flavour of :class:`Core`. URL helpers are shared, the HTTP layer runs on :class:`httpx.AsyncClient`.
+    """
+    async def _send_http(self, *,
+                         url: str,
+                         method: str = "GET",
+                         headers: dict = HTTP_HEADER_DEFAULT,
+                         params: dict = None,
+                         data: Any = None,
+                         files: dict = None,
+                         username: str = None,
+                         passw_or_token: str = None,
+                         timeout: int = None
+                         ) -> Tuple[Request, Response]:
+        """
+        Async version of :meth:`Core._send_http`.
+        :param url: The url to hit
+        :param method: HTTP method
+        :param headers: request headers
+        :param params: request parameters
+        :param data: request data
+        :param files: upload files
+        :param username: user where authentication is needed
+        :param passw_or_token: password or API token for authentication
+        :param timeout: request timeout
+        :return:
+        """
+        headers = dict(headers) if isinstance(headers, dict) else dict()
+        headers.update({"User-Agent": f"{python_name}/{version}"})
+        auth = (username or self.username, passw_or_token or self.token or self.passw)
+        # Responses fetched with someone else's credentials are kept out of the shared stores
+        shared = method.upper() == "GET" and not (username or passw_or_token)
+        if shared and self.cache is not None:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                return cached
+
+        exchange = dict(method=method, url=url, headers=headers, params=params, data=data, files=files,
+                        auth=auth, timeout=timeout, shared=shared)
+        if shared and self._single_flight is not None:
+            # Identical GETs already in flight share that response
+            key = (_request_key(url, params), tuple(sorted(headers.items())))
+            return await self._single_flight.do_async(key, self._exchange, **exchange)
+
+        return await self._exchange(**exchange)
+
+    async def _exchange(self, *, method: str, url: str, headers: dict, params: dict, data: Any, files: dict,
+                        auth: tuple, timeout: int, shared: bool) -> Tuple[Request, Response]:
+        validator_key = self.validators.key(url, params) if shared and self.validators is not None else None
+        if validator_key is not None:
+            headers.update(self.validators.conditional_headers(validator_key))
+
+        try:
+            request_obj, resp = await self._retrying(method, lambda: self._dispatch(
+                method=method, url=url, headers=headers, params=params, data=data, files=files, auth=auth,
+                timeout=timeout))
+        finally:
+            if self.cache is not None and method.upper() not in HTTP_SAFE_METHODS:
+                # Drop whatever the call may have changed, even if it failed half way
+                self.cache.invalidate(url)
+
+        if validator_key is not None:
+            replayed = self.validators.replay(validator_key, request_obj, resp)
+            if replayed is not None:
+                self.metrics.incr("not_modified")
+                self.metrics.incr("not_modified_bytes", len(replayed.content))
+                resp = replayed
+            else:
+                self.validators.remember(validator_key, resp)
+
+        if shared and self.cache is not None and resp.is_success:
+            self.cache.set(url, params, request_obj, resp)
+
+        return request_obj, resp
+
+    async def _retrying(self, method: str,
+                        send: Callable[[], Awaitable[Tuple[Request, Response]]]) -> Tuple[Request, Response]:
+        """
+        Async version of :meth:`Core._retrying`, send returns an awaitable.
+        """
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            request_obj = resp = error = None
+            if self.limiter is not None:
+                self.metrics.incr("limiter_wait_seconds", await self.limiter.acquire_async())
+
+            sent = time.monotonic()
+            try:
+                request_obj, resp = await send()
+            except _TRANSPORT_ERRORS as e:
+                error = e
+            finally:
+                if self.limiter is not None:
+                    self.limiter.release(elapsed=time.monotonic() - sent, response=resp, error=error)
+
+            delay = self.retry.next_delay(method=method, attempt=attempt, started=started,
+                                          response=resp, error=error)
+            if delay is None:
+                break
+
+            attempt += 1
+            self.metrics.incr("retries")
+            self.metrics.incr("retry_backoff_seconds", delay)
+            if resp is not None:
+                await resp.aclose()
+            await asyncio.sleep(delay)
+
+        if error is not None:
+            raise JenkinsConnectionException(error)
+
+        return request_obj, resp
+
+    async def _dispatch(self, *, method: str, url: str, headers: dict, params: dict, data: Any, files: dict,
+                        auth: tuple, timeout: int) -> Tuple[Request, Response]:
+        session = self._session
+        needs_crumb = not self.token and method.upper() not in HTTP_SAFE_METHODS
+        crumb = None
+
+        for _ in range(2):
+            if needs_crumb:
+                crumb = await self._get_crumb(auth, rejected=crumb)
+                headers.update(crumb)
+
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", category=DeprecationWarning)
+                request_obj = session.build_request(method=method,
+                                                    url=url,
+                                                    headers=headers,
+                                                    params=params,
+                                                    data=data,
+                                                    files=files,
+                                                    timeout=timeout if timeout else self.timeout)
+                resp = await session.send(request_obj, auth=auth)
+
+            if not (needs_crumb and self._is_crumb_rejected(resp)):
+                break
+
+        return request_obj, resp
+
+    async def _download(self, *,
+                        url: str,
+                        destination: Union[str, os.PathLike, IO[bytes]],
+                        params: dict = None,
+                        chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE,
+                        progress: Callable[[int, Optional[int]], Any] = None,
+                        resume: bool = False,
+                        timeout: int = None
+                        ) -> Tuple[Request, Response, int]:
+        """
+        Async version of :meth:`Core._download`.
+        """
+        file, owned = self._open_destination(destination, resume)
+        auth = (self.username, self.token or self.passw)
+        offset = file.tell() if resume else 0
+        downloaded = 0
+        started = time.monotonic()
+
+        async def send() -> Tuple[Request, Response]:
+            nonlocal offset, downloaded
+            request_obj = self._session.build_request(method="GET", url=url, params=params,
+                                                      headers=self._range_headers(offset),
+                                                      timeout=timeout if timeout else self.timeout)
+            resp = await self._session.send(request_obj, auth=auth, stream=True)
             try:
-                with warnings.catch_warnings():
-                    warnings.filterwarnings("ignore", category=DeprecationWarning)
-                    request_obj = Request(method=method,
-                                          url=url,
-                                          headers=headers,
-                                          params=params,
-                                          data=data,
-                                          files=files,
-                                          cookies=crumbed_session.cookies if not self.token else None)
-                    resp = session.send(request_obj)
-            except (EnvironmentError, HTTPError, TimeoutException) as e:
-                raise JenkinsConnectionException(e)
+                if self._restart_download(resp, offset):
+                    self._truncate(file)
+                    offset = 0
+                if resp.status_code in (200, 206):
+                    total = self._download_size(resp, offset)
+                    async for chunk in resp.aiter_bytes(chunk_size):
+                        file.write(chunk)
+                        offset += len(chunk)
+                        downloaded += len(chunk)
+                        if progress is not None:
+                            progress(offset, total)
+            finally:
+                await resp.aclose()
 
             return request_obj, resp
+
+        try:
+            request_obj, resp = await self._retrying("GET", send)
+        finally:
+            self._record_download(downloaded, started)
+            if owned:
+                file.close()
+
+        return request_obj, resp, downloaded
+
+    @asynccontextmanager
+    async def _stream(self, *, url: str, params: dict = None,
+                      timeout: int = None) -> AsyncIterator[Tuple[Request, Response]]:
+        """
+        Async version of :meth:`Core._stream`, the caller streams the body with ``aiter_bytes``.
+        """
+        auth = (self.username, self.token or self.passw)
+
+        async def send() -> Tuple[Request, Response]:
+            request_obj = self._session.build_request(method="GET", url=url, params=params,
+                                                      headers=self._range_headers(0),
+                                                      timeout=timeout if timeout else self.timeout)
+            return request_obj, await self._session.send(request_obj, auth=auth, stream=True)
+
+        request_obj, resp = await self._retrying("GET", send)
+
+        try:
+            yield request_obj, resp
+        except (HTTPError, TimeoutException) as e:
+            raise JenkinsConnectionException(e)
+        finally:
+            await resp.aclose()
+
+    async def _get_crumb(self, auth: tuple, rejected: dict = None) -> dict:
+        # Created lazily so the lock binds to the running event loop
+        if self._crumb_lock is None:
+            self._crumb_lock = asyncio.Lock()
+
+        async with self._crumb_lock:
+            crumb = self._crumbs.get(auth)
+            if crumb is not None and (rejected is None or crumb is not rejected):
+                return crumb
+
+            crumbed_session_req = self._session.build_request(
+                method="GET",
+                url=self._build_url(Endpoints.Instance.Crumb, suffix=Endpoints.Instance.Standard),
+                headers=HTTP_HEADER_DEFAULT,
+            )
+            crumbed_session = await self._session.send(crumbed_session_req, auth=auth)
+
+            crumb = self._crumbs[auth] = self._parse_crumb(crumbed_session)
+
+            if rejected is not None:
+                self.metrics.incr("crumb_refreshes")
+
+            return crumb
+
+    @property
+    def _session(self) -> AsyncClient:
+        if self._client is None:
+            self._client = self._create_client()
+
+        return self._client
+
+    def _create_client(self) -> AsyncClient:
+        limits = Limits(max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry)
+
+        proxies = dict()
+        if self.proxies:
+            try:
+                for k, v in self.proxies.items():
+                    transport = AsyncHTTPTransport(proxy=v, verify=self.verify, limits=limits)
+                    proxies[k] = transport
+            except:
+                raise JenkinsConnectionException("Proxy configuration is invalid.")
+
+        return AsyncClient(verify=self.verify,
+                           mounts=proxies,
+                           limits=limits,
+                           timeout=self.timeout,
+                           follow_redirects=True)
+
+    async def close(self) -> None:
+        """
+        Close the pooled HTTP client and release its connections.
+        A new pool is opened automatically if the instance is used again.
+        """
+        client, self._client = self._client, None
+        self._crumbs.clear()
+
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self):
+        raise TypeError(f"Use 'async with' with {self.__class__.__name__}.")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,7 +1,8 @@
 
 __all__ = ["JenkinsInvalidHost", "JenkinsConnectionException", "JenkinsUnauthorisedException", "JenkinsRestartFailed",
            "JenkinsActionFailed", "JenkinsGeneralException", "JenkinsWrongAuthenticationMethod",
-           "JenkinsAlreadyExists", "JenkinsNotFound", "JenkinsBaseException", "JenkinsEmptyQueue"]
+           "JenkinsAlreadyExists", "JenkinsNotFound", "JenkinsBaseException", "JenkinsEmptyQueue",
+           "JenkinsQueueItemCancelled"]
 
 
 class ExceptionHandler(Exception):
@@ -72,3 +73,9 @@ class JenkinsEmptyQueue(JenkinsBaseException):
     """
     Exception raised when the job queue is empty in Jenkins.
     """
+
+
+class JenkinsQueueItemCancelled(JenkinsBaseException):
+    """
+    Exception raised when a queue item is cancelled before it starts a build.
+    """
@@ -2,7 +2,7 @@ import re
 import time
 import json
 import threading
-from typing import Optional
+from typing import Optional, Union
 
 import os, sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -12,15 +12,26 @@ from jenkins_pysdk.core import Core
 from jenkins_pysdk.consts import (
     Endpoints,
     FORM_HEADER_DEFAULT,
-    Class
+    Class,
+    HTTP_POOL_MAX_CONNECTIONS,
+    HTTP_POOL_MAX_KEEPALIVE,
+    HTTP_POOL_KEEPALIVE_EXPIRY
 )
 from jenkins_pysdk.exceptions import (
     JenkinsConnectionException,
     JenkinsUnauthorisedException,
     JenkinsRestartFailed,
     JenkinsActionFailed,
-    JenkinsGeneralException
+    JenkinsGeneralException,
+    JenkinsNotFound
 )
+from jenkins_pysdk.metrics import Metrics
+from jenkins_pysdk.retry import RetryPolicy
+from jenkins_pysdk.limiter import AdaptiveLimiter
+from jenkins_pysdk.cache import ResponseCache
+from jenkins_pysdk.validators import ValidatorStore
+from jenkins_pysdk.coalesce import SingleFlight
+from jenkins_pysdk.query import Tree, Field, Record
 from jenkins_pysdk.objects import JenkinsConnectObject, JenkinsActionObject
 from jenkins_pysdk.objects import Views as r_views, Jobs as r_jobs, Folders as r_folders
 from jenkins_pysdk.jobs import Jobs, Folders
@@ -54,6 +65,24 @@ class Jenkins(Core):
     :type port: int, optional
     :param timeout: Specify the connection timeout in seconds. Defaults to 30.
     :type timeout: int, optional
+    :param max_connections: Maximum number of pooled connections to the instance (or to each proxy). Defaults to 100.
+    :type max_connections: int, optional
+    :param max_keepalive_connections: Maximum number of idle connections kept alive in the pool. Defaults to 20.
+    :type max_keepalive_connections: int, optional
+    :param keepalive_expiry: Seconds an idle connection is kept alive before being closed. Defaults to 5.
+    :type keepalive_expiry: float, optional
+    :param retry: How transient failures are retried. Defaults to one retry of idempotent requests.
+    :type retry: :class:`jenkins_pysdk.retry.RetryPolicy`, optional
+    :param limiter: Paces requests so the controller is not overloaded. Defaults to None (no limit).
+    :type limiter: :class:`jenkins_pysdk.limiter.AdaptiveLimiter`, optional
+    :param cache: Cache for GET responses. Defaults to None (no caching).
+    :type cache: :class:`jenkins_pysdk.cache.ResponseCache`, optional
+    :param validators: Store of ETag/Last-Modified validators used for conditional GETs. Defaults to None.
+    :type validators: :class:`jenkins_pysdk.validators.ValidatorStore`, optional
+    :param coalesce: Let identical concurrent GETs share one request. Defaults to False.
+    :type coalesce: bool, optional
+    :param lazy: Skip the connection test on creation and only set up sub-APIs when they are first used. Defaults to False.
+    :type lazy: bool, optional
     """
 
     def __init__(self, *,
@@ -64,7 +93,16 @@ class Jenkins(Core):
                  verify: Optional[bool] = True,
                  proxies: dict = None,
                  port: int = 443,
-                 timeout: int = 30):
+                 timeout: int = 30,
+                 max_connections: int = HTTP_POOL_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = HTTP_POOL_MAX_KEEPALIVE,
+                 keepalive_expiry: float = HTTP_POOL_KEEPALIVE_EXPIRY,
+                 retry: RetryPolicy = None,
+                 limiter: AdaptiveLimiter = None,
+                 cache: ResponseCache = None,
+                 validators: ValidatorStore = None,
+                 coalesce: bool = False,
+                 lazy: bool = False):
         self.host = host
         self.username = username
         self.passw = passw
@@ -73,23 +111,57 @@ class Jenkins(Core):
         self.proxies = proxies
         self.port = port
         self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.limiter = limiter
+        self.cache = cache
+        self.validators = validators
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._crumbs = {}
+        self._crumb_lock = threading.Lock()
+        self._metrics = Metrics()
+        self._single_flight = SingleFlight(self._metrics) if coalesce else None
 
         self.host = re.sub(r":\d+", f":{port}", host)
         if not self.host.endswith(f":{port}"):
             self.host += f":{port}"
 
-        # Extend functionality
-        self._jobs = Jobs(self)
-        self._folders = Folders(self)
-        self._views = Views(self)
-        self._credentials = Credentials(self)
-        self._plugins = Plugins(self)
-        self._nodes = Nodes(self)
-        self._queue = Queue(self)
-        self._users = Users(self)  # Define Users last as it requires Plugins
+        # Extend functionality, each sub-API is created on first use
+        self._api_lock = threading.Lock()
+        self._version = None
+        self._jobs = None
+        self._folders = None
+        self._views = None
+        self._credentials = None
+        self._plugins = None
+        self._nodes = None
+        self._queue = None
+        self._users = None
+
+        if lazy:
+            return
 
         # Test connection
-        self.connect()
+        try:
+            self.connect()
+            self.users  # Checks the version requirements
+        except Exception:
+            self.close()
+            raise
+
+    def _sub_api(self, attr: str, cls: type):
+        api = getattr(self, attr)
+        if api is None:
+            with self._api_lock:
+                api = getattr(self, attr)
+                if api is None:
+                    api = cls(self)
+                    setattr(self, attr, api)
+
+        return api
 
     @property
     def jobs(self) -> Jobs:
@@ -99,7 +171,7 @@ class Jenkins(Core):
         :return: A Jobs object representing the jobs on the system.
         :rtype: :class:`jenkins_pysdk.jobs.Jobs`
         """
-        return self._jobs
+        return self._sub_api("_jobs", Jobs)
 
     @property
     def folders(self) -> Folders:
@@ -109,7 +181,7 @@ class Jenkins(Core):
         :return: A Folders object representing the folders on the system.
         :rtype: :class:`jenkins_pysdk.jobs.Folders`
         """
-        return self._folders
+        return self._sub_api("_folders", Folders)
 
     @property
     def views(self) -> Views:
@@ -119,7 +191,7 @@ class Jenkins(Core):
         :return: A Views object representing the views on the system.
         :rtype: :class:`jenkins_pysdk.views.Views`
         """
-        return self._views
+        return self._sub_api("_views", Views)
 
     @property
     def credentials(self) -> Credentials:
@@ -129,16 +201,53 @@ class Jenkins(Core):
         :return: A Credentials object representing the credentials on the system.
         :rtype: :class:`jenkins_pysdk.credentials.Credentials`
         """
-        return self._credentials
+        return self._sub_api("_credentials", Credentials)
 
-    def api(self, query: str):
+    @property
+    def metrics(self) -> Metrics:
         """
-        Run a custom query and return the relevant data objects.
+        Counters describing the HTTP traffic of this instance, e.g. ``metrics["crumb_refreshes"]``.
+
+        :return: The metrics of this instance.
+        :rtype: :class:`jenkins_pysdk.metrics.Metrics`
+        """
+        return self._metrics
 
+    def api(self, query: Union[str, Tree, Field] = None, *, path: str = "", depth: int = None) -> Record:
+        """
+        Run a custom query and return the relevant data objects.
+        Only the fields in the query are sent by Jenkins, which keeps payloads and parsing small.
+
+        :param query: (Optional) The tree query, e.g. ``Tree("numExecutors", Field("jobs", "name")[0:10])``
+                      or ``"numExecutors,jobs[name]{0,10}"``. Everything is returned when omitted.
+        :type query: str or :class:`jenkins_pysdk.query.Tree` or :class:`jenkins_pysdk.query.Field`
+        :param path: (Optional) Path of the resource to query, e.g. ``job/folder1/job/job1/3``. Defaults to the instance.
+        :type path: str, optional
+        :param depth: (Optional) How deep nested objects are expanded when no query is given.
+        :type depth: int, optional
         :return: Data objects representing the resource requested.
+        :rtype: :class:`jenkins_pysdk.query.Record`
+        :raises JenkinsNotFound: If the resource doesn't exist.
+        :raises JenkinsGeneralException: If a general exception occurs.
         """
-        # TODO: Allow the user to enter their own query parameters
-        raise NotImplementedError
+        params = dict()
+        if query is not None:
+            params["tree"] = str(query)
+        if depth is not None:
+            params["depth"] = depth
+
+        prefix = self._build_url(path.strip("/")) if path.strip("/") else None
+        url = self._build_url(Endpoints.Instance.Standard, prefix=prefix)
+        req_obj, resp_obj = self._send_http(url=url, params=params)
+
+        if resp_obj.status_code == 404:
+            raise JenkinsNotFound(f"[{resp_obj.status_code}] {path or self.host} was not found.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to run query ({query}).")
+
+        data = json.loads(resp_obj.content)
+
+        return Record(self._validate_url_returned_from_instance(data))
 
     @property
     def ListView(self) -> r_views:
@@ -234,6 +343,7 @@ class Jenkins(Core):
         code = int(response_obj.status_code)
 
         if code == 200:
+            self._version = response_obj.headers.get('x-jenkins', self._version)
             return self._create_return_object(req_obj, response_obj, f"[{code}] Successfully connected to {self.host}.")
 
         if code == 400:
@@ -292,7 +402,7 @@ class Jenkins(Core):
         :return: A Users object representing the users on the system.
         :rtype: :class:`jenkins_pysdk.users.Users`
         """
-        return self._users
+        return self._sub_api("_users", Users)
 
     @property
     def me(self) -> User:
@@ -313,7 +423,7 @@ class Jenkins(Core):
         :return: A Plugins object representing the plugins on the system.
         :rtype: :class:`jenkins_pysdk.plugins.Plugins`
         """
-        return self._plugins
+        return self._sub_api("_plugins", Plugins)
 
     @property
     def nodes(self) -> Nodes:
@@ -323,7 +433,7 @@ class Jenkins(Core):
         :return: A Nodes object representing the nodes on the system.
         :rtype: :class:`jenkins_pysdk.nodes.Nodes`
         """
-        return self._nodes
+        return self._sub_api("_nodes", Nodes)
 
     @property
     def queue(self) -> Queue:
@@ -333,7 +443,7 @@ class Jenkins(Core):
         :return: A Queue object representing the queue on the system.
         :rtype: :class:`jenkins_pysdk.queues.Queue`
         """
-        return self._queue
+        return self._sub_api("_queue", Queue)
 
     @property
     def version(self) -> str:
@@ -346,8 +456,9 @@ class Jenkins(Core):
         # TODO: Finish me
         url = self._build_url(Endpoints.Instance.Connect)
         req_obj, resp_obj = self._send_http(url=url)
+        self._version = resp_obj.headers['x-jenkins']
 
-        return resp_obj.headers['x-jenkins']
+        return self._version
 
     @property
     def available_executors(self) -> int:
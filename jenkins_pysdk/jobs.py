@@ -1,20 +1,24 @@
 import json
-from typing import List, Generator
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Iterable, Iterator, Optional, Generator, Union
 
 from jenkins_pysdk.objects import JenkinsValidateJob, JenkinsActionObject
 from jenkins_pysdk.objects import Jobs as r_jobs, Folders as r_folders
-from jenkins_pysdk.exceptions import JenkinsNotFound, JenkinsGeneralException
+from jenkins_pysdk.exceptions import JenkinsNotFound, JenkinsGeneralException, JenkinsAlreadyExists
 from jenkins_pysdk.consts import (
     Endpoints,
     Class,
     XML_HEADER_DEFAULT,
     XML_POST_HEADER
 )
+from jenkins_pysdk.core import Core
 from jenkins_pysdk.builders import Builder
-from jenkins_pysdk.builds import Builds
+from jenkins_pysdk.query import Tree, Field, Record
+from jenkins_pysdk.builds import Builds, BuildHandle
 from jenkins_pysdk.workspace import Workspace
 
-__all__ = ["Jobs", "Folders", "Job", "Folder"]
+__all__ = ["Jobs", "Folders", "Job", "Folder", "TriggerResults"]
 
 
 class Job:
@@ -173,6 +177,83 @@ class Job:
         return Workspace(self._jenkins, name, self._job_url)
 
 
+class TriggerResults:
+    """
+    Outcome of :meth:`jenkins_pysdk.jobs.Jobs.trigger_many`, in the order the builds were requested.
+
+    :param requested: The (job path, parameters) pairs which were requested.
+    :type requested: List[Tuple[str, Optional[dict]]]
+    :param handles: The handle of each triggered build, None where triggering failed.
+    :type handles: List[Optional[:class:`jenkins_pysdk.builds.BuildHandle`]]
+    :param errors: Why triggering failed, by position in the request.
+    :type errors: Dict[int, Exception]
+    :param elapsed: Seconds the whole batch took.
+    :type elapsed: float
+    """
+    def __init__(self, requested: List[Tuple[str, Optional[dict]]], handles: List[Optional[BuildHandle]],
+                 errors: Dict[int, Exception], elapsed: float):
+        self.requested = requested
+        self.handles = handles
+        self.errors = errors
+        self.elapsed = elapsed
+
+    def __iter__(self) -> Iterator[Tuple[str, Optional[dict], Optional[BuildHandle], Optional[Exception]]]:
+        for i, (job_path, parameters) in enumerate(self.requested):
+            yield job_path, parameters, self.handles[i], self.errors.get(i)
+
+    def __len__(self) -> int:
+        return len(self.requested)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.succeeded} triggered, {self.failed} failed>"
+
+    @property
+    def succeeded(self) -> int:
+        """
+        The number of builds triggered.
+
+        :return: The number of builds triggered.
+        :rtype: int
+        """
+        return len(self.requested) - len(self.errors)
+
+    @property
+    def failed(self) -> int:
+        """
+        The number of builds which couldn't be triggered.
+
+        :return: The number of failures.
+        :rtype: int
+        """
+        return len(self.errors)
+
+    @property
+    def throughput(self) -> float:
+        """
+        The number of builds triggered per second.
+
+        :return: Builds triggered per second.
+        :rtype: float
+        """
+        return self.succeeded / self.elapsed if self.elapsed > 0 else float(self.succeeded)
+
+
+def _parameters_key(parameters: Optional[dict]) -> frozenset:
+    # Jenkins shows booleans lowercase in the queue
+    return frozenset((str(name), str(value).lower() if isinstance(value, bool) else str(value))
+                     for name, value in (parameters or {}).items())
+
+
+def _full_name(job_path: str) -> str:
+    # "job/a/job/b", "/a/b/" and "a/b" all name the job Jenkins lists as "a/b"
+    return Core._build_job_http_path(job_path).replace("/job/", "/").strip("/")
+
+
+def _queued_parameters_key(params: Optional[str]) -> frozenset:
+    # Queue items list their parameters as "\nname=value\nname=value"
+    return frozenset(tuple(line.split("=", 1)) for line in (params or "").splitlines() if "=" in line)
+
+
 class Jobs:
     def __init__(self, jenkins):
         """
@@ -226,6 +307,93 @@ class Jobs:
 
         return False
 
+    def trigger_many(self, builds: Iterable[Tuple[str, Optional[dict]]], *, max_workers: int = 8,
+                     delay: int = 0, skip_queued: bool = True) -> TriggerResults:
+        """
+        Trigger many builds concurrently, from a bounded pool of threads.
+        A failure is recorded for its build and doesn't stop the others. Requests still go through the client's
+        limiter, if it has one.
+
+        :param builds: (job path, parameters) pairs, parameters can be None.
+        :type builds: Iterable[Tuple[str, Optional[dict]]]
+        :param max_workers: (Default: 8) Most builds triggered at the same time.
+        :type max_workers: int, optional
+        :param delay: (Default: 0) Delay the builds by X seconds
+        :type delay: int, optional
+        :param skip_queued: (Default: True) Refuse builds whose job and parameters are already queued,
+                            or were requested earlier in the batch. Parameters left out are compared with their
+                            default values, read once per job.
+        :type skip_queued: bool, optional
+        :return: The handle or error of each build, and the throughput of the batch.
+        :rtype: :class:`jenkins_pysdk.jobs.TriggerResults`
+        :raises JenkinsGeneralException: If the queue couldn't be read.
+        """
+        requested = [(str(job_path), parameters) for job_path, parameters in builds]
+        handles = [None] * len(requested)
+        errors = dict()
+        started = time.monotonic()
+
+        pending = list()
+        if skip_queued:
+            seen = {(item._queue_info['task'].get('fullName', ""),
+                     _queued_parameters_key(item._queue_info.get('params')))
+                    for item in self._jenkins.queue.snapshot()}
+            names = [_full_name(job_path) for job_path, _ in requested]
+            # Defaults only matter for jobs which can be compared: queued ones, or requested more than once
+            compared, once = {name for name, _ in seen}, set()
+            for name in names:
+                (compared if name in once else once).add(name)
+            defaults = dict()
+        for i, (job_path, parameters) in enumerate(requested):
+            if skip_queued:
+                full_name = names[i]
+                parameters = dict(parameters or {})
+                if full_name in compared:
+                    if full_name not in defaults:
+                        defaults[full_name] = self._parameter_defaults(full_name)
+                    # Queued items list every parameter, defaults included
+                    parameters = {**defaults[full_name], **parameters}
+                key = (full_name, _parameters_key(parameters))
+                if key in seen:
+                    errors[i] = JenkinsAlreadyExists(f"A build of {job_path} with the same parameters is already "
+                                                     f"queued.")
+                    continue
+                seen.add(key)
+            pending.append(i)
+
+        def trigger(i: int) -> BuildHandle:
+            job_path, parameters = requested[i]
+            job_url = self._jenkins._build_url(self._jenkins._build_job_http_path(job_path))
+            return Builds(self._jenkins, job_url).build(parameters, delay=delay)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {i: pool.submit(trigger, i) for i in pending}
+            for i, future in futures.items():
+                try:
+                    handles[i] = future.result()
+                except Exception as e:
+                    errors[i] = e
+
+        return TriggerResults(requested, handles, errors, time.monotonic() - started)
+
+    def _parameter_defaults(self, full_name: str) -> dict:
+        url = self._jenkins._build_url(self._jenkins._build_job_http_path(full_name),
+                                       suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Jobs.ParameterDefaults})
+
+        if resp_obj.status_code != 200:
+            # Left to fail when the build is triggered
+            return dict()
+
+        defaults = dict()
+        for prop in json.loads(resp_obj.content).get('property', []):
+            for definition in prop.get('parameterDefinitions') or []:
+                value = (definition.get('defaultParameterValue') or {}).get('value')
+                if value is not None:
+                    defaults[definition['name']] = value
+
+        return defaults
+
     def _validate_job(self, job_path: str) -> JenkinsValidateJob:
         # TODO: Review mess
         job = self._jenkins._build_job_http_path(job_path)
@@ -391,13 +559,23 @@ class Jobs:
         """
         raise NotImplementedError
 
-    def api(self):
+    def api(self, query: Union[str, Tree, Field] = None, *, path: str = None, depth: int = None) -> Record:
         """
         Run your own query and return jobs data objects.
 
+        :param query: (Optional) The tree query, e.g. ``Tree("name", Field("builds", "number", "result")[0:5])``.
+        :type query: str or :class:`jenkins_pysdk.query.Tree` or :class:`jenkins_pysdk.query.Field`
+        :param path: (Optional) Path of the job to query. Defaults to the top level of the instance.
+        :type path: str, optional
+        :param depth: (Optional) How deep nested objects are expanded when no query is given.
+        :type depth: int, optional
         :return: Jobs data objects.
+        :rtype: :class:`jenkins_pysdk.query.Record`
+        :raises JenkinsNotFound: If the job doesn't exist.
         """
-        raise NotImplementedError
+        path = self._jenkins._build_job_http_path(path) if path else ""
+
+        return self._jenkins.api(query, path=path, depth=depth)
 
 
 class Folder:
@@ -761,10 +939,20 @@ class Folders:
         """
         raise NotImplementedError
 
-    def api(self):
+    def api(self, query: Union[str, Tree, Field] = None, *, path: str = None, depth: int = None) -> Record:
         """
-        Run a custom query and return folder data objects.
+        Run your own query and return folders data objects.
 
-        :return: Data objects representing folders.
+        :param query: (Optional) The tree query, e.g. ``Field("jobs", "name", "url")``.
+        :type query: str or :class:`jenkins_pysdk.query.Tree` or :class:`jenkins_pysdk.query.Field`
+        :param path: (Optional) Path of the folder to query. Defaults to the top level of the instance.
+        :type path: str, optional
+        :param depth: (Optional) How deep nested objects are expanded when no query is given.
+        :type depth: int, optional
+        :return: Folders data objects.
+        :rtype: :class:`jenkins_pysdk.query.Record`
+        :raises JenkinsNotFound: If the folder doesn't exist.
         """
-        raise NotImplementedError
+        path = self._jenkins._build_job_http_path(path) if path else ""
+
+        return self._jenkins.api(query, path=path, depth=depth)
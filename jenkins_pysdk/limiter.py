@@ -0,0 +1,172 @@
+import time
+import asyncio
+import threading
+from typing import Optional, Dict
+
+from httpx import Response, TimeoutException
+
+__all__ = ["AdaptiveLimiter"]
+
+
+class AdaptiveLimiter:
+    """
+    Client-side limiter which keeps the SDK from overloading the Jenkins controller.
+
+    Requests are paced by a token bucket (``rate`` requests per second, bursts of up to ``burst``)
+    and capped by a concurrency window which follows AIMD: the window shrinks multiplicatively when
+    Jenkins answers 429/503 or times out, and grows by about one slot for every window's worth of fast
+    successful responses. The same limiter works for :class:`jenkins_pysdk.jenkins.Jenkins` and
+    :class:`jenkins_pysdk.async_jenkins.AsyncJenkins` and may be shared by several instances, across threads
+    and event loops.
+
+    :param rate: (Optional) Maximum requests per second. Unlimited when None.
+    :type rate: float
+    :param burst: (Optional) Size of the token bucket. Defaults to one second worth of requests.
+    :type burst: int
+    :param max_concurrency: (Default: 32) Upper bound of the concurrency window.
+    :type max_concurrency: int
+    :param min_concurrency: (Default: 1) Lower bound of the concurrency window.
+    :type min_concurrency: int
+    :param initial_concurrency: (Optional) Starting concurrency window. Defaults to max_concurrency.
+    :type initial_concurrency: int
+    :param decrease: (Default: 0.5) Factor applied to the window on overload.
+    :type decrease: float
+    :param fast_response: (Default: 1) Responses quicker than this many seconds grow the window.
+    :type fast_response: float
+    """
+    def __init__(self, *,
+                 rate: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 max_concurrency: int = 32,
+                 min_concurrency: int = 1,
+                 initial_concurrency: Optional[int] = None,
+                 decrease: float = 0.5,
+                 fast_response: float = 1.0):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("min_concurrency must be between 1 and max_concurrency.")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease = decrease
+        self.fast_response = fast_response
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        # Event loops with coroutines waiting for a slot, and the event they wait on
+        self._async_released: Dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
+        self._window = float(initial_concurrency or max_concurrency)
+        self._in_flight = 0
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} rate={self.rate} window={self.window} in_flight={self._in_flight}>"
+
+    @property
+    def window(self) -> int:
+        """
+        Number of requests currently allowed in flight.
+        """
+        return max(self.min_concurrency, int(self._window))
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of requests currently in flight.
+        """
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        :return: Seconds spent waiting.
+        :rtype: float
+        """
+        started = time.monotonic()
+
+        with self._released:
+            while self._in_flight >= self.window:
+                self._released.wait()
+            self._in_flight += 1
+            delay = self._take_token()
+
+        if delay:
+            time.sleep(delay)
+
+        return time.monotonic() - started
+
+    async def acquire_async(self) -> float:
+        """
+        Async version of :meth:`acquire`, waits without blocking the event loop.
+
+        :return: Seconds spent waiting.
+        :rtype: float
+        """
+        started = time.monotonic()
+
+        while True:
+            with self._lock:
+                if self._in_flight < self.window:
+                    self._in_flight += 1
+                    delay = self._take_token()
+                    break
+                loop = asyncio.get_running_loop()
+                if loop not in self._async_released:
+                    self._async_released[loop] = asyncio.Event()
+                released = self._async_released[loop]
+            await released.wait()
+
+        if delay:
+            await asyncio.sleep(delay)
+
+        return time.monotonic() - started
+
+    def release(self, *, elapsed: float, response: Response = None, error: Exception = None) -> None:
+        """
+        Free the slot taken by :meth:`acquire` and adapt the window to how the request went.
+
+        :param elapsed: Seconds the request took.
+        :type elapsed: float
+        :param response: The response received, if any.
+        :type response: httpx.Response
+        :param error: The transport error raised, if any.
+        :type error: Exception
+        """
+        with self._released:
+            self._in_flight -= 1
+
+            if isinstance(error, TimeoutException) or (response is not None and response.status_code in (429, 503)):
+                self._window = max(float(self.min_concurrency), self._window * self.decrease)
+            elif response is not None and response.is_success and elapsed <= self.fast_response:
+                self._window = min(float(self.max_concurrency), self._window + 1 / self._window)
+
+            self._released.notify_all()
+            waiting, self._async_released = self._async_released, {}
+
+        # Events aren't thread-safe, each is set by its own loop whichever thread released the slot
+        for loop, released in waiting.items():
+            try:
+                loop.call_soon_threadsafe(released.set)
+            except RuntimeError:
+                pass  # The loop was closed, nothing waits on it anymore
+
+    def _take_token(self) -> float:
+        """
+        Reserve a token, going into debt when the bucket is empty.
+        Must be called with the lock held.
+
+        :return: Seconds to wait before the reserved token is available.
+        """
+        if self.rate is None:
+            return 0.0
+
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        self._tokens -= 1
+
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
@@ -0,0 +1,65 @@
+import threading
+from typing import Dict, Union
+
+__all__ = ["Metrics"]
+
+
+class Metrics:
+    """
+    Thread-safe counters describing the HTTP traffic of a Jenkins instance.
+
+    Counters are created on first use and read like a dictionary, e.g. ``jenkins.metrics["crumb_refreshes"]``.
+    Unknown counters read as 0.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = dict()
+
+    def incr(self, name: str, value: Union[int, float] = 1) -> None:
+        """
+        Increase a counter.
+
+        :param name: The name of the counter.
+        :type name: str
+        :param value: (Default: 1) The amount to add to the counter.
+        :type value: int or float
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get(self, name: str, default: Union[int, float] = 0) -> Union[int, float]:
+        """
+        Read a counter.
+
+        :param name: The name of the counter.
+        :type name: str
+        :param default: (Default: 0) Value returned when the counter has not been used yet.
+        :type default: int or float
+        :return: The value of the counter.
+        :rtype: int or float
+        """
+        with self._lock:
+            return self._counters.get(name, default)
+
+    def __getitem__(self, name: str) -> Union[int, float]:
+        return self.get(name)
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """
+        Take a snapshot of every counter.
+
+        :return: A copy of the counters.
+        :rtype: Dict[str, Union[int, float]]
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        """
+        Reset every counter to 0.
+        """
+        with self._lock:
+            self._counters.clear()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.as_dict()}>"
@@ -1,8 +1,10 @@
 import json
-from typing import List, Generator
+from typing import List, Dict, Generator
+from urllib.parse import quote
 
 from jenkins_pysdk.consts import (
     Endpoints,
+    Class,
     XML_HEADER_DEFAULT,
     XML_POST_HEADER
 )
@@ -23,16 +25,21 @@ class Node:
     :type name: str
     :param node_url: The URL of the node.
     :type node_url: str
+    :param raw: (Optional) Node information already fetched from Jenkins, e.g. while listing nodes.
+                The node is only fetched again when a field missing from it is read.
+    :type raw: dict, optional
     """
-    def __init__(self, jenkins, name: str, node_url: str):
+    def __init__(self, jenkins, name: str, node_url: str, raw: dict = None):
         self._jenkins = jenkins
         self._name = name
         self._node_url = node_url
-        self._raw = self._get_raw()
+        self._hydrated = raw is None
+        self._raw = self._get_raw() if raw is None else raw
 
     def _get_raw(self) -> json.loads:
         url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=self._node_url)
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
+        # Only the fields read by the properties
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Nodes.Fields})
 
         if resp_obj.status_code != 200:
             raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get node ({self.name}) information.")
@@ -41,6 +48,13 @@ class Node:
 
         return data
 
+    def _field(self, name: str):
+        if name not in self._raw and not self._hydrated:
+            self._raw = {**self._raw, **self._get_raw()}
+            self._hydrated = True
+
+        return self._raw[name]
+
     @property
     def name(self) -> str:
         """
@@ -69,7 +83,37 @@ class Node:
        :return: 1 if the node is idle, 0 otherwise.
        :rtype: int
        """
-        return bool(self._raw['idle'])
+        return bool(self._field('idle'))
+
+    @property
+    def offline(self) -> bool:
+        """
+        Whether the node is offline or not.
+
+        :return: True if the node is offline, False otherwise.
+        :rtype: bool
+        """
+        return bool(self._field('offline'))
+
+    @property
+    def executors(self) -> int:
+        """
+        The number of executors of the node.
+
+        :return: The number of executors.
+        :rtype: int
+        """
+        return int(self._field('numExecutors'))
+
+    @property
+    def labels(self) -> List[str]:
+        """
+        The labels assigned to the node, including its own name.
+
+        :return: The label names.
+        :rtype: List[str]
+        """
+        return [label['name'] for label in self._field('assignedLabels')]
 
     def delete(self) -> JenkinsActionObject:
         """
@@ -192,19 +236,56 @@ class Nodes:
     def search(self, name: str) -> Node:
         """
         Search for a node by name.
+        The node is requested directly, the other nodes aren't listed.
 
         :param name: The name of the node to search for.
         :type name: str
         :return: The Node object if found, otherwise raise an exception.
         :rtype: Node
         :raises JenkinsNotFound: If the node with the specified name is not found.
+        :raises JenkinsGeneralException: If a general exception occurs.
         """
-        # TODO: Not efficient
-        for node in self.iter():
-            if node.name == name:
-                return node
-        else:
+        name = self._normalise_name(name)
+        node_url = self._node_url(name)
+        url = self._jenkins._build_url(Endpoints.Instance.Standard, prefix=node_url)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Nodes.Fields})
+
+        if resp_obj.status_code == 404:
             raise JenkinsNotFound(f"Node ({name}) was not found.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get node ({name}) information.")
+
+        return Node(self._jenkins, name, node_url, raw=json.loads(resp_obj.content))
+
+    def exists(self, names: List[str]) -> Dict[str, bool]:
+        """
+        Check which of the given nodes exist, with a single request.
+
+        :param names: The names of the nodes to check.
+        :type names: List[str]
+        :return: Whether each node exists, by name.
+        :rtype: Dict[str, bool]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        existing = {self._node_name(node) for node in self._get_computers(Endpoints.Nodes.Names)}
+
+        return {name: self._normalise_name(name) in existing for name in names}
+
+    @staticmethod
+    def _normalise_name(name: str) -> str:
+        return "built-in" if name == "(built-in)" else name
+
+    @staticmethod
+    def _node_name(node: dict) -> str:
+        # The built-in node's display name may be translated, its class isn't
+        if node.get('_class') == Class.BuiltInComputer or node['displayName'] == "Built-In Node":
+            return "built-in"
+
+        return node['displayName']
+
+    def _node_url(self, name: str) -> str:
+        url_name = "(built-in)" if name == "built-in" else quote(name, safe="")
+        return self._jenkins._build_url(Endpoints.Nodes.Node.format(name=url_name))
 
     def create(self, name: str, json: dict or json or Builder.Node) -> JenkinsActionObject:
         """
@@ -243,30 +324,30 @@ class Nodes:
 
         return obj
 
+    def _get_computers(self, tree: str) -> List[dict]:
+        url = self._jenkins._build_url(Endpoints.Nodes.Computer, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": tree})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get nodes information.")
+
+        data = json.loads(resp_obj.content)
+
+        return data.get('computer', [])
+
     def iter(self) -> Generator[Node, None, None]:
         """
         Iterate over the nodes.
+        Every node is read from a single request, the nodes are only fetched again for fields not listed.
 
         :return: A generator yielding Node objects.
         :rtype: Generator[:class:`jenkins_pysdk.nodes.Node`]
         :raises JenkinsGeneralException: If a general exception occurs.
 
         """
-        url = self._jenkins._build_url(Endpoints.Nodes.Computer, suffix=Endpoints.Instance.Standard)
-        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": "computer[assignedLabels[*]]"})
-
-        if resp_obj.status_code != 200:
-            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get nodes information.")
-
-        data = json.loads(resp_obj.content)
-
-        for node in data.get('computer', []):
-            name = node['assignedLabels'][-1]['name']  # Assuming last name is consistently correct
-            url_name = name
-            if name == "built-in":
-                url_name = f"({name})"
-            url = self._jenkins._build_url(Endpoints.Nodes.Node.format(name=url_name))
-            yield Node(self._jenkins, name, url)
+        for node in self._get_computers(Endpoints.Nodes.Iter):
+            name = self._node_name(node)
+            yield Node(self._jenkins, name, self._node_url(name), raw=node)
 
     def list(self) -> List[Node]:
         """
@@ -284,13 +365,6 @@ class Nodes:
 
         :return: The total number of nodes.
         :rtype: int
+        :raises JenkinsGeneralException: If a general exception occurs.
         """
-        url = self._jenkins._build_url(Endpoints.Nodes.Computer, suffix=Endpoints.Instance.Standard)
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
-
-        if resp_obj.status_code != 200:
-            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get nodes information.")
-
-        data = json.loads(resp_obj.content)
-
-        return len(data['computer'])
+        return len(self._get_computers(Endpoints.Nodes.Names))
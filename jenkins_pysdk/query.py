@@ -0,0 +1,134 @@
+from typing import Any, Union, Iterator, Optional
+
+__all__ = ["Tree", "Field", "Record"]
+
+
+class Field:
+    """
+    A field of a Jenkins ``tree`` query, with optional sub-fields and range.
+
+    Slicing sets the range, ``Field("builds", "number", "result")[0:10]`` renders ``builds[number,result]{0,10}``.
+
+    :param name: Name of the field, ``*`` matches every field.
+    :type name: str
+    :param fields: (Optional) Sub-fields to fetch, as names or :class:`Field` objects.
+    :type fields: Union[str, Field]
+    :param start: (Optional) Index of the first item returned.
+    :type start: int
+    :param end: (Optional) Index after the last item returned.
+    :type end: int
+    """
+    def __init__(self, name: str, *fields: Union[str, "Field"], start: int = None, end: int = None):
+        self.name = name
+        self.fields = fields
+        self.start = start
+        self.end = end
+
+    def __getitem__(self, item: Union[slice, int]) -> "Field":
+        if isinstance(item, int):
+            return Field(self.name, *self.fields, start=item, end=item + 1)
+        if item.step is not None:
+            raise ValueError("Jenkins ranges don't support steps.")
+
+        return Field(self.name, *self.fields, start=item.start, end=item.stop)
+
+    def __str__(self):
+        expression = self.name
+        if self.fields:
+            expression += f"[{','.join(map(str, self.fields))}]"
+        if self.start is not None or self.end is not None:
+            start = "" if self.start is None else self.start
+            end = "" if self.end is None else self.end
+            expression += f"{{{start},{end}}}"
+
+        return expression
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self}>"
+
+
+class Tree:
+    """
+    A Jenkins ``tree`` query, listing the fields Jenkins should return.
+
+    Fields can be given as names, as raw tree expressions or as :class:`Field` objects, e.g.
+    ``Tree("name", Field("jobs", "name", "color"))`` renders ``name,jobs[name,color]``.
+
+    :param fields: Fields to fetch.
+    :type fields: Union[str, Field]
+    """
+    def __init__(self, *fields: Union[str, Field]):
+        self.fields = fields
+
+    def __str__(self):
+        return ",".join(map(str, self.fields))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self}>"
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, dict):
+        return Record(value)
+    if isinstance(value, list):
+        return [_wrap(item) for item in value]
+
+    return value
+
+
+class Record:
+    """
+    Read-only view of a JSON object returned by Jenkins.
+
+    Fields are read as attributes or items, nested objects are records too. Only the fields which were queried
+    exist, reading another one raises :class:`AttributeError` (or :class:`KeyError` for items).
+
+    :param data: The decoded JSON object.
+    :type data: dict
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict):
+        object.__setattr__(self, "_data", data)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return _wrap(self._data[name])
+        except KeyError:
+            raise AttributeError(f"Field ({name}) was not returned by Jenkins, add it to the query.") from None
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{self.__class__.__name__} is read-only.")
+
+    def __getitem__(self, name: str) -> Any:
+        return _wrap(self._data[name])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return self._data == other._data
+        return NotImplemented
+
+    def __repr__(self):
+        kind = str(self._data.get("_class", "")).rsplit(".", 1)[-1]
+        return f"<{self.__class__.__name__}{' ' + kind if kind else ''} {list(self._data)}>"
+
+    def get(self, name: str, default: Optional[Any] = None) -> Any:
+        """
+        Read a field, or return the default when it wasn't returned.
+        """
+        return _wrap(self._data[name]) if name in self._data else default
+
+    def as_dict(self) -> dict:
+        """
+        The decoded JSON object behind the record.
+        """
+        return self._data
@@ -1,12 +1,19 @@
 import json
-from typing import List, Generator
-
-from jenkins_pysdk.exceptions import JenkinsGeneralException, JenkinsEmptyQueue
+import time
+from types import MappingProxyType
+from typing import List, Dict, Generator, Iterator, Mapping, Tuple, Optional
+
+from jenkins_pysdk.exceptions import (
+    JenkinsGeneralException,
+    JenkinsEmptyQueue,
+    JenkinsNotFound,
+    JenkinsQueueItemCancelled
+)
 from jenkins_pysdk.consts import Endpoints
 from jenkins_pysdk.jobs import Job
 from jenkins_pysdk.builds import Build
 
-__all__ = ["Queue", "QueueItem"]
+__all__ = ["Queue", "QueueItem", "QueueSnapshot", "QueueEvent"]
 
 
 class QueueItem:
@@ -87,14 +94,72 @@ class QueueItem:
     def build(self) -> Build:
         """
         Returns the build associated with the queue item.
+        Once the item has started, this is the build Jenkins started for it. Before that, it is guessed from
+        the job's next build number, use :meth:`wait_for_build` to get the right build under load.
 
         :return: The build associated with the queue item.
         :rtype: :class:`jenkins_pysdk.jenkins.Build`
         """
+        try:
+            executable = self._get_state().get('executable')
+        except (JenkinsNotFound, JenkinsGeneralException):
+            executable = None
+        if executable:
+            return Build(self._jenkins, executable['url'], raw=executable)
+
         url = self._jenkins._build_url(str(self.number), prefix=self._queue_info['task']['url'])
 
         return Build(self._jenkins, url)
 
+    def _get_state(self) -> dict:
+        url = self._jenkins._build_url(Endpoints.Queue.Item.format(id=self.id), suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.ItemState})
+
+        if resp_obj.status_code == 404:
+            raise JenkinsNotFound(f"Queue item ({self.id}) was not found.")
+        elif resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get queue item ({self.id}).")
+
+        data = json.loads(resp_obj.content)
+
+        return self._jenkins._validate_url_returned_from_instance(data)
+
+    def wait_for_build(self, timeout: float = None, interval: float = 0.5, max_interval: float = 5) -> Build:
+        """
+        Wait until the queue item starts its build, and return that build.
+        The item is polled, starting every ``interval`` seconds and backing off up to every ``max_interval`` seconds.
+
+        :param timeout: (Optional) Seconds to wait before giving up, waits forever by default.
+        :type timeout: float, optional
+        :param interval: (Default: 0.5) Seconds to wait after the first poll.
+        :type interval: float, optional
+        :param max_interval: (Default: 5) Most seconds to wait between polls.
+        :type max_interval: float, optional
+        :return: The build started for the queue item.
+        :rtype: :class:`jenkins_pysdk.builds.Build`
+        :raises JenkinsQueueItemCancelled: If the queue item was cancelled.
+        :raises JenkinsNotFound: If Jenkins no longer knows about the queue item.
+        :raises TimeoutError: If the build didn't start within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            state = self._get_state()
+            if state.get('executable'):
+                return Build(self._jenkins, state['executable']['url'], raw=state['executable'])
+            if state.get('cancelled'):
+                raise JenkinsQueueItemCancelled(f"Queue item ({self.id}) was cancelled.")
+
+            delay = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Queue item ({self.id}) didn't start a build within {timeout}s.")
+                delay = min(delay, remaining)
+
+            time.sleep(delay)
+            interval = min(interval * 1.5, max_interval)
+
     @property
     def job(self) -> Job:
         """
@@ -118,6 +183,196 @@ class QueueItem:
         return str(self._queue_info['why'])
 
 
+class QueueSnapshot:
+    """
+    Read-only view of the Jenkins queue at one point in time, built from a single request.
+
+    Items keep the order Jenkins returned them in, newest first.
+
+    :param items: The queue items.
+    :type items: List[:class:`jenkins_pysdk.queues.QueueItem`]
+    :param taken: (Optional) When the snapshot was taken, in seconds since the epoch.
+    :type taken: float
+    """
+    __slots__ = ("_items", "_by_id", "_by_job", "taken")
+
+    def __init__(self, items: List[QueueItem], taken: float = None):
+        by_job = dict()
+        for item in items:
+            by_job.setdefault(item._queue_info['task'].get('fullName'), []).append(item)
+
+        object.__setattr__(self, "_items", tuple(items))
+        object.__setattr__(self, "_by_id", MappingProxyType({item.id: item for item in items}))
+        object.__setattr__(self, "_by_job", MappingProxyType({job: tuple(group) for job, group in by_job.items()}))
+        object.__setattr__(self, "taken", time.time() if taken is None else taken)
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"{self.__class__.__name__} is read-only.")
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[QueueItem]:
+        return iter(self._items)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._by_id
+
+    def __getitem__(self, item_id: int) -> QueueItem:
+        return self._by_id[item_id]
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self)} items>"
+
+    @property
+    def total(self) -> int:
+        """
+        The number of items in the queue.
+
+        :return: The number of items.
+        :rtype: int
+        """
+        return len(self._items)
+
+    @property
+    def newest(self) -> QueueItem:
+        """
+        The newest item in the queue.
+
+        :return: The newest item.
+        :rtype: :class:`jenkins_pysdk.queues.QueueItem`
+        :raises JenkinsEmptyQueue: If the queue is empty.
+        """
+        try:
+            return self._items[0]
+        except IndexError:
+            raise JenkinsEmptyQueue("Queue is empty.")
+
+    @property
+    def oldest(self) -> QueueItem:
+        """
+        The oldest item in the queue.
+
+        :return: The oldest item.
+        :rtype: :class:`jenkins_pysdk.queues.QueueItem`
+        :raises JenkinsEmptyQueue: If the queue is empty.
+        """
+        try:
+            return self._items[-1]
+        except IndexError:
+            raise JenkinsEmptyQueue("Queue is empty.")
+
+    @property
+    def blocked(self) -> Tuple[QueueItem, ...]:
+        """
+        The items which are blocked.
+
+        :return: The blocked items.
+        :rtype: Tuple[:class:`jenkins_pysdk.queues.QueueItem`]
+        """
+        return tuple(item for item in self._items if item.blocked)
+
+    @property
+    def stuck(self) -> Tuple[QueueItem, ...]:
+        """
+        The items which are stuck.
+
+        :return: The stuck items.
+        :rtype: Tuple[:class:`jenkins_pysdk.queues.QueueItem`]
+        """
+        return tuple(item for item in self._items if item.stuck)
+
+    @property
+    def by_job(self) -> Mapping[str, Tuple[QueueItem, ...]]:
+        """
+        The items grouped by the full name of their job.
+
+        :return: The items of each job, newest first.
+        :rtype: Mapping[str, Tuple[:class:`jenkins_pysdk.queues.QueueItem`]]
+        """
+        return self._by_job
+
+    def get(self, item_id: int, default: Optional[QueueItem] = None) -> Optional[QueueItem]:
+        """
+        Look an item up by its queue ID.
+
+        :param item_id: The ID of the queue item.
+        :type item_id: int
+        :param default: (Optional) Returned when the item isn't in the queue.
+        :return: The queue item, or the default.
+        :rtype: :class:`jenkins_pysdk.queues.QueueItem`
+        """
+        return self._by_id.get(item_id, default)
+
+
+class QueueEvent:
+    """
+    A change in the Jenkins queue, emitted by :meth:`jenkins_pysdk.queues.Queue.watch`.
+
+    :param kind: What happened, one of the ``QueueEvent`` constants.
+    :type kind: str
+    :param item_id: The ID of the queue item.
+    :type item_id: int
+    :param job: The full name of the item's job.
+    :type job: str
+    :param item: (Optional) The queue item, for every event except ``LEFT``.
+    :type item: :class:`jenkins_pysdk.queues.QueueItem`
+    :param build: (Optional) For ``LEFT``, the build the item started, if any.
+    :type build: :class:`jenkins_pysdk.builds.Build`
+    :param reason: (Optional) Why the item is waiting.
+    :type reason: str
+    :param previous_reason: (Optional) For ``REASON_CHANGED``, why the item was waiting before.
+    :type previous_reason: str
+    """
+    ADDED = "added"
+    LEFT = "left"
+    BLOCKED = "blocked"
+    STUCK = "stuck"
+    REASON_CHANGED = "reason_changed"
+
+    __slots__ = ("kind", "item_id", "job", "item", "build", "reason", "previous_reason")
+
+    def __init__(self, kind: str, item_id: int, job: str, item: QueueItem = None, build: Build = None,
+                 reason: str = None, previous_reason: str = None):
+        self.kind = kind
+        self.item_id = item_id
+        self.job = job
+        self.item = item
+        self.build = build
+        self.reason = reason
+        self.previous_reason = previous_reason
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.kind} {self.item_id} ({self.job})>"
+
+
+def _diff_queue(previous: Dict[int, tuple], items: List[dict]) -> Tuple[Dict[int, tuple], List[tuple]]:
+    # Only (blocked, stuck, why, job) is kept per item, so diffing large queues stays cheap
+    state = dict()
+    changes = list()
+
+    for item in items:
+        item_id = int(item['id'])
+        now = state[item_id] = (bool(item.get('blocked')), bool(item.get('stuck')), item.get('why'),
+                                item['task'].get('fullName'))
+        before = previous.get(item_id)
+        if before is None:
+            changes.append((QueueEvent.ADDED, item_id, item, now, None))
+            continue
+        if now[0] and not before[0]:
+            changes.append((QueueEvent.BLOCKED, item_id, item, now, None))
+        if now[1] and not before[1]:
+            changes.append((QueueEvent.STUCK, item_id, item, now, None))
+        if now[2] != before[2]:
+            changes.append((QueueEvent.REASON_CHANGED, item_id, item, now, before[2]))
+
+    for item_id, before in previous.items():
+        if item_id not in state:
+            changes.append((QueueEvent.LEFT, item_id, None, before, None))
+
+    return state, changes
+
+
 class Queue:
     """
     Represents a Jenkins queue.
@@ -176,6 +431,71 @@ class Queue:
         """
         return [item for item in self.iter(_paginate=_paginate)]
 
+    def _watch_items(self) -> List[dict]:
+        url = self._jenkins._build_url(Endpoints.Queue.Queue, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.Watch})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get queue information.")
+
+        data = json.loads(resp_obj.content)
+        data = self._jenkins._validate_url_returned_from_instance(data)
+
+        return data.get('items', [])
+
+    def _left_build(self, item_id: int) -> Optional[Build]:
+        url = self._jenkins._build_url(Endpoints.Queue.Item.format(id=item_id), suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.ItemState})
+
+        if resp_obj.status_code != 200:
+            return None  # Jenkins forgets items a few minutes after they leave
+
+        executable = json.loads(resp_obj.content).get('executable')
+        if not executable:
+            return None
+        executable = self._jenkins._validate_url_returned_from_instance(executable)
+
+        return Build(self._jenkins, executable['url'], raw=executable)
+
+    def watch(self, interval: float = 5) -> Generator[QueueEvent, None, None]:
+        """
+        Poll the Jenkins queue and yield what changed between polls, forever.
+
+        The first poll reports every queued item as ``ADDED``. Items which left the queue are reported as ``LEFT``,
+        with the build they started if Jenkins still knows about them. Items becoming blocked or stuck, and
+        changes of the reason they're waiting, are reported as ``BLOCKED``, ``STUCK`` and ``REASON_CHANGED``.
+        Only the fields needed to compare polls are fetched, so the items' ``number`` isn't available.
+
+        :param interval: (Default: 5) Seconds to wait between polls.
+        :type interval: float, optional
+        :return: A generator yielding the changes.
+        :rtype: Generator[:class:`jenkins_pysdk.queues.QueueEvent`]
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        state = dict()
+
+        while True:
+            state, changes = _diff_queue(state, self._watch_items())
+
+            for kind, item_id, item, now, previous_reason in changes:
+                build = self._left_build(item_id) if kind == QueueEvent.LEFT else None
+                item = QueueItem(self._jenkins, item) if item is not None else None
+                yield QueueEvent(kind, item_id, now[3], item=item, build=build, reason=now[2],
+                                 previous_reason=previous_reason)
+
+            time.sleep(interval)
+
+    def snapshot(self) -> QueueSnapshot:
+        """
+        Take a snapshot of the Jenkins queue with a single request.
+        Reading several properties of the snapshot doesn't fetch the queue again.
+
+        :return: The queue as it was when the request was made.
+        :rtype: :class:`jenkins_pysdk.queues.QueueSnapshot`
+        :raises JenkinsGeneralException: If a general exception occurs.
+        """
+        return QueueSnapshot(self.list())
+
     @property
     def newest(self) -> QueueItem:
         """
@@ -185,10 +505,7 @@ class Queue:
         :rtype: :class:`jenkins_pysdk.jenkins.QueueItem`
         :raises JenkinsEmptyQueue: If the queue is empty.
         """
-        try:
-            return self.list()[0]
-        except IndexError:
-            raise JenkinsEmptyQueue("Queue is empty.")
+        return self.snapshot().newest
 
     @property
     def oldest(self) -> QueueItem:
@@ -199,17 +516,21 @@ class Queue:
         :rtype: :class:`jenkins_pysdk.jenkins.QueueItem`
         :raises JenkinsEmptyQueue: If the queue is empty.
         """
-        try:
-            return self.list()[-1]
-        except IndexError:
-            raise JenkinsEmptyQueue("Queue is empty.")
+        return self.snapshot().oldest
 
     @property
     def total(self) -> int:
         """
-        Returns the total number of items in the Jenkins queue.
+        Returns the total number of items in the Jenkins queue. Only the item IDs are fetched.
 
         :return: The total number of items in the Jenkins queue.
         :rtype: int
+        :raises JenkinsGeneralException: If a general exception occurs.
         """
-        return len(self.list())
+        url = self._jenkins._build_url(Endpoints.Queue.Queue, suffix=Endpoints.Instance.Standard)
+        req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": Endpoints.Queue.Ids})
+
+        if resp_obj.status_code != 200:
+            raise JenkinsGeneralException(f"[{resp_obj.status_code}] Failed to get queue information.")
+
+        return len(json.loads(resp_obj.content).get('items', []))
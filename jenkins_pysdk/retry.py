@@ -0,0 +1,123 @@
+import time
+import random
+from email.utils import parsedate_to_datetime
+from typing import Optional, Iterable
+
+from httpx import Response, ConnectError, ConnectTimeout, PoolTimeout
+
+from jenkins_pysdk.consts import (
+    HTTP_RETRY_COUNT,
+    HTTP_RETRY_STATUSES,
+    HTTP_IDEMPOTENT_METHODS
+)
+
+__all__ = ["RetryPolicy"]
+
+
+class RetryPolicy:
+    """
+    Decide whether, and after how long, a failed request is retried.
+
+    Idempotent methods are retried on connection errors and on the configured status codes.
+    Other methods (e.g. POST) are only retried when the request could not reach Jenkins at all,
+    so a build is never triggered twice.
+
+    :param retries: (Default: 1) Maximum number of retries for a single call. 0 disables retries.
+    :type retries: int
+    :param backoff_factor: (Default: 0.5) Base delay in seconds, doubled after every retry.
+    :type backoff_factor: float
+    :param backoff_max: (Default: 30) Upper bound of a single delay in seconds.
+    :type backoff_max: float
+    :param jitter: (Default: True) Pick a random delay between 0 and the computed backoff.
+    :type jitter: bool
+    :param statuses: (Default: 429, 502, 503, 504) Response status codes worth retrying.
+    :type statuses: Iterable[int]
+    :param methods: (Default: GET, HEAD, OPTIONS, PUT, DELETE) Methods which are safe to resend.
+    :type methods: Iterable[str]
+    :param respect_retry_after: (Default: True) Wait as long as the Retry-After header asks, capped by backoff_max.
+    :type respect_retry_after: bool
+    :param deadline: (Optional) Total seconds a call may take, retries included. No retry is started past it.
+    :type deadline: float
+    """
+    def __init__(self, *,
+                 retries: int = HTTP_RETRY_COUNT,
+                 backoff_factor: float = 0.5,
+                 backoff_max: float = 30.0,
+                 jitter: bool = True,
+                 statuses: Iterable[int] = HTTP_RETRY_STATUSES,
+                 methods: Iterable[str] = HTTP_IDEMPOTENT_METHODS,
+                 respect_retry_after: bool = True,
+                 deadline: Optional[float] = None):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} retries={self.retries} deadline={self.deadline}>"
+
+    def next_delay(self, *, method: str, attempt: int, started: float,
+                   response: Response = None, error: Exception = None) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a call.
+
+        :param method: HTTP method of the call.
+        :type method: str
+        :param attempt: Number of retries already made for the call.
+        :type attempt: int
+        :param started: ``time.monotonic()`` when the call started.
+        :type started: float
+        :param response: The response received, if any.
+        :type response: httpx.Response
+        :param error: The transport error raised, if any.
+        :type error: Exception
+        :return: Seconds to wait before retrying, or None when the call must not be retried.
+        :rtype: float or None
+        """
+        if attempt >= self.retries or not self._retryable(method.upper(), response, error):
+            return None
+
+        delay = self._backoff(attempt)
+
+        if response is not None and self.respect_retry_after:
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = min(retry_after, self.backoff_max)
+
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return None
+
+        return delay
+
+    def _retryable(self, method: str, response: Optional[Response], error: Optional[Exception]) -> bool:
+        if error is not None:
+            # The request never left the client, resending it can't duplicate anything
+            if isinstance(error, (ConnectError, ConnectTimeout, PoolTimeout)):
+                return True
+            return method in self.methods
+
+        return method in self.methods and response is not None and response.status_code in self.statuses
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError, IndexError):
+            return None
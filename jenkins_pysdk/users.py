@@ -183,18 +183,22 @@ class Users:
     def _check_version(self):
         # Handling v2.452 change
         # https://issues.jenkins.io/browse/JENKINS-18884
-        version = self._jenkins.version
+        # The version seen by connect() is reused to save a round trip
+        version = self._jenkins._version or self._jenkins.version
         version = tuple(map(int, version.split(".")))
         new_version = tuple(map(int, "2.452".split(".")))
         if version >= new_version:
-            try:
-                found = self._jenkins.plugins.installed.search("people-view")
-                if not found.active:
-                    print(Warning(f"Your people-view plugin is not enabled."))
-            except JenkinsNotFound:
+            # Look the plugin up directly instead of scanning every installed plugin
+            endpoint = f"{Endpoints.Plugins.PluginManager}/{Endpoints.Plugins.Plugin.format(plugin='people-view')}"
+            url = self._jenkins._build_url(endpoint, suffix=Endpoints.Instance.Standard)
+            req_obj, resp_obj = self._jenkins._send_http(url=url, params={"tree": "active"})
+
+            if resp_obj.status_code == 404:
                 # TODO: Fix this print
                 print(Warning(
                     f"Your Jenkins version ({version}) requires the people-view plugin but you haven't installed it."))
+            elif resp_obj.status_code == 200 and not json.loads(resp_obj.content).get("active"):
+                print(Warning(f"Your people-view plugin is not enabled."))
 
     def search(self, username: str) -> User:
         """
@@ -0,0 +1,210 @@
+import os
+import re
+import json
+import hashlib
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple, Iterable
+
+from httpx import URL, Request, Response
+
+from jenkins_pysdk.cache import _request_key
+from jenkins_pysdk.consts import HTTP_CONDITIONAL_PATTERNS
+
+__all__ = ["ValidatorStore", "MemoryValidatorStore", "DiskValidatorStore"]
+
+# Response headers kept alongside the body so a 304 can be answered like the original 200
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+class ValidatorStore(ABC):
+    """
+    Remember the ``ETag``/``Last-Modified`` validators and body of GET responses, so that the next request for
+    the same url is sent with ``If-None-Match``/``If-Modified-Since`` and a ``304 Not Modified`` is answered
+    with the stored body.
+
+    It is abstract, use :class:`MemoryValidatorStore` or :class:`DiskValidatorStore`, or subclass it and implement
+    :meth:`load`, :meth:`save` and :meth:`discard` to keep validators elsewhere.
+
+    :param patterns: (Default: config.xml and api/json) Regexes searched in the url path of the responses to keep.
+    :type patterns: Iterable[str]
+    """
+    def __init__(self, *, patterns: Iterable[str] = HTTP_CONDITIONAL_PATTERNS):
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Tuple[dict, bytes]]:
+        """
+        Get the stored headers and body for a request.
+
+        :param key: Identifier of the request
+        :type key: str
+        :return: The stored headers and body, or None
+        :rtype: Tuple[dict, bytes] or None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, key: str, headers: dict, content: bytes) -> None:
+        """
+        Store the validators and body of a response.
+
+        :param key: Identifier of the request
+        :type key: str
+        :param headers: The validators and content type of the response
+        :type headers: dict
+        :param content: The body of the response
+        :type content: bytes
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self, key: str) -> None:
+        """
+        Forget the stored response of a request.
+
+        :param key: Identifier of the request
+        :type key: str
+        """
+        raise NotImplementedError
+
+    def key(self, url: str, params: dict = None) -> Optional[str]:
+        """
+        Identify a request, or return None when its responses are not kept.
+        """
+        base, query = _request_key(url, params)
+        if not any(pattern.search(URL(base).path) for pattern in self.patterns):
+            return None
+
+        return base + ("?" + "&".join(f"{k}={v}" for k, v in query) if query else "")
+
+    def conditional_headers(self, key: str) -> dict:
+        """
+        Headers which ask Jenkins to only send the body if it changed.
+        """
+        stored = self.load(key)
+        if stored is None:
+            return dict()
+
+        headers = dict()
+        if "etag" in stored[0]:
+            headers["If-None-Match"] = stored[0]["etag"]
+        if "last-modified" in stored[0]:
+            headers["If-Modified-Since"] = stored[0]["last-modified"]
+
+        return headers
+
+    def remember(self, key: str, response: Response) -> None:
+        """
+        Keep a successful response if Jenkins sent validators with it.
+        """
+        if not response.is_success:
+            return
+
+        headers = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+        if "etag" in headers or "last-modified" in headers:
+            self.save(key, headers, response.content)
+        else:
+            self.discard(key)
+
+    def replay(self, key: str, request: Request, response: Response) -> Optional[Response]:
+        """
+        Turn a ``304 Not Modified`` into the stored 200 response.
+        """
+        stored = self.load(key)
+        if response.status_code != 304 or stored is None:
+            return None
+
+        headers = dict(stored[0])
+        headers.update({name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers})
+
+        return Response(200, headers=headers, content=stored[1], request=request)
+
+
+class MemoryValidatorStore(ValidatorStore):
+    """
+    Keep validators and bodies in memory, evicting the least recently used ones.
+
+    :param max_entries: (Default: 1024) Maximum number of stored responses.
+    :type max_entries: int
+    :param patterns: (Default: config.xml and api/json) Regexes searched in the url path of the responses to keep.
+    :type patterns: Iterable[str]
+    """
+    def __init__(self, *, max_entries: int = 1024, patterns: Iterable[str] = HTTP_CONDITIONAL_PATTERNS):
+        super().__init__(patterns=patterns)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def load(self, key: str) -> Optional[Tuple[dict, bytes]]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def save(self, key: str, headers: dict, content: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (headers, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class DiskValidatorStore(ValidatorStore):
+    """
+    Keep validators and bodies in a directory, so they survive between runs (e.g. nightly audits).
+
+    :param path: Directory holding the stored responses, created if missing.
+    :type path: str
+    :param patterns: (Default: config.xml and api/json) Regexes searched in the url path of the responses to keep.
+    :type patterns: Iterable[str]
+    """
+    def __init__(self, path: str, *, patterns: Iterable[str] = HTTP_CONDITIONAL_PATTERNS):
+        super().__init__(patterns=patterns)
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def load(self, key: str) -> Optional[Tuple[dict, bytes]]:
+        try:
+            with open(self._file(key), "rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("key") != key:
+            return None
+
+        return meta["headers"], content
+
+    def save(self, key: str, headers: dict, content: bytes) -> None:
+        # Written to a temporary file first so readers never see half a response
+        fd, tmp = tempfile.mkstemp(dir=self.path)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps({"key": key, "headers": headers}).encode() + b"\n")
+                f.write(content)
+            os.replace(tmp, self._file(key))
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def discard(self, key: str) -> None:
+        try:
+            os.remove(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha256(key.encode()).hexdigest())
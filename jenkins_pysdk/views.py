@@ -1,5 +1,5 @@
 import json
-from typing import List, Generator
+from typing import List, Generator, Union
 
 from jenkins_pysdk.objects import JenkinsValidateJob, JenkinsActionObject
 from jenkins_pysdk.exceptions import JenkinsNotFound, JenkinsGeneralException
@@ -9,6 +9,7 @@ from jenkins_pysdk.consts import (
     XML_POST_HEADER
 )
 from jenkins_pysdk.builders import Builder
+from jenkins_pysdk.query import Tree, Field, Record
 
 __all__ = ["Views", "View"]
 
@@ -309,11 +310,20 @@ class Views:
         """
         raise NotImplemented
 
-    def api(self):
+    def api(self, query: Union[str, Tree, Field] = None, *, path: str = None, depth: int = None) -> Record:
         """
         Run your own query and return views data objects.
 
-        :return: None
-        :rtype: None
+        :param query: (Optional) The tree query, e.g. ``Field("jobs", "name", "color")``.
+        :type query: str or :class:`jenkins_pysdk.query.Tree` or :class:`jenkins_pysdk.query.Field`
+        :param path: (Optional) Path of the view to query. Defaults to the top level of the instance.
+        :type path: str, optional
+        :param depth: (Optional) How deep nested objects are expanded when no query is given.
+        :type depth: int, optional
+        :return: Views data objects.
+        :rtype: :class:`jenkins_pysdk.query.Record`
+        :raises JenkinsNotFound: If the view doesn't exist.
         """
-        raise NotImplemented
+        path = self._jenkins._build_view_http_path(path) if path else ""
+
+        return self._jenkins.api(query, path=path, depth=depth)
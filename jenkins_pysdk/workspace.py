@@ -1,8 +1,9 @@
 from pathlib import Path
+from typing import Union, Optional, Callable, Any, IO
 
 from jenkins_pysdk.objects import JenkinsActionObject
 from jenkins_pysdk.exceptions import JenkinsGeneralException
-from jenkins_pysdk.consts import Endpoints
+from jenkins_pysdk.consts import Endpoints, HTTP_DOWNLOAD_CHUNK_SIZE
 
 
 __all__ = ["Workspace"]
@@ -24,49 +25,50 @@ class Workspace:
         self._job_name = job_name
         self._job_url = job_url
 
-    def download(self, path: str or Path, workspace_file: str = None) -> JenkinsActionObject:
+    def download(self, path: Union[str, Path, IO[bytes]], workspace_file: str = None, *,
+                 chunk_size: int = HTTP_DOWNLOAD_CHUNK_SIZE,
+                 progress: Callable[[int, Optional[int]], Any] = None,
+                 resume: bool = False) -> JenkinsActionObject:
         """
         Download workspace files from the job.
+        The archive is streamed to disk in chunks, so large workspaces don't need to fit in memory.
 
-        :param path: The directory where the workspace files will be saved.
-        :type path: str
+        :param path: The directory or file where the workspace files will be saved, or a binary file object.
+        :type path: str or Path or IO[bytes]
         :param workspace_file: (Optional) Download a specific file in the workspace
         :type workspace_file: str, optional
+        :param chunk_size: (Default: 64KiB) Number of bytes written at a time.
+        :type chunk_size: int, optional
+        :param progress: (Optional) Called with the bytes downloaded so far and the total size (None if unknown).
+        :type progress: Callable[[int, Optional[int]], Any], optional
+        :param resume: (Default: False) Continue a partial download already in the file, if Jenkins supports it.
+        :type resume: bool, optional
         :return: An object representing the action performed in Jenkins.
         :rtype: :class:`jenkins_pysdk.objects.JenkinsActionObject`
         """
         endpoint = Endpoints.Workspace.DownloadFile.format(path=workspace_file) if workspace_file \
             else Endpoints.Workspace.Download.format(name=self._job_name)
         url = self._jenkins._build_url(endpoint, prefix=self._job_url)
-        req_obj, resp_obj = self._jenkins._send_http(url=url)
+
+        if not hasattr(path, "write"):
+            path = Path(path)
+            if path.is_dir():
+                path /= f"{self._job_name}.zip"
+
+        req_obj, resp_obj, _ = self._jenkins._download(url=url, destination=path, chunk_size=chunk_size,
+                                                       progress=progress, resume=resume)
         msg = f"[{resp_obj.status_code}] Successfully downloaded workspace files for {self._job_name}."
 
         if resp_obj.status_code >= 500:
             raise JenkinsGeneralException(f"[{resp_obj.status_code}] Server error.")
-        elif resp_obj.status_code != 200:
+        elif resp_obj.status_code not in (200, 206) and not (resume and resp_obj.status_code == 416):
             msg = f"[{resp_obj.status_code}] Failed to download workspace files for {self._job_name}."
 
-        path = Path(path)
-        if path.is_dir():
-            path /= f"{self._job_name}.zip"
-
-        self._write_to_file(path, resp_obj.content)
-
         obj = JenkinsActionObject(request=req_obj, content=msg, status_code=resp_obj.status_code)
         obj._raw = resp_obj
 
         return obj
 
-    @staticmethod
-    def _write_to_file(path: Path, content: bytes):
-        for _ in range(2):
-            try:
-                with open(path, "wb") as file:
-                    file.write(content)
-                break
-            except EnvironmentError:
-                continue
-
     def wipe(self) -> JenkinsActionObject:
         """
          Wipe the workspace of the Jenkins job.
@@ -1,5 +1,7 @@
 import os
 import sys
+import asyncio
+import time
 import unittest
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -7,13 +9,22 @@ sys.path.insert(0, project_root)
 sys.path.append("jenkins_pysdk")
 
 from jenkins_pysdk.jenkins import Jenkins
+from jenkins_pysdk.async_jenkins import AsyncJenkins
 from jenkins_pysdk.exceptions import (
     JenkinsConnectionException,
     JenkinsNotFound,
     JenkinsGeneralException,
-    JenkinsEmptyQueue
+    JenkinsEmptyQueue,
+    JenkinsAlreadyExists
 )
 from jenkins_pysdk.builders import Builder
+from jenkins_pysdk.retry import RetryPolicy
+from jenkins_pysdk.limiter import AdaptiveLimiter
+from jenkins_pysdk.cache import ResponseCache
+from jenkins_pysdk.validators import MemoryValidatorStore
+from jenkins_pysdk.query import Tree, Field
+from jenkins_pysdk.queues import QueueEvent
+from jenkins_pysdk.builds import BuildWatcher
 from tests.conf import servers, credentials
 
 
@@ -33,6 +44,14 @@ class TestJenkins(unittest.TestCase):
                     self._test_connection(self.host, port)
                     self._test_proxy_mount(self.host, port)
                     self._test_connection_two(self.host, port)
+                    self._test_connection_pool(self.host, port)
+                    self._test_crumb_cache(self.host, port)
+                    self._test_retry_policy(self.host, port)
+                    self._test_limiter(self.host, port)
+                    self._test_response_cache(self.host, port)
+                    self._test_conditional_get(self.host, port)
+                    self._test_coalesce(self.host, port)
+                    self._test_lazy(self.host, port)
                     self._test_version(self.host, port)
                     self._test_get_max_executors(self.host, port)
                     # self._test_restart(self.host, port)
@@ -50,12 +69,18 @@ class TestJenkins(unittest.TestCase):
                     self._test_boot_logout(self.host, port)
                     self._test_reload(self.host, port)
                     self._test_script_console(self.host, port)
+                    self._test_async_jenkins(self.host, port)
 
                     # test builds.py
                     self._test_build_number(self.host, port)
                     self._test_build_timestamp(self.host, port)
                     self._test_build_description(self.host, port)
                     self._test_build_logs(self.host, port)
+                    self._test_build_download_console(self.host, port)
+                    self._test_build_follow(self.host, port)
+                    self._test_build_follow_resume(self.host, port)
+                    self._test_build_console_tail(self.host, port)
+                    self._test_build_search_console(self.host, port)
                     self._test_build_delete(self.host, port)
                     self._test_build_changes(self.host, port)
                     self._test_build_rebuild(self.host, port)
@@ -66,10 +91,16 @@ class TestJenkins(unittest.TestCase):
 
                     self._test_total_builds(self.host, port)
                     self._test_iter_builds(self.host, port)
+                    self._test_iter_builds_projected(self.host, port)
+                    self._test_builds_not_hydrated(self.host, port)
+                    self._test_build_history(self.host, port)
+                    self._test_search_builds(self.host, port)
                     self._test_list_builds(self.host, port)
                     self._test_latest_build(self.host, port)
                     self._test_oldest_build(self.host, port)
                     self._test_build_job(self.host, port)
+                    self._test_build_job_not_polled(self.host, port)
+                    self._test_build_watcher(self.host, port)
                     self._test_rebuild_last(self.host, port)
 
                     # test jobs.py - Job
@@ -89,6 +120,8 @@ class TestJenkins(unittest.TestCase):
                     self._test_jobs_create(self.host, port)
                     self._test_jobs_iter(self.host, port)
                     self._test_jobs_list(self.host, port)
+                    self._test_jobs_api(self.host, port)
+                    self._test_jobs_trigger_many(self.host, port)
 
                     # # test jobs.py - Folder
                     # self._test_folder_reconfig(self.host, port)
@@ -117,6 +150,7 @@ class TestJenkins(unittest.TestCase):
                     self._test_node_enable(self.host, port)
 
                     self._test_nodes_search(self.host, port)
+                    self._test_nodes_exists(self.host, port)
                     self._test_nodes_create(self.host, port)
                     self._test_nodes_iter(self.host, port)
                     self._test_nodes_list(self.host, port)
@@ -166,6 +200,7 @@ class TestJenkins(unittest.TestCase):
                     self._test_queuei_stuck(self.host, port)
                     self._test_queuei_type(self.host, port)
                     self._test_queuei_build(self.host, port)
+                    self._test_queuei_wait_for_build(self.host, port)
                     self._test_queuei_job(self.host, port)
                     self._test_queuei_reason(self.host, port)
 
@@ -175,6 +210,8 @@ class TestJenkins(unittest.TestCase):
                     self._test_queue_newest(self.host, port)
                     self._test_queue_oldest(self.host, port)
                     self._test_queue_total(self.host, port)
+                    self._test_queue_snapshot(self.host, port)
+                    self._test_queue_watch(self.host, port)
 
                     # test users.py - User
                     self._test_user_url(self.host, port)
@@ -249,6 +286,122 @@ class TestJenkins(unittest.TestCase):
         except JenkinsConnectionException as e:
             self.fail(f"Failed to connect to Jenkins to {host}:{port}: {e}")
 
+    def _test_connection_pool(self, host, port):
+        try:
+            with Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False,
+                         max_connections=5, max_keepalive_connections=2) as j:
+                session = j._session
+                j.connect()
+                self.assertIs(session, j._session)
+            self.assertIsNone(j._client)
+            print(f"Reused pooled connection on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except JenkinsConnectionException as e:
+            self.fail(f"Failed to reuse pooled connection to {host}:{port}: {e}")
+
+    def _test_crumb_cache(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            j.quiet_mode()
+            crumb = j._crumb
+            j.quiet_mode(disable=True)
+            self.assertIs(crumb, j._crumb)
+            print(j.metrics["crumb_refreshes"])
+            print(f"Reused cached crumb on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except JenkinsConnectionException as e:
+            self.fail(f"Failed to reuse cached crumb on {host}:{port}: {e}")
+
+    def _test_retry_policy(self, host, port):
+        try:
+            retry = RetryPolicy(retries=3, backoff_factor=0.1)
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False, retry=retry)
+            self.assertIs(j.retry, retry)
+            _, resp = j._send_http(url=j._build_url("missing-page"))
+            self.assertEqual(resp.status_code, 404)
+            self.assertEqual(j.metrics["retries"], 0)
+            print(f"Configured retry policy on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except JenkinsConnectionException as e:
+            self.fail(f"Failed to configure retry policy on {host}:{port}: {e}")
+
+    def _test_limiter(self, host, port):
+        try:
+            limiter = AdaptiveLimiter(rate=5, max_concurrency=4)
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False,
+                        limiter=limiter)
+            for _ in range(3):
+                j.version
+            self.assertEqual(limiter.in_flight, 0)
+            self.assertLessEqual(limiter.window, 4)
+            print(j.metrics["limiter_wait_seconds"])
+            print(f"Limited requests on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except JenkinsConnectionException as e:
+            self.fail(f"Failed to limit requests on {host}:{port}: {e}")
+
+    def _test_response_cache(self, host, port):
+        try:
+            cache = ResponseCache(ttl=60, ttls={"overallLoad": 30})
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False, cache=cache)
+            hits = cache.stats["hits"]
+            print(j.available_executors, j.executors_in_use, j.idle_executors, j.queue_size)
+            self.assertEqual(cache.stats["hits"], hits + 3)
+            j.quiet_mode()
+            j.quiet_mode(disable=True)
+            self.assertEqual(len(cache), 0)
+            print(cache.stats)
+            print(f"Cached responses on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except JenkinsConnectionException as e:
+            self.fail(f"Failed to cache responses on {host}:{port}: {e}")
+
+    def _test_conditional_get(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False,
+                        validators=MemoryValidatorStore())
+            job = j.jobs.search("f")
+            self.assertEqual(job.config, job.config)
+            print(j.metrics["not_modified"])
+            print(f"Sent conditional requests on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except JenkinsConnectionException as e:
+            self.fail(f"Failed to send conditional requests on {host}:{port}: {e}")
+
+    def _test_coalesce(self, host, port):
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False,
+                        coalesce=True)
+            with ThreadPoolExecutor(8) as pool:
+                versions = set(pool.map(lambda _: j.version, range(8)))
+            self.assertEqual(len(versions), 1)
+            print(j.metrics["coalesced"])
+            print(f"Coalesced requests on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except JenkinsConnectionException as e:
+            self.fail(f"Failed to coalesce requests on {host}:{port}: {e}")
+
+    def _test_lazy(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False, lazy=True)
+            self.assertIsNone(j._users)
+            self.assertIs(j.jobs, j.jobs)
+            print(j.connect())
+            print(j.users)
+            print(f"Created lazy instance on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except JenkinsConnectionException as e:
+            self.fail(f"Failed to create lazy instance on {host}:{port}: {e}")
+
     def _test_version(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
@@ -381,6 +534,32 @@ class TestJenkins(unittest.TestCase):
         except JenkinsConnectionException as e:
             self.fail(f"Failed to run script on {host}:{port}: {e}")
 
+    def _test_async_jenkins(self, host, port):
+        async def run():
+            async with AsyncJenkins(host=host, port=port, username=self.username, passw=self.password,
+                                    verify=False) as j:
+                print(await j.version)
+                jobs = await j.jobs.list()
+                self.assertEqual(sorted(job.path for job in jobs),
+                                 sorted(job.path for job in Jenkins(host=host, port=port, username=self.username,
+                                                                    passw=self.password, verify=False).jobs.list()))
+                print(await j.queue.list())
+                print(await j.nodes.list())
+                print(await j.plugins.installed.list())
+                build = await (await j.jobs.search("f")).builds.latest
+                print(await build.console())
+                # Builds reached through the queue only carry a number and URL until hydrated
+                triggered = await (await (await j.jobs.search("f")).builds.build()).result(timeout=300)
+                print(triggered.result, triggered.timestamp, triggered.description)
+
+        try:
+            asyncio.run(run())
+            print(f"Used the asyncio client on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to use the asyncio client on port {port}: {e}")
+
     ###################################################################################################################
     # builds.py
     ###################################################################################################################
@@ -433,6 +612,90 @@ class TestJenkins(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to get latest build logs for job 'f' port {port}: {e}")
 
+    def _test_build_follow(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            build = j.jobs.search("f").builds.latest
+            follower = build.follow()
+            lines = list(follower)
+            self.assertEqual("\n".join(lines), build.console().rstrip("\n").replace("\r\n", "\n"))
+            self.assertEqual(list(build.follow(follower.offset)), [])
+            print(f"Successfully followed latest 'f' console logs on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to follow latest build logs for job 'f' port {port}: {e}")
+
+    def _test_build_follow_resume(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            build = j.jobs.search("f").builds.latest
+            follower = build.follow()
+            lines, offsets = [], []
+            for line in follower:
+                lines.append(line)
+                offsets.append(follower.offset)
+            # Resuming after a line repeats none of it
+            for index, offset in enumerate(offsets[:-1]):
+                if 0 < offset and offsets.index(offset) == index:
+                    self.assertEqual(list(build.follow(offset)), lines[index + 1:])
+            # The last line has no markup, resuming in its middle yields the rest of it
+            middle = follower.offset - len(lines[-1].encode()) - 1 + len(lines[-1]) // 2
+            self.assertEqual(list(build.follow(middle)), [lines[-1][len(lines[-1]) // 2:]])
+            print(f"Successfully resumed following 'f' console logs on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to resume following build logs for job 'f' port {port}: {e}")
+
+    def _test_build_console_tail(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            build = j.jobs.search("f").builds.latest
+            lines = build.console().rstrip("\n").replace("\r\n", "\n").split("\n")
+            self.assertEqual(build.console_tail(2), "\n".join(lines[-2:]))
+            self.assertEqual(build.console_tail(len(lines) + 10), "\n".join(lines))
+            self.assertTrue(build.console().endswith(build.console_tail(bytes=10)))
+            print(f"Successfully got the tail of latest 'f' console logs on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to get the tail of latest build logs for job 'f' port {port}: {e}")
+
+    def _test_build_search_console(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            build = j.jobs.search("f").builds.latest
+            lines = build.console().rstrip("\n").replace("\r\n", "\n").split("\n")
+            matches = build.search_console(["Finished", "Started by"], context=1)
+            self.assertTrue(matches)
+            for match in matches:
+                self.assertEqual(lines[match.line_number - 1], match.line)
+                self.assertEqual(lines[max(match.line_number - 2, 0):match.line_number - 1], match.before)
+                self.assertEqual(lines[match.line_number:match.line_number + 1], match.after)
+            self.assertEqual(len(build.search_console(".", max_matches=1)), 1)
+            print(f"Successfully searched latest 'f' console logs on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to search latest build logs for job 'f' port {port}: {e}")
+
+    def _test_build_download_console(self, host, port):
+        try:
+            import io
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            build = j.jobs.search("f").builds.latest
+            log = io.BytesIO()
+            progress = []
+            print(build.download_console(log, chunk_size=1024, progress=lambda done, total: progress.append(done)))
+            self.assertEqual(log.getvalue().decode(), build.console())
+            self.assertEqual(progress[-1], len(log.getvalue()))
+            print(f"Successfully streamed latest 'f' console logs on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to stream latest build logs for job 'f' port {port}: {e}")
+
     def _test_build_delete(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
@@ -475,13 +738,59 @@ class TestJenkins(unittest.TestCase):
     def _test_build_job(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
-            j.jobs.search("f").builds.build()
+            handle = j.jobs.search("f").builds.build()
+            self.assertIsNotNone(handle.queue_id)
+            build = handle.result(timeout=300)
+            self.assertTrue(build.done)
+            self.assertIs(handle.build, build)
+            print(build.number, build.result)
             print(f"Triggered new build for job 'd' on port {port}: SUCCESS")
         except AssertionError as e:
             raise e
         except Exception as e:
             self.fail(f"Failed to trigger new build for job 'f' (port {port}): {e}")
 
+    def _test_build_job_not_polled(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            builds = j.jobs.search("f").builds
+            sent = []
+            send_http = j._send_http
+            j._send_http = lambda **kws: sent.append(kws['url']) or send_http(**kws)
+            handle = builds.build()
+            time.sleep(2)
+            # Only the trigger, nothing polls a handle nobody waits on
+            self.assertEqual(len(sent), 1)
+            handle.result(timeout=300)
+            self.assertGreater(len(sent), 1)
+            print(f"Triggered a build for job 'f' without polling it on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to trigger a build for job 'f' without polling it (port {port}): {e}")
+
+    def _test_build_watcher(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            handles = [j.jobs.search("f").builds.build() for _ in range(2)]
+            deadline = time.monotonic() + 300
+            while any(handle.build is None for handle in handles):
+                self.assertLess(time.monotonic(), deadline, "Builds did not leave the queue")
+                time.sleep(1)
+            watcher = BuildWatcher(j, interval=1)
+            finished = []
+            for handle in handles:
+                watcher.add(handle.build, callback=finished.append)
+            self.assertEqual(watcher.pending, 2)
+            self.assertEqual(len(watcher.wait(timeout=300)), 2)
+            self.assertEqual(len(finished), 2)
+            self.assertEqual(watcher.pending, 0)
+            print(f"Watched builds of job 'f' on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to watch builds of job 'f' on port {port}: {e}")
+
     def _test_list_builds(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
@@ -504,6 +813,63 @@ class TestJenkins(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to list build for job 'f' on port {port}: {e}")
 
+    def _test_iter_builds_projected(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            builds = j.jobs.search("f").builds
+            for build in builds.iter():
+                print(build.number, build.result, build.done)
+            print(f"Successfully iterated builds for job 'f' on {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to iterate builds for job 'f' on port {port}: {e}")
+
+    def _test_builds_not_hydrated(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            for build in j.jobs.search("f").builds.iter():
+                self.assertFalse(build._hydrated)
+                print(build.number, build.result, build.done)
+                self.assertFalse(build._hydrated)
+            print(f"Successfully read listed builds for job 'f' without fetching them on {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to read listed builds for job 'f' on port {port}: {e}")
+
+    def _test_build_history(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            builds = j.jobs.search("f").builds
+            history = [build.number for build in builds.history(page_size=2)]
+            self.assertEqual(history, sorted(history, reverse=True))
+            if history:
+                self.assertEqual([build.number for build in builds.history(stop_number=history[0])], [])
+                self.assertEqual([build.number for build in builds.history(cursor=history[0])], history[1:])
+            print(f"Successfully paged build history for job 'f' on {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to page build history for job 'f' on port {port}: {e}")
+
+    def _test_search_builds(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            builds = j.jobs.search("f").builds
+            latest = builds.latest
+            self.assertEqual(builds.search(latest.number).url, latest.url)
+            self.assertEqual([b.number for b in builds.get_many([latest.number])], [latest.number])
+            with self.assertRaises(JenkinsNotFound):
+                builds.search(latest.number + 1000)
+            with self.assertRaises(JenkinsNotFound):
+                latest.next
+            print(f"Successfully searched builds for job 'f' on {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to search builds for job 'f' on port {port}: {e}")
+
     def _test_total_builds(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
@@ -779,6 +1145,38 @@ class TestJenkins(unittest.TestCase):
     # Folder
     ###################################################################################################################
 
+    def _test_jobs_api(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            data = j.api(Tree("numExecutors", Field("jobs", "name", "url")))
+            self.assertIn("numExecutors", data)
+            self.assertNotIn("views", data)
+            job = j.jobs.api(Tree("name", Field("builds", "number", "result")[0:2]), path="f")
+            self.assertEqual(job.name, "f")
+            self.assertLessEqual(len(job.builds), 2)
+            print(data, job)
+            print(f"Queried jobs on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to query jobs on port {port}: {e}")
+
+    def _test_jobs_trigger_many(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            results = j.jobs.trigger_many([("f", None), ("f", None), ("missing_job", None)], delay=60)
+            self.assertEqual(len(results), 3)
+            self.assertIsInstance(results.errors[1], JenkinsAlreadyExists)  # Queued twice
+            self.assertIn(2, results.errors)
+            print(results, results.throughput)
+            if results.handles[0] is not None:
+                results.handles[0].cancel()
+            print(f"Triggered many builds on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to trigger many builds on port {port}: {e}")
+
     def _test_folder_reconfig(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
@@ -1024,6 +1422,20 @@ class TestJenkins(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to search for node 'testing_node' on port {port}: {e}")
 
+    def _test_nodes_exists(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            exists = j.nodes.exists(["built-in", "(built-in)", "missing node"])
+            self.assertEqual(exists, {"built-in": True, "(built-in)": True, "missing node": False})
+            self.assertEqual(j.nodes.search("(built-in)").name, "built-in")
+            with self.assertRaises(JenkinsNotFound):
+                j.nodes.search("missing node")
+            print(f"Successfully checked nodes exist on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to check nodes exist on port {port}: {e}")
+
     def _test_nodes_create(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
@@ -1042,7 +1454,9 @@ class TestJenkins(unittest.TestCase):
     def _test_nodes_iter(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
-            print(j.nodes.iter())
+            for node in j.nodes.iter():
+                print(node.name, node.offline, node.idle, node.executors, node.labels)
+                self.assertFalse(node._hydrated)
             print(f"Successfully iterated nodes on port {port}: SUCCESS")
         except AssertionError as e:
             raise e
@@ -1503,6 +1917,22 @@ class TestJenkins(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to get queue item build on port {port}: {e}")
 
+    def _test_queuei_wait_for_build(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            j.jobs.search("f").builds.build()
+            item = j.queue.newest
+            build = item.wait_for_build(timeout=120)
+            self.assertTrue(build.url.startswith(item.job.url.rstrip("/")))
+            print(build.number)
+            print(f"Successfully waited for queue item build on port {port}: SUCCESS")
+        except JenkinsEmptyQueue:
+            print(f"Successfully waited for queue item build on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to wait for queue item build on port {port}: {e}")
+
     def _test_queuei_job(self, host, port):
         try:
             j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
@@ -1582,6 +2012,36 @@ class TestJenkins(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to get total queue items on port {port}: {e}")
 
+    def _test_queue_snapshot(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            snapshot = j.queue.snapshot()
+            self.assertEqual(snapshot.total, len(list(snapshot)))
+            for item in snapshot:
+                self.assertIs(snapshot[item.id], item)
+            self.assertEqual(sum(len(items) for items in snapshot.by_job.values()), snapshot.total)
+            print(snapshot, snapshot.blocked, snapshot.stuck)
+            print(f"Successfully took a queue snapshot on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to take a queue snapshot on port {port}: {e}")
+
+    def _test_queue_watch(self, host, port):
+        try:
+            j = Jenkins(host=host, port=port, username=self.username, passw=self.password, verify=False)
+            j.jobs.search("f").builds.build(delay=60)  # Stays queued while watching
+            events = j.queue.watch(interval=1)
+            event = next(events)
+            self.assertEqual(event.kind, QueueEvent.ADDED)
+            self.assertEqual(event.item.id, event.item_id)
+            events.close()
+            print(f"Successfully watched the queue on port {port}: SUCCESS")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            self.fail(f"Failed to watch the queue on port {port}: {e}")
+
     ###################################################################################################################
     # users.py
     ###################################################################################################################